@@ -0,0 +1 @@
+"""Offline benchmarks for rag-cli (see benchmarks/run.py)."""
@@ -0,0 +1,179 @@
+"""Deterministic synthetic corpus generator (txt, md, pdf, docx).
+
+The PDF and DOCX writers are minimal hand-rolled encoders, so generating a
+corpus needs no extra dependencies; both are readable by the loaders.
+"""
+
+import random
+import zipfile
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+FORMATS = ("txt", "md", "pdf", "docx")
+
+_SYLLABLES = (
+    "ka", "lo", "ri", "ven", "tor", "mi", "sa", "del", "pra", "nu",
+    "quo", "ber", "tis", "ga", "ham", "ex", "ul", "zen", "cor", "phi",
+)
+
+
+def _vocabulary(rng: random.Random, size: int = 2000) -> list[str]:
+    """Build a fixed list of pseudo-words."""
+    words: set[str] = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(1, 4))))
+    return sorted(words)
+
+
+def _paragraphs(rng: random.Random, vocabulary: list[str], target_chars: int) -> list[str]:
+    """Generate paragraphs of sentences totalling about target_chars characters."""
+    paragraphs: list[str] = []
+    total = 0
+    while total < target_chars:
+        sentences = []
+        for _ in range(rng.randint(3, 8)):
+            words = rng.choices(vocabulary, k=rng.randint(6, 20))
+            sentences.append(" ".join(words).capitalize() + ".")
+        paragraph = " ".join(sentences)
+        paragraphs.append(paragraph)
+        total += len(paragraph) + 2
+    return paragraphs
+
+
+def _write_txt(path: Path, title: str, paragraphs: list[str]) -> None:
+    path.write_text(title + "\n\n" + "\n\n".join(paragraphs) + "\n", encoding="utf-8")
+
+
+def _write_md(path: Path, title: str, paragraphs: list[str]) -> None:
+    parts = [f"# {title}"]
+    for i, paragraph in enumerate(paragraphs):
+        if i % 4 == 0:
+            parts.append(f"## Section {i // 4 + 1}")
+        parts.append(paragraph)
+    path.write_text("\n\n".join(parts) + "\n", encoding="utf-8")
+
+
+def _pdf_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def _wrap(text: str, width: int = 90) -> list[str]:
+    """Greedy word wrap."""
+    lines: list[str] = []
+    current = ""
+    for word in text.split():
+        if current and len(current) + 1 + len(word) > width:
+            lines.append(current)
+            current = word
+        else:
+            current = f"{current} {word}" if current else word
+    if current:
+        lines.append(current)
+    return lines
+
+
+def _write_pdf(path: Path, title: str, paragraphs: list[str], lines_per_page: int = 60) -> None:
+    """Write a text-only PDF with one Helvetica text object per page."""
+    lines = [title, ""]
+    for paragraph in paragraphs:
+        lines.extend(_wrap(paragraph))
+        lines.append("")
+    pages = [lines[i : i + lines_per_page] for i in range(0, len(lines), lines_per_page)]
+
+    # Object numbers: 1 catalog, 2 pages, 3 font, then (page, content) pairs.
+    objects: list[bytes] = []
+    kids = " ".join(f"{4 + 2 * i} 0 R" for i in range(len(pages)))
+    objects.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+    objects.append(f"<< /Type /Pages /Kids [{kids}] /Count {len(pages)} >>".encode())
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    for i, page_lines in enumerate(pages):
+        body = "BT /F1 10 Tf 12 TL 50 790 Td " + " ".join(f"({_pdf_escape(line)}) Tj T*" for line in page_lines) + " ET"
+        stream = body.encode("latin-1", errors="replace")
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {5 + 2 * i} 0 R >>".encode()
+        )
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n".encode() + stream + b"\nendstream")
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, obj in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n".encode() + obj + b"\nendobj\n"
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += b"".join(f"{offset:010d} 00000 n \n".encode() for offset in offsets)
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    path.write_bytes(bytes(out))
+
+
+_DOCX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    "</Types>"
+)
+_DOCX_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/>'
+    "</Relationships>"
+)
+
+
+def _write_docx(path: Path, title: str, paragraphs: list[str]) -> None:
+    """Write a minimal WordprocessingML document."""
+    body = "".join(
+        f'<w:p><w:r><w:t xml:space="preserve">{escape(text)}</w:t></w:r></w:p>' for text in [title, *paragraphs]
+    )
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f"<w:body>{body}</w:body></w:document>"
+    )
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("[Content_Types].xml", _DOCX_CONTENT_TYPES)
+        zf.writestr("_rels/.rels", _DOCX_RELS)
+        zf.writestr("word/document.xml", document)
+
+
+_WRITERS = {"txt": _write_txt, "md": _write_md, "pdf": _write_pdf, "docx": _write_docx}
+
+
+def generate_corpus(
+    root: Path,
+    *,
+    num_files: int = 100,
+    file_kb: float = 8.0,
+    formats: tuple[str, ...] = FORMATS,
+    seed: int = 0,
+) -> list[Path]:
+    """Write a reproducible corpus and return the file paths.
+
+    Args:
+        root: Directory to create files in (nested in a few subdirectories).
+        num_files: Number of files, assigned to formats round-robin.
+        file_kb: Approximate text size of each file in KB.
+        formats: File formats to generate.
+        seed: Seed for the text generator; equal seeds give identical text.
+    """
+    unknown = set(formats) - set(FORMATS)
+    if unknown:
+        raise ValueError(f"Unknown corpus format(s): {', '.join(sorted(unknown))}")
+    rng = random.Random(seed)
+    vocabulary = _vocabulary(rng)
+    paths: list[Path] = []
+    for i in range(num_files):
+        fmt = formats[i % len(formats)]
+        directory = root / f"part{i % 5}"
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"doc{i:05d}.{fmt}"
+        title = " ".join(rng.choices(vocabulary, k=4)).title()
+        _WRITERS[fmt](path, title, _paragraphs(rng, vocabulary, int(file_kb * 1024)))
+        paths.append(path)
+    return paths
@@ -0,0 +1,57 @@
+"""Deterministic offline stand-ins for the embedding and LLM providers."""
+
+import re
+import time
+import zlib
+
+import numpy as np
+from llm_core.providers.base import BaseLLMProvider, LLMResponse
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+class FakeEmbeddingProvider:
+    """Feature-hashing embeddings with a configurable simulated API latency.
+
+    Texts sharing words get similar vectors, so retrieval over a fake index
+    behaves like (a crude) semantic search. Output is identical across runs.
+    """
+
+    def __init__(self, dim: int = 384, latency: float = 0.0, per_text_latency: float = 0.0) -> None:
+        self._dim = dim
+        self._latency = latency
+        self._per_text_latency = per_text_latency
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        """Embed texts as L2-normalized float32 (n, dim) rows."""
+        if self._latency or self._per_text_latency:
+            time.sleep(self._latency + self._per_text_latency * len(texts))
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+        out = np.zeros((len(texts), self._dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for token in _TOKEN_RE.findall(text.lower()):
+                h = zlib.crc32(token.encode())
+                out[row, h % self._dim] += 1.0 if h & 0x80000000 else -1.0
+        norms = np.linalg.norm(out, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return out / norms
+
+
+class FakeLLMProvider(BaseLLMProvider):
+    """LLM that answers instantly (or after a fixed latency) from the prompt itself."""
+
+    def __init__(self, latency: float = 0.0, output_tokens: int = 64) -> None:
+        self._latency = latency
+        self._output_tokens = output_tokens
+
+    def generate(self, prompt: str, *, system: str = "") -> LLMResponse:
+        """Return a canned answer citing the first source in the prompt."""
+        if self._latency:
+            time.sleep(self._latency)
+        return LLMResponse(
+            text="According to [Source 1], " + " ".join(["lorem"] * self._output_tokens),
+            model="fake",
+            input_tokens=(len(system) + len(prompt)) // 4,
+            output_tokens=self._output_tokens,
+        )
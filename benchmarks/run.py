@@ -0,0 +1,304 @@
+"""Offline benchmark suite for the indexing and query hot paths.
+
+Generates a synthetic corpus, runs every stage against deterministic fake
+providers and writes throughput, latency and peak memory to JSON.
+
+Usage:
+    uv run python -m benchmarks.run --files 200 --output results.json
+    uv run python -m benchmarks.run --baseline results.json   # exit 1 on regressions
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+
+from benchmarks.corpus import FORMATS, generate_corpus
+from benchmarks.fakes import FakeEmbeddingProvider, FakeLLMProvider
+
+
+@dataclass
+class StageResult:
+    """Timing and memory of one benchmark stage."""
+
+    name: str
+    seconds: float
+    items: int
+    unit: str
+    bytes: int = 0
+    peak_mb: float | None = None
+    extra: dict = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["items_per_second"] = self.items / self.seconds if self.seconds > 0 else None
+        data["mb_per_second"] = self.bytes / 2**20 / self.seconds if self.bytes and self.seconds > 0 else None
+        return data
+
+
+def _measure(
+    name: str,
+    run: Callable,
+    *,
+    items: int,
+    unit: str,
+    nbytes: int = 0,
+    setup: Callable | None = None,
+    repeat: int = 1,
+    memory: bool = True,
+) -> StageResult:
+    """Time run(setup()) best-of-repeat, then trace one extra run for peak memory.
+
+    setup() is untimed and called before every run, so stages that need a
+    fresh store get one each time.
+    """
+    times = []
+    for _ in range(repeat):
+        state = setup() if setup else None
+        start = time.perf_counter()
+        extra = run(state) if setup else run()
+        times.append(time.perf_counter() - start)
+
+    peak_mb = None
+    if memory:
+        state = setup() if setup else None
+        tracemalloc.start()
+        run(state) if setup else run()
+        peak_mb = tracemalloc.get_traced_memory()[1] / 2**20
+        tracemalloc.stop()
+
+    result = StageResult(name, min(times), items, unit, nbytes, peak_mb, extra if isinstance(extra, dict) else {})
+    rate = f"{result.items / result.seconds:,.0f} {unit}/s" if result.seconds > 0 else "-"
+    memory_note = f", peak {peak_mb:.1f} MB" if peak_mb is not None else ""
+    print(f"  {name:<24} {result.seconds:8.3f}s  {rate}{memory_note}", file=sys.stderr)
+    return result
+
+
+def _latency_stats(samples: list[float]) -> dict:
+    from rag_core.evaluation import percentile
+
+    ms = [s * 1000 for s in samples]
+    return {"p50_ms": percentile(ms, 50), "p95_ms": percentile(ms, 95), "p99_ms": percentile(ms, 99)}
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(args: argparse.Namespace, workdir: Path) -> dict:
+    """Run all stages and return the JSON-serializable report."""
+    import chromadb
+    from rag_core.chunking import RecursiveChunker
+    from rag_core.embeddings.openai import OpenAIEmbedder
+    from rag_core.loaders import load_documents
+    from rag_core.vectorstores import ChromaStore, QuantizedStore
+
+    corpus_dir = workdir / "corpus"
+    print(f"Generating {args.files} files of ~{args.file_kb} KB...", file=sys.stderr)
+    paths = generate_corpus(
+        corpus_dir, num_files=args.files, file_kb=args.file_kb, formats=tuple(args.formats), seed=args.seed
+    )
+    corpus_bytes = sum(p.stat().st_size for p in paths)
+
+    provider = FakeEmbeddingProvider(
+        dim=args.dim, latency=args.embed_latency_ms / 1000, per_text_latency=args.embed_per_text_ms / 1000
+    )
+    embedder = OpenAIEmbedder(provider=provider)
+    chunker = RecursiveChunker(chunk_size=args.chunk_size, chunk_overlap=args.chunk_overlap)
+    results: list[StageResult] = []
+
+    def measure(*a, **kw) -> None:
+        results.append(_measure(*a, memory=not args.no_memory, **kw))
+
+    print("Running stages:", file=sys.stderr)
+    documents = load_documents(corpus_dir)
+    measure("load", lambda: load_documents(corpus_dir), items=len(paths), unit="files", nbytes=corpus_bytes,
+            repeat=args.repeat)
+
+    def chunk_all() -> list[str]:
+        return [c for doc in documents for c in chunker.chunk(doc.content)]
+
+    chunks = chunk_all()
+    text_bytes = sum(len(doc.content.encode()) for doc in documents)
+    measure("chunk", chunk_all, items=len(chunks), unit="chunks", nbytes=text_bytes, repeat=args.repeat)
+
+    def embed_all() -> np.ndarray:
+        return np.concatenate([embedder.embed(chunks[i : i + 100]) for i in range(0, len(chunks), 100)])
+
+    embeddings = embed_all()
+    measure("embed", embed_all, items=len(chunks), unit="chunks", repeat=args.repeat)
+
+    ids = [f"chunk-{i}" for i in range(len(chunks))]
+    metadatas = [{"source": f"doc{i // 10}", "chunk_index": i % 10} for i in range(len(chunks))]
+    counter = iter(range(10**9))
+
+    def chroma_store() -> ChromaStore:
+        return ChromaStore(workdir / "stores" / f"chroma{next(counter)}", collection="bench")
+
+    def quantized_store() -> QuantizedStore:
+        return QuantizedStore(workdir / "stores" / f"int8-{next(counter)}", collection="bench", quantization="int8")
+
+    def add_all(store) -> None:
+        for i in range(0, len(ids), 1000):
+            store.add(ids[i : i + 1000], embeddings[i : i + 1000], chunks[i : i + 1000], metadatas[i : i + 1000])
+
+    rng = np.random.default_rng(args.seed)
+    query_texts = [chunks[i] for i in rng.choice(len(chunks), size=min(args.queries, len(chunks)), replace=False)]
+    query_vectors = embedder.embed(query_texts)
+
+    for backend, make_store in (("chroma", chroma_store), ("int8", quantized_store)):
+        measure(f"store.add[{backend}]", add_all, setup=make_store, items=len(ids), unit="rows", repeat=args.repeat)
+        store = make_store()
+        add_all(store)
+
+        def query_all(store=store) -> dict:
+            samples = []
+            for vector in query_vectors:
+                start = time.perf_counter()
+                store.query(vector, top_k=args.top_k)
+                samples.append(time.perf_counter() - start)
+            return _latency_stats(samples)
+
+        measure(f"store.query[{backend}]", query_all, items=len(query_vectors), unit="queries", repeat=args.repeat)
+
+    results.extend(_end_to_end(args, workdir, corpus_dir, provider, len(paths), corpus_bytes, query_texts))
+
+    return {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "numpy": np.__version__,
+            "chromadb": chromadb.__version__,
+            "config": vars(args),
+            "corpus": {"files": len(paths), "bytes": corpus_bytes, "documents": len(documents), "chunks": len(chunks)},
+        },
+        "results": {r.name: r.to_dict() for r in results},
+    }
+
+
+def _end_to_end(args, workdir: Path, corpus_dir: Path, provider, num_files: int, corpus_bytes: int,
+                query_texts: list[str]) -> list[StageResult]:
+    """Run the real `index` and `ask` commands with fake providers patched in."""
+    from rag_cli import cli
+    from rag_core.embeddings.openai import OpenAIEmbedder
+    from typer.testing import CliRunner
+
+    runner = CliRunner()
+    llm = FakeLLMProvider(latency=args.llm_latency_ms / 1000)
+    questions = [" ".join(text.split()[:12]) for text in query_texts[: args.questions]]
+    counter = iter(range(10**9))
+    results = []
+
+    def invoke(argv: list[str]) -> None:
+        result = runner.invoke(cli.app, argv)
+        if result.exit_code != 0:
+            raise RuntimeError(f"rag-cli {' '.join(argv)} failed:\n{result.output}")
+
+    def fresh_dir() -> Path:
+        path = workdir / "e2e" / str(next(counter))
+        path.mkdir(parents=True)
+        return path
+
+    def index_in(path: Path) -> None:
+        os.chdir(path)
+        invoke(["index", str(corpus_dir)])
+
+    def ask_all(path: Path) -> dict:
+        os.chdir(path)
+        samples = []
+        for question in questions:
+            start = time.perf_counter()
+            invoke(["ask", question])
+            samples.append(time.perf_counter() - start)
+        return _latency_stats(samples)
+
+    def indexed_dir() -> Path:
+        path = fresh_dir()
+        index_in(path)
+        return path
+
+    cwd = os.getcwd()
+    with (
+        patch.object(cli, "_create_embedder", lambda settings: OpenAIEmbedder(provider=provider)),
+        patch.object(cli, "_create_llm_provider", lambda settings: llm),
+    ):
+        try:
+            results.append(_measure("e2e.index", index_in, setup=fresh_dir, items=num_files, unit="files",
+                                    nbytes=corpus_bytes, memory=not args.no_memory))
+            results.append(_measure("e2e.ask", ask_all, setup=indexed_dir, items=len(questions), unit="questions",
+                                    memory=not args.no_memory))
+        finally:
+            os.chdir(cwd)
+    return results
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Return a line per stage that got slower than baseline by more than tolerance."""
+    regressions = []
+    for name, result in report["results"].items():
+        old = baseline.get("results", {}).get(name)
+        if not old or not old["seconds"]:
+            continue
+        ratio = result["seconds"] / old["seconds"]
+        if ratio > 1 + tolerance:
+            regressions.append(f"{name}: {old['seconds']:.3f}s -> {result['seconds']:.3f}s ({ratio:.2f}x)")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=100, help="Number of corpus files.")
+    parser.add_argument("--file-kb", type=float, default=8.0, help="Approximate text size per file (KB).")
+    parser.add_argument("--formats", nargs="+", default=list(FORMATS), choices=FORMATS)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--chunk-overlap", type=int, default=200)
+    parser.add_argument("--dim", type=int, default=384, help="Fake embedding dimension.")
+    parser.add_argument("--embed-latency-ms", type=float, default=0.0, help="Simulated latency per embed call.")
+    parser.add_argument("--embed-per-text-ms", type=float, default=0.0, help="Simulated latency per embedded text.")
+    parser.add_argument("--llm-latency-ms", type=float, default=0.0, help="Simulated latency per generation.")
+    parser.add_argument("--queries", type=int, default=200, help="Store queries per backend.")
+    parser.add_argument("--questions", type=int, default=10, help="End-to-end ask invocations.")
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=3, help="Timed repetitions per stage (best is kept).")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc pass.")
+    parser.add_argument("--output", type=Path, default=Path("benchmark-results.json"))
+    parser.add_argument("--baseline", type=Path, help="Earlier results to compare against.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown vs. baseline (0.25 = 25%%).")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="rag-bench-") as tmp:
+        report = run_benchmarks(args, Path(tmp))
+
+    args.output.write_text(json.dumps(report, indent=2, default=str), encoding="utf-8")
+    print(f"Results written to {args.output}", file=sys.stderr)
+
+    if args.baseline:
+        regressions = compare(report, json.loads(args.baseline.read_text(encoding="utf-8")), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,18 +1,25 @@
 """llm_core — Reusable LLM abstraction layer."""
 
 from llm_core.config import LLMSettings, parse_model_string
+from llm_core.factory import create_embedding_provider, create_llm_provider
 from llm_core.providers import (
+    AllProvidersFailedError,
     AnthropicProvider,
+    FallbackProvider,
     OllamaEmbeddingProvider,
     OllamaProvider,
     OpenAIEmbeddingProvider,
 )
 
 __all__ = [
+    "AllProvidersFailedError",
     "AnthropicProvider",
+    "FallbackProvider",
     "LLMSettings",
     "OllamaEmbeddingProvider",
     "OllamaProvider",
     "OpenAIEmbeddingProvider",
+    "create_embedding_provider",
+    "create_llm_provider",
     "parse_model_string",
 ]
@@ -0,0 +1,86 @@
+"""Shared SDK clients with pooled keep-alive HTTP connections.
+
+Clients are cached per (provider, host, API key, timeout), so every provider
+object built for the same endpoint reuses one connection pool instead of
+paying connection setup and TLS handshakes again.
+"""
+
+import hashlib
+import threading
+
+import httpx
+
+# Requests are retried by llm_core.retry, so the SDKs' own retries are disabled.
+_SDK_MAX_RETRIES = 0
+_CONNECT_TIMEOUT = 10.0
+_POOL_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16, keepalive_expiry=60.0)
+
+_lock = threading.Lock()
+_clients: dict[tuple, object] = {}
+
+
+def _timeout(seconds: float) -> httpx.Timeout:
+    return httpx.Timeout(seconds, connect=min(_CONNECT_TIMEOUT, seconds))
+
+
+def _key(provider: str, host: str | None, api_key: str, timeout: float) -> tuple:
+    """Cache key; the API key is hashed so it is not kept in plain text twice."""
+    return (provider, host, hashlib.sha256(api_key.encode()).hexdigest(), timeout)
+
+
+def _cached(key: tuple, factory):
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = factory()
+        return client
+
+
+def get_anthropic_client(api_key: str, timeout: float = 300.0):
+    """Return the shared Anthropic client for an API key."""
+    import anthropic
+
+    return _cached(
+        _key("anthropic", None, api_key, timeout),
+        lambda: anthropic.Anthropic(
+            api_key=api_key,
+            max_retries=_SDK_MAX_RETRIES,
+            http_client=anthropic.DefaultHttpxClient(limits=_POOL_LIMITS, timeout=_timeout(timeout)),
+        ),
+    )
+
+
+def get_openai_client(api_key: str, base_url: str | None = None, timeout: float = 300.0):
+    """Return the shared OpenAI client for an API key (and optional base URL)."""
+    import openai
+
+    return _cached(
+        _key("openai", base_url, api_key, timeout),
+        lambda: openai.OpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            max_retries=_SDK_MAX_RETRIES,
+            http_client=openai.DefaultHttpxClient(limits=_POOL_LIMITS, timeout=_timeout(timeout)),
+        ),
+    )
+
+
+def get_ollama_client(host: str, timeout: float = 300.0):
+    """Return the shared Ollama client for a server."""
+    import ollama
+
+    return _cached(
+        _key("ollama", host, "", timeout),
+        lambda: ollama.Client(host=host, timeout=_timeout(timeout), limits=_POOL_LIMITS),
+    )
+
+
+def close_clients() -> None:
+    """Close all cached clients and their connection pools."""
+    with _lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        close = getattr(client, "close", None) or getattr(getattr(client, "_client", None), "close", None)
+        if close is not None:
+            close()
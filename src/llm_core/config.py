@@ -44,14 +44,59 @@ class LLMSettings(BaseSettings):
 
     # Ollama settings
     ollama_host: str = "http://localhost:11434"
+    # How long models stay loaded after a request: seconds or a duration
+    # such as "30m"; "" keeps the server default (5m). Pinning keeps the
+    # generation and embedding models loaded until the server stops, so
+    # alternating between them does not reload either. Warm-up starts
+    # loading the models in the background when a command starts.
+    ollama_keep_alive: str = ""
+    ollama_pin_models: bool = False
+    ollama_warm_up: bool = True
+
+    # HTTP read timeout for provider requests, in seconds
+    request_timeout: float = 300.0
 
     # Model settings
     model: str = "claude-3-5-sonnet-latest"
     embedding_model: str = "text-embedding-3-small"
 
+    # In-process embeddings ("local:" models): worker threads (0 = auto)
+    # and inference backend (torch | onnx | openvino)
+    local_embedding_threads: int = 0
+    local_embedding_backend: str = "torch"
+
+    # Generation fallbacks tried in order when the model fails, as JSON,
+    # e.g. RAG_CLI_FALLBACK_MODELS='["ollama:llama3.2"]'. With a positive
+    # hedge delay the next model is also started once a request has been
+    # pending that long, and the first answer wins.
+    fallback_models: list[str] = []
+    hedge_after_seconds: float = 0.0
+
+    # Index settings
+    collection: str = "rag_cli_docs"
+    index_profile: str = "balanced"  # fast | balanced | high-recall
+    index_space: str = "l2"  # l2 | cosine | ip
+    vector_quantization: str = "none"  # none | int8 | float16
+    quantization_rescore: int = 4  # candidates rescored per result
+    vector_shards: int = 1  # stores per collection, queried in parallel
+
+    # Scanning settings (0 disables the size limit)
+    max_file_size_mb: float = 0.0
+
     # Chunking settings
     chunk_size: int = 1000
     chunk_overlap: int = 200
 
     # Retrieval settings
     top_k: int = 3
+    ask_concurrency: int = 4  # answers generated in parallel by ask --batch
+
+    # Semantic answer cache: reuse the answer to an earlier question whose
+    # embedding has at least this cosine similarity
+    semantic_cache: bool = False
+    semantic_cache_threshold: float = 0.95
+
+    # Client-side rate limits per service ("anthropic", "openai", "ollama"),
+    # as JSON, e.g. RAG_CLI_RATE_LIMIT_RPM='{"anthropic": 50}'
+    rate_limit_rpm: dict[str, int] = {}
+    rate_limit_tpm: dict[str, int] = {}
@@ -0,0 +1,131 @@
+"""Build providers from settings, backed by the shared client registry."""
+
+import threading
+
+from llm_core.clients import get_anthropic_client, get_ollama_client, get_openai_client
+from llm_core.config import LLMSettings, parse_model_string
+from llm_core.providers.base import BaseLLMProvider
+from llm_core.tracing import start_in_context
+
+
+def create_llm_provider(settings: LLMSettings, model_string: str | None = None) -> BaseLLMProvider:
+    """Create the generation provider for a model string (default: settings.model).
+
+    When settings.fallback_models is set, returns a FallbackProvider trying
+    the model first and then each fallback in order.
+
+    Raises:
+        ValueError: If a provider needs an API key that is not configured.
+    """
+    provider = _create_single_llm_provider(settings, model_string or settings.model)
+    if not settings.fallback_models:
+        return provider
+
+    from llm_core.providers.fallback import FallbackProvider
+
+    fallbacks = [_create_single_llm_provider(settings, m) for m in settings.fallback_models]
+    return FallbackProvider([provider, *fallbacks], hedge_after=settings.hedge_after_seconds or None)
+
+
+def ollama_keep_alive(settings: LLMSettings) -> float | str | None:
+    """Keep-alive to send with Ollama requests: -1 when pinned, seconds, a duration string, or None."""
+    if settings.ollama_pin_models:
+        return -1
+    value = settings.ollama_keep_alive.strip()
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+def warm_up_models(
+    settings: LLMSettings, *, model: str | None = None, embedding_model: str | None = None
+) -> list[threading.Thread]:
+    """Start loading the given Ollama models on background threads.
+
+    The first request then waits only for the rest of the load, which
+    overlaps with whatever the caller does meanwhile (scanning, retrieval).
+    Other providers need no warm-up and are ignored, as is warm-up when
+    settings.ollama_warm_up is off. Failures are left to the real request
+    to report.
+    """
+    if not settings.ollama_warm_up:
+        return []
+    providers = []
+    if model and parse_model_string(model)[0] == "ollama":
+        providers.append(_create_single_llm_provider(settings, model))
+    if embedding_model and parse_model_string(embedding_model)[0] == "ollama":
+        providers.append(create_embedding_provider(settings, embedding_model))
+
+    def warm_up(provider) -> None:
+        try:
+            provider.warm_up()
+        except Exception:
+            pass
+
+    return [start_in_context(warm_up, provider, name="ollama-warm-up") for provider in providers]
+
+
+def _create_single_llm_provider(settings: LLMSettings, model_string: str) -> BaseLLMProvider:
+    provider_name, model = parse_model_string(model_string)
+
+    if provider_name == "ollama":
+        from llm_core.providers.ollama import OllamaProvider
+
+        return OllamaProvider(
+            model=model,
+            host=settings.ollama_host,
+            client=get_ollama_client(settings.ollama_host, timeout=settings.request_timeout),
+            keep_alive=ollama_keep_alive(settings),
+        )
+
+    # Default: Anthropic
+    if not settings.anthropic_api_key:
+        raise ValueError(
+            "ANTHROPIC_API_KEY not set. Required for answer generation "
+            "(or use 'ollama:' prefix, e.g. RAG_CLI_MODEL=ollama:llama3.2)."
+        )
+
+    from llm_core.providers.anthropic import AnthropicProvider
+
+    return AnthropicProvider(
+        api_key=settings.anthropic_api_key,
+        model=model,
+        client=get_anthropic_client(settings.anthropic_api_key, timeout=settings.request_timeout),
+    )
+
+
+def create_embedding_provider(settings: LLMSettings, model_string: str | None = None):
+    """Create the embedding provider for a model string (default: settings.embedding_model).
+
+    Raises:
+        ValueError: If the provider needs an API key that is not configured.
+    """
+    provider_name, model = parse_model_string(model_string or settings.embedding_model)
+
+    if provider_name == "ollama":
+        from llm_core.providers.ollama import OllamaEmbeddingProvider
+
+        return OllamaEmbeddingProvider(
+            model=model,
+            host=settings.ollama_host,
+            client=get_ollama_client(settings.ollama_host, timeout=settings.request_timeout),
+            keep_alive=ollama_keep_alive(settings),
+        )
+
+    # Default: OpenAI
+    if not settings.openai_api_key:
+        raise ValueError(
+            "OPENAI_API_KEY not set. Required for embeddings "
+            "(or use 'ollama:' prefix, e.g. RAG_CLI_EMBEDDING_MODEL=ollama:nomic-embed-text)."
+        )
+
+    from llm_core.providers.openai import OpenAIEmbeddingProvider
+
+    return OpenAIEmbeddingProvider(
+        api_key=settings.openai_api_key,
+        model=model,
+        client=get_openai_client(settings.openai_api_key, timeout=settings.request_timeout),
+    )
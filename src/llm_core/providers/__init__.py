@@ -1,15 +1,20 @@
 """LLM provider adapters."""
 
 from llm_core.providers.anthropic import AnthropicProvider
-from llm_core.providers.base import BaseLLMProvider, LLMResponse
+from llm_core.providers.base import BaseLLMProvider, ContentBlock, LLMResponse, prompt_text
+from llm_core.providers.fallback import AllProvidersFailedError, FallbackProvider
 from llm_core.providers.ollama import OllamaEmbeddingProvider, OllamaProvider
 from llm_core.providers.openai import OpenAIEmbeddingProvider
 
 __all__ = [
+    "AllProvidersFailedError",
     "AnthropicProvider",
     "BaseLLMProvider",
+    "ContentBlock",
+    "FallbackProvider",
     "LLMResponse",
     "OllamaEmbeddingProvider",
     "OllamaProvider",
     "OpenAIEmbeddingProvider",
+    "prompt_text",
 ]
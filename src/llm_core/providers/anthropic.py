@@ -1,31 +1,105 @@
 """Anthropic LLM provider adapter."""
 
+import time
+
 from anthropic import Anthropic
 
-from llm_core.providers.base import BaseLLMProvider, LLMResponse
+from llm_core.providers.base import BaseLLMProvider, LLMResponse, Prompt, prompt_text
+from llm_core.ratelimit import estimate_tokens
 from llm_core.retry import with_retry
+from llm_core.tracing import span
+from llm_core.usage import UsageRecord, get_meter, token_count
+
+# The API accepts at most this many cache_control markers per request.
+MAX_CACHE_BREAKPOINTS = 4
+
+
+def _request_tokens(_self, prompt: Prompt, *, system: Prompt = "") -> int:
+    """Estimate the tokens of a request for rate limiting."""
+    return estimate_tokens(prompt_text(prompt), prompt_text(system))
+
+
+def _content(prompt: Prompt) -> str | list[dict]:
+    """Convert a prompt to API content, marking cached blocks with cache_control.
+
+    Plain strings are sent unchanged.
+    """
+    if isinstance(prompt, str):
+        return prompt
+    content = []
+    for block in prompt:
+        item = {"type": "text", "text": block.text}
+        if block.cache:
+            item["cache_control"] = {"type": "ephemeral"}
+        content.append(item)
+    return content
 
 
 class AnthropicProvider(BaseLLMProvider):
-    """LLM provider using the Anthropic API (Claude models)."""
+    """LLM provider using the Anthropic API (Claude models).
 
-    def __init__(self, api_key: str, model: str = "claude-3-5-sonnet-latest", max_tokens: int = 4096) -> None:
-        self._client = Anthropic(api_key=api_key)
+    Content blocks marked ``cache`` become prompt-cache breakpoints: the
+    prefix up to each one (system prompt first, then the user prompt) is
+    cached for a few minutes, and later requests starting with the same
+    prefix read it at a fraction of the input price and latency. Prefixes
+    shorter than the model's minimum (about 1024 tokens) are not cached.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "claude-3-5-sonnet-latest",
+        max_tokens: int = 4096,
+        client: Anthropic | None = None,
+    ) -> None:
+        self._client = client if client is not None else Anthropic(api_key=api_key)
         self._model = model
         self._max_tokens = max_tokens
 
-    @with_retry(max_attempts=3)
-    def generate(self, prompt: str, *, system: str = "") -> LLMResponse:
+    @with_retry(max_attempts=3, service="anthropic", estimate_tokens=_request_tokens)
+    def generate(self, prompt: Prompt, *, system: Prompt = "") -> LLMResponse:
         """Generate a response using the Anthropic API."""
-        message = self._client.messages.create(
-            model=self._model,
-            max_tokens=self._max_tokens,
-            system=system,
-            messages=[{"role": "user", "content": prompt}],
+        breakpoints = sum(
+            block.cache for part in (system, prompt) if not isinstance(part, str) for block in part
+        )
+        if breakpoints > MAX_CACHE_BREAKPOINTS:
+            raise ValueError(
+                f"At most {MAX_CACHE_BREAKPOINTS} content blocks can be cached per request, got {breakpoints}"
+            )
+        with span("generate", provider="anthropic", model=self._model) as s:
+            start = time.perf_counter()
+            message = self._client.messages.create(
+                model=self._model,
+                max_tokens=self._max_tokens,
+                system=_content(system),
+                messages=[{"role": "user", "content": _content(prompt)}],
+            )
+            usage = message.usage
+            cache_read = token_count(getattr(usage, "cache_read_input_tokens", 0))
+            cache_write = token_count(getattr(usage, "cache_creation_input_tokens", 0))
+            s.set(
+                input_tokens=usage.input_tokens,
+                output_tokens=usage.output_tokens,
+                cache_read_tokens=cache_read,
+                cache_write_tokens=cache_write,
+            )
+        get_meter().record(
+            UsageRecord(
+                kind="generate",
+                provider="anthropic",
+                model=self._model,
+                input_tokens=token_count(usage.input_tokens),
+                output_tokens=token_count(usage.output_tokens),
+                cache_read_tokens=cache_read,
+                cache_write_tokens=cache_write,
+                seconds=time.perf_counter() - start,
+            )
         )
         return LLMResponse(
             text=message.content[0].text,
             model=message.model,
-            input_tokens=message.usage.input_tokens,
-            output_tokens=message.usage.output_tokens,
+            input_tokens=usage.input_tokens,
+            output_tokens=usage.output_tokens,
+            cache_read_tokens=cache_read,
+            cache_write_tokens=cache_write,
         )
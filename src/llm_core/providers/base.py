@@ -1,29 +1,61 @@
 """Abstract base class for LLM providers."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from dataclasses import dataclass
 
 
+@dataclass(frozen=True)
+class ContentBlock:
+    """A piece of a prompt; ``cache`` marks the end of a prefix worth caching.
+
+    Providers with prompt caching (Anthropic) cache everything up to and
+    including a marked block, so put stable text (instructions, shared
+    context) first and the varying part (the question) last. Other providers
+    join the blocks into plain text.
+    """
+
+    text: str
+    cache: bool = False
+
+
+Prompt = str | Sequence[ContentBlock]
+
+
+def prompt_text(prompt: Prompt) -> str:
+    """Plain text of a prompt, joining content blocks with blank lines."""
+    if isinstance(prompt, str):
+        return prompt
+    return "\n\n".join(block.text for block in prompt)
+
+
 @dataclass(frozen=True)
 class LLMResponse:
-    """Response from an LLM provider."""
+    """Response from an LLM provider.
+
+    ``input_tokens`` excludes cached prompt tokens, which are counted in
+    ``cache_read_tokens`` (served from the cache) and ``cache_write_tokens``
+    (written to it by this call).
+    """
 
     text: str
     model: str
     input_tokens: int
     output_tokens: int
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
 
 
 class BaseLLMProvider(ABC):
     """Abstract interface for LLM providers."""
 
     @abstractmethod
-    def generate(self, prompt: str, *, system: str = "") -> LLMResponse:
+    def generate(self, prompt: Prompt, *, system: Prompt = "") -> LLMResponse:
         """Generate a response from the LLM.
 
         Args:
-            prompt: The user prompt.
-            system: Optional system prompt.
+            prompt: The user prompt, as text or content blocks.
+            system: Optional system prompt, as text or content blocks.
 
         Returns:
             LLMResponse with the generated text and metadata.
@@ -0,0 +1,99 @@
+"""Ordered fallback across LLM providers, with optional hedged requests."""
+
+import queue
+from collections.abc import Sequence
+
+from llm_core.providers.base import BaseLLMProvider, LLMResponse, Prompt
+from llm_core.ratelimit import CircuitOpenError
+from llm_core.retry import is_retryable
+from llm_core.tracing import start_in_context
+
+
+class AllProvidersFailedError(RuntimeError):
+    """Raised when every provider in a fallback chain failed."""
+
+    def __init__(self, errors: list[Exception]) -> None:
+        self.errors = errors
+        details = "; ".join(f"{type(e).__name__}: {e}" for e in errors)
+        super().__init__(f"All {len(errors)} provider(s) failed: {details}")
+
+
+def should_fall_back(exc: BaseException) -> bool:
+    """True for failures another provider may not share: transient errors and open circuits."""
+    return isinstance(exc, CircuitOpenError) or is_retryable(exc)
+
+
+class FallbackProvider(BaseLLMProvider):
+    """Tries providers in order until one answers.
+
+    Without ``hedge_after`` the next provider is only called once the
+    previous one has failed with a transient error (after its own retries);
+    other errors, such as bad requests, are raised straight away. With ``hedge_after``
+    the next provider is also started whenever the running ones have been
+    silent for that many seconds, and the first successful answer wins;
+    this bounds tail latency at the cost of occasional duplicate requests.
+    """
+
+    def __init__(self, providers: Sequence[BaseLLMProvider], hedge_after: float | None = None) -> None:
+        if not providers:
+            raise ValueError("FallbackProvider needs at least one provider")
+        if hedge_after is not None and hedge_after <= 0:
+            raise ValueError(f"hedge_after must be positive, got {hedge_after}")
+        self._providers = list(providers)
+        self._hedge_after = hedge_after
+
+    def generate(self, prompt: Prompt, *, system: Prompt = "") -> LLMResponse:
+        """Generate with the first provider that succeeds."""
+        if self._hedge_after is None or len(self._providers) == 1:
+            return self._generate_in_order(prompt, system)
+        return self._generate_hedged(prompt, system)
+
+    def _generate_in_order(self, prompt: Prompt, system: Prompt) -> LLMResponse:
+        errors: list[Exception] = []
+        for provider in self._providers:
+            try:
+                return provider.generate(prompt, system=system)
+            except Exception as e:
+                if not should_fall_back(e):
+                    raise
+                errors.append(e)
+        raise AllProvidersFailedError(errors)
+
+    def _generate_hedged(self, prompt: Prompt, system: Prompt) -> LLMResponse:
+        # Each request runs on a daemon thread: once an answer is returned,
+        # slower requests are abandoned and cannot hold the process open at exit.
+        outcomes: queue.SimpleQueue[tuple[LLMResponse | None, Exception | None]] = queue.SimpleQueue()
+        next_index = running = 0
+        errors: list[Exception] = []
+
+        def run(provider: BaseLLMProvider) -> None:
+            try:
+                outcomes.put((provider.generate(prompt, system=system), None))
+            except Exception as e:
+                outcomes.put((None, e))
+
+        def launch() -> None:
+            nonlocal next_index, running
+            provider = self._providers[next_index]
+            next_index += 1
+            running += 1
+            start_in_context(run, provider, name="llm-hedge")
+
+        launch()
+        while running:
+            can_hedge = next_index < len(self._providers)
+            try:
+                response, error = outcomes.get(timeout=self._hedge_after if can_hedge else None)
+            except queue.Empty:
+                launch()
+                continue
+            running -= 1
+            if error is None:
+                return response
+            if not should_fall_back(error):
+                raise error
+            errors.append(error)
+            # Replace a failed request with the next provider right away.
+            if next_index < len(self._providers):
+                launch()
+        raise AllProvidersFailedError(errors)
@@ -1,47 +1,156 @@
 """Ollama provider for local LLM generation and embeddings."""
 
+import time
+from abc import ABC, abstractmethod
+
+import numpy as np
 import ollama as _ollama_lib
 
-from llm_core.providers.base import BaseLLMProvider, LLMResponse
+from llm_core.providers.base import BaseLLMProvider, LLMResponse, Prompt, prompt_text
+from llm_core.ratelimit import estimate_tokens
 from llm_core.retry import with_retry
+from llm_core.tracing import span
+from llm_core.usage import UsageRecord, get_meter, token_count
+
+
+def _prompt_tokens(_self, prompt: Prompt, *, system: Prompt = "") -> int:
+    """Estimate the tokens of a request for rate limiting."""
+    return estimate_tokens(prompt_text(prompt), prompt_text(system))
+
+
+def _texts_tokens(_self, texts: list[str]) -> int:
+    """Estimate the tokens of a request for rate limiting."""
+    return estimate_tokens(*texts)
+
+
+def _load_seconds(response) -> float:
+    """Time the server spent loading the model for a request (load_duration is in ns)."""
+    return token_count(getattr(response, "load_duration", 0)) / 1e9
+
+
+class _OllamaModel(ABC):
+    """Keep-alive and warm-up shared by the Ollama providers.
+
+    keep_alive is how long the server keeps the model loaded after each
+    request: seconds (negative keeps it loaded until the server stops) or a
+    duration string such as "30m". None leaves the server default (5m).
+    """
 
+    _client: _ollama_lib.Client
+    _model: str
+    _keep_alive: float | str | None
 
-class OllamaProvider(BaseLLMProvider):
+    def _keep_alive_kwargs(self) -> dict:
+        return {} if self._keep_alive is None else {"keep_alive": self._keep_alive}
+
+    @abstractmethod
+    def _load(self):
+        """Send the request that loads the model; returns the server's response."""
+
+    def warm_up(self) -> float:
+        """Load the model into memory without generating; returns the load time in seconds.
+
+        Takes about zero seconds when the model is already loaded. Also
+        refreshes its keep-alive.
+        """
+        with span("warm_up", provider="ollama", model=self._model) as s:
+            load_seconds = _load_seconds(self._load())
+            s.set(load_seconds=load_seconds)
+        return load_seconds
+
+
+class OllamaProvider(_OllamaModel, BaseLLMProvider):
     """LLM provider using a local Ollama server."""
 
-    def __init__(self, model: str, host: str = "http://localhost:11434") -> None:
-        self._client = _ollama_lib.Client(host=host)
+    def __init__(
+        self,
+        model: str,
+        host: str = "http://localhost:11434",
+        client: _ollama_lib.Client | None = None,
+        keep_alive: float | str | None = None,
+    ) -> None:
+        self._client = client if client is not None else _ollama_lib.Client(host=host)
         self._model = model
+        self._keep_alive = keep_alive
 
-    @with_retry(max_attempts=3)
-    def generate(self, prompt: str, *, system: str = "") -> LLMResponse:
-        """Generate a response using the local Ollama server."""
+    def _load(self):
+        # A generate request without a prompt only loads the model.
+        return self._client.generate(model=self._model, **self._keep_alive_kwargs())
+
+    @with_retry(max_attempts=3, service="ollama", estimate_tokens=_prompt_tokens)
+    def generate(self, prompt: Prompt, *, system: Prompt = "") -> LLMResponse:
+        """Generate a response using the local Ollama server.
+
+        Content blocks are joined into plain text; the server reuses its
+        KV cache for a prompt prefix matching the previous request.
+        """
         messages = []
+        system = prompt_text(system)
         if system:
             messages.append({"role": "system", "content": system})
-        messages.append({"role": "user", "content": prompt})
+        messages.append({"role": "user", "content": prompt_text(prompt)})
 
-        response = self._client.chat(model=self._model, messages=messages)
+        with span("generate", provider="ollama", model=self._model) as s:
+            start = time.perf_counter()
+            response = self._client.chat(model=self._model, messages=messages, **self._keep_alive_kwargs())
+            input_tokens = getattr(response, "prompt_eval_count", 0) or 0
+            output_tokens = getattr(response, "eval_count", 0) or 0
+            # Cold-start time is reported apart from the span's total.
+            s.set(input_tokens=input_tokens, output_tokens=output_tokens, load_seconds=_load_seconds(response))
+        get_meter().record(
+            UsageRecord(
+                kind="generate",
+                provider="ollama",
+                model=self._model,
+                input_tokens=token_count(input_tokens),
+                output_tokens=token_count(output_tokens),
+                seconds=time.perf_counter() - start,
+            )
+        )
 
         return LLMResponse(
             text=response.message.content,
             model=response.model,
-            input_tokens=getattr(response, "prompt_eval_count", 0) or 0,
-            output_tokens=getattr(response, "eval_count", 0) or 0,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
         )
 
 
-class OllamaEmbeddingProvider:
+class OllamaEmbeddingProvider(_OllamaModel):
     """Embedding provider using a local Ollama server."""
 
-    def __init__(self, model: str, host: str = "http://localhost:11434") -> None:
-        self._client = _ollama_lib.Client(host=host)
+    def __init__(
+        self,
+        model: str,
+        host: str = "http://localhost:11434",
+        client: _ollama_lib.Client | None = None,
+        keep_alive: float | str | None = None,
+    ) -> None:
+        self._client = client if client is not None else _ollama_lib.Client(host=host)
         self._model = model
+        self._keep_alive = keep_alive
 
-    @with_retry(max_attempts=3)
-    def embed(self, texts: list[str]) -> list[list[float]]:
-        """Generate embeddings for a list of texts."""
+    def _load(self):
+        # An embed request without input only loads the model.
+        return self._client.embed(model=self._model, input=[], **self._keep_alive_kwargs())
+
+    @with_retry(max_attempts=3, service="ollama", estimate_tokens=_texts_tokens)
+    def embed(self, texts: list[str]) -> np.ndarray:
+        """Generate embeddings for a list of texts as a float32 (n, dim) array."""
         if not texts:
-            return []
-        response = self._client.embed(model=self._model, input=texts)
-        return response.embeddings
+            return np.empty((0, 0), dtype=np.float32)
+        with span("embed", provider="ollama", model=self._model, texts=len(texts)) as s:
+            start = time.perf_counter()
+            response = self._client.embed(model=self._model, input=texts, **self._keep_alive_kwargs())
+            tokens = token_count(getattr(response, "prompt_eval_count", 0))
+            s.set(tokens=tokens, load_seconds=_load_seconds(response))
+        get_meter().record(
+            UsageRecord(
+                kind="embed",
+                provider="ollama",
+                model=self._model,
+                input_tokens=tokens,
+                seconds=time.perf_counter() - start,
+            )
+        )
+        return np.asarray(response.embeddings, dtype=np.float32)
@@ -1,24 +1,61 @@
 """OpenAI provider for embeddings."""
 
+import base64
+import time
+
+import numpy as np
 from openai import OpenAI
 
+from llm_core.ratelimit import estimate_tokens
 from llm_core.retry import with_retry
+from llm_core.tracing import span
+from llm_core.usage import UsageRecord, get_meter, token_count
+
+
+def _decode(embedding: str | list[float]) -> np.ndarray:
+    """Decode a base64 float32 embedding (or pass through a float list)."""
+    if isinstance(embedding, str):
+        return np.frombuffer(base64.b64decode(embedding), dtype=np.float32)
+    return np.asarray(embedding, dtype=np.float32)
+
+
+def _request_tokens(_self, texts: list[str]) -> int:
+    """Estimate the tokens of a request for rate limiting."""
+    return estimate_tokens(*texts)
 
 
 class OpenAIEmbeddingProvider:
     """Embedding provider using the OpenAI API."""
 
-    def __init__(self, api_key: str, model: str = "text-embedding-3-small") -> None:
-        self._client = OpenAI(api_key=api_key)
+    def __init__(self, api_key: str, model: str = "text-embedding-3-small", client: OpenAI | None = None) -> None:
+        self._client = client if client is not None else OpenAI(api_key=api_key)
         self._model = model
 
-    @with_retry(max_attempts=3)
-    def embed(self, texts: list[str]) -> list[list[float]]:
-        """Generate embeddings for a list of texts."""
+    @with_retry(max_attempts=3, service="openai", estimate_tokens=_request_tokens)
+    def embed(self, texts: list[str]) -> np.ndarray:
+        """Generate embeddings for a list of texts as a float32 (n, dim) array.
+
+        Embeddings are requested base64-encoded and decoded straight into
+        NumPy, avoiding a Python float object per dimension.
+        """
         if not texts:
-            return []
-        response = self._client.embeddings.create(
-            model=self._model,
-            input=texts,
+            return np.empty((0, 0), dtype=np.float32)
+        with span("embed", provider="openai", model=self._model, texts=len(texts)) as s:
+            start = time.perf_counter()
+            response = self._client.embeddings.create(
+                model=self._model,
+                input=texts,
+                encoding_format="base64",
+            )
+            tokens = token_count(getattr(getattr(response, "usage", None), "prompt_tokens", 0))
+            s.set(tokens=tokens)
+        get_meter().record(
+            UsageRecord(
+                kind="embed",
+                provider="openai",
+                model=self._model,
+                input_tokens=tokens,
+                seconds=time.perf_counter() - start,
+            )
         )
-        return [item.embedding for item in response.data]
+        return np.vstack([_decode(item.embedding) for item in response.data])
@@ -0,0 +1,184 @@
+"""Client-side rate limiting and circuit breaking shared by provider instances.
+
+Limiters and breakers are kept in per-service registries ("anthropic",
+"openai", "ollama"), so every provider object talking to the same API
+draws from one quota and sees the same failures.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+
+# Buckets hold this many seconds' worth of quota, which allows short bursts
+# without front-loading a whole minute of requests.
+_BURST_SECONDS = 10.0
+
+
+class _Bucket:
+    """Token bucket refilled continuously at rate_per_minute."""
+
+    def __init__(self, rate_per_minute: float, now: float) -> None:
+        self.rate = rate_per_minute / 60.0
+        self.capacity = max(1.0, self.rate * _BURST_SECONDS)
+        self.level = self.capacity
+        self.updated = now
+
+    def refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until amount is available (amounts above capacity wait for a full bucket)."""
+        missing = min(amount, self.capacity) - self.level
+        return 0.0 if missing <= 0 else missing / self.rate
+
+
+class RateLimiter:
+    """Blocking limiter for requests per minute and tokens per minute.
+
+    A limit of 0 disables that dimension. ``pause`` holds back every caller,
+    e.g. for the duration of a server's Retry-After.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int = 0,
+        tokens_per_minute: int = 0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._paused_until = 0.0
+        self.configure(requests_per_minute, tokens_per_minute)
+
+    def configure(self, requests_per_minute: int = 0, tokens_per_minute: int = 0) -> None:
+        """Change the limits; 0 disables a limit."""
+        if requests_per_minute < 0 or tokens_per_minute < 0:
+            raise ValueError("Rate limits must be non-negative")
+        now = self._clock()
+        with self._lock:
+            self._requests = _Bucket(requests_per_minute, now) if requests_per_minute else None
+            self._tokens = _Bucket(tokens_per_minute, now) if tokens_per_minute else None
+
+    def pause(self, seconds: float) -> None:
+        """Hold back all callers for the next `seconds`."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+    def acquire(self, tokens: int = 0) -> float:
+        """Block until one request (and `tokens` tokens) fit the limits; return the time waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                delay = max(0.0, self._paused_until - now)
+                for bucket, amount in ((self._requests, 1), (self._tokens, tokens)):
+                    if bucket is not None and amount:
+                        bucket.refill(now)
+                        delay = max(delay, bucket.wait_time(amount))
+                if delay <= 0:
+                    if self._requests is not None:
+                        self._requests.level -= 1
+                    if self._tokens is not None and tokens:
+                        # May go negative for oversized requests; later callers then wait it off.
+                        self._tokens.level -= tokens
+                    return waited
+            self._sleep(delay)
+            waited += delay
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a service that keeps failing."""
+
+
+class CircuitBreaker:
+    """Stops calls to a service after consecutive transient failures.
+
+    After ``failure_threshold`` failures in a row the circuit opens and calls
+    fail fast with CircuitOpenError. Once ``reset_timeout`` has passed, calls
+    are let through again; a success closes the circuit, a failure reopens it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self._threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: float | None = None
+
+    @property
+    def is_open(self) -> bool:
+        """True while calls are being rejected."""
+        with self._lock:
+            return self._opened_at is not None and self._clock() - self._opened_at < self._reset_timeout
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError if the circuit is open."""
+        with self._lock:
+            if self._opened_at is None:
+                return
+            remaining = self._reset_timeout - (self._clock() - self._opened_at)
+            if remaining > 0:
+                raise CircuitOpenError(
+                    f"{self.name}: {self._failures} consecutive failures; not calling it for another {remaining:.0f}s"
+                )
+
+    def record_success(self) -> None:
+        """Close the circuit."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        """Count a transient failure, opening the circuit at the threshold."""
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self._threshold:
+                self._opened_at = self._clock()
+
+
+_registry_lock = threading.Lock()
+_limiters: dict[str, RateLimiter] = {}
+_breakers: dict[str, CircuitBreaker] = {}
+
+
+def get_rate_limiter(service: str) -> RateLimiter:
+    """Return the shared limiter for a service (unlimited until configured)."""
+    with _registry_lock:
+        if service not in _limiters:
+            _limiters[service] = RateLimiter()
+        return _limiters[service]
+
+
+def get_circuit_breaker(service: str) -> CircuitBreaker:
+    """Return the shared circuit breaker for a service."""
+    with _registry_lock:
+        if service not in _breakers:
+            _breakers[service] = CircuitBreaker(service)
+        return _breakers[service]
+
+
+def configure_rate_limits(requests_per_minute: dict[str, int], tokens_per_minute: dict[str, int]) -> None:
+    """Set per-service limits, e.g. ({"anthropic": 50}, {"anthropic": 40000})."""
+    for service in set(requests_per_minute) | set(tokens_per_minute):
+        get_rate_limiter(service).configure(
+            requests_per_minute.get(service, 0),
+            tokens_per_minute.get(service, 0),
+        )
+
+
+def estimate_tokens(*texts: str) -> int:
+    """Rough token count for rate limiting (about four characters per token)."""
+    return sum(len(t) for t in texts) // 4
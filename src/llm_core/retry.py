@@ -1,29 +1,44 @@
-"""Retry decorator with exponential backoff for API calls."""
+"""Retry decorator with jittered exponential backoff for API calls.
 
+Honours Retry-After headers, and when given a service name also applies
+that service's shared rate limiter and circuit breaker.
+"""
+
+import functools
+import random
+import time
 from collections.abc import Callable
+from email.utils import parsedate_to_datetime
 from typing import TypeVar
 
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
+from tenacity import RetryCallState, retry, retry_if_exception, stop_after_attempt
+
+from llm_core.ratelimit import get_circuit_breaker, get_rate_limiter
 
 T = TypeVar("T")
 
-# Exception types that should trigger retries
-_base_exceptions: list[type[Exception]] = [ConnectionError, TimeoutError, OSError]
+# Longest Retry-After we will sleep for; a call asked to wait longer fails
+# straight away instead of hanging (or retrying early and being refused again).
+MAX_RETRY_AFTER = 120.0
+
+# Exception types that should trigger retries. Only transient network and
+# server conditions: a broad OSError would also retry e.g. missing files.
+_base_exceptions: list[type[Exception]] = [ConnectionError, TimeoutError]
 
 try:
     import anthropic
-    _base_exceptions.extend([anthropic.RateLimitError, anthropic.InternalServerError])
+    _base_exceptions.extend(
+        [anthropic.APIConnectionError, anthropic.RateLimitError, anthropic.InternalServerError]
+    )
+    # 529 Overloaded has its own class (not an InternalServerError) in newer SDKs.
+    if hasattr(anthropic, "OverloadedError"):
+        _base_exceptions.append(anthropic.OverloadedError)
 except ImportError:
     pass
 
 try:
     import openai
-    _base_exceptions.extend([openai.RateLimitError, openai.InternalServerError])
+    _base_exceptions.extend([openai.APIConnectionError, openai.RateLimitError, openai.InternalServerError])
 except ImportError:
     pass
 
@@ -36,24 +51,115 @@ except ImportError:
 RETRYABLE_EXCEPTIONS = tuple(_base_exceptions)
 
 
+def is_retryable(exc: BaseException) -> bool:
+    """Return True for transient failures worth retrying."""
+    if not isinstance(exc, RETRYABLE_EXCEPTIONS):
+        return False
+    # Ollama reports every HTTP error as ResponseError; only 429 and 5xx are transient.
+    status = getattr(exc, "status_code", None)
+    if type(exc).__name__ == "ResponseError" and isinstance(status, int) and status >= 0:
+        return status == 429 or status >= 500
+    return True
+
+
+def retry_after(exc: BaseException) -> float | None:
+    """Seconds the server asked us to wait (Retry-After / retry-after-ms), if any."""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000
+        value = headers.get("retry-after")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _should_retry(exc: BaseException) -> bool:
+    """Retry transient failures, unless the server asked for a wait above MAX_RETRY_AFTER."""
+    return is_retryable(exc) and (retry_after(exc) or 0.0) <= MAX_RETRY_AFTER
+
+
+class _Backoff:
+    """tenacity wait strategy: server-requested delay, else exponential backoff with full jitter."""
+
+    def __init__(self, min_wait: float, max_wait: float) -> None:
+        self._min = min_wait
+        self._max = max_wait
+
+    def __call__(self, retry_state: RetryCallState) -> float:
+        exc = retry_state.outcome.exception() if retry_state.outcome else None
+        requested = retry_after(exc) if exc is not None else None
+        if requested is not None:
+            # A little jitter keeps callers released by the same header from retrying in lockstep.
+            return requested * random.uniform(1.0, 1.1)
+        cap = min(self._max, self._min * 2 ** retry_state.attempt_number)
+        return random.uniform(self._min, max(self._min, cap))
+
+
+def _guarded(func: Callable, service: str, estimate_tokens: Callable[..., int] | None) -> Callable:
+    """Wrap one attempt with the service's circuit breaker and rate limiter."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        breaker = get_circuit_breaker(service)
+        limiter = get_rate_limiter(service)
+        breaker.before_call()
+        limiter.acquire(estimate_tokens(*args, **kwargs) if estimate_tokens else 0)
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            if is_retryable(e):
+                breaker.record_failure()
+                delay = retry_after(e)
+                if delay and delay <= MAX_RETRY_AFTER:
+                    # Hold back every caller of this service, not just this one.
+                    limiter.pause(delay)
+            raise
+        breaker.record_success()
+        return result
+
+    return wrapper
+
+
 def with_retry(
     max_attempts: int = 3,
     min_wait: float = 1,
     max_wait: float = 30,
+    *,
+    service: str | None = None,
+    estimate_tokens: Callable[..., int] | None = None,
 ) -> Callable:
-    """Create a retry decorator with exponential backoff.
+    """Create a retry decorator with jittered exponential backoff.
 
     Args:
         max_attempts: Maximum number of retry attempts.
         min_wait: Minimum wait time in seconds.
-        max_wait: Maximum wait time in seconds.
+        max_wait: Maximum wait time in seconds (Retry-After headers may exceed it).
+        service: Name of the rate limiter / circuit breaker shared by all
+            callers of the same API. None disables both.
+        estimate_tokens: Called with the function's arguments to estimate the
+            tokens a call consumes, for tokens-per-minute limits.
 
     Returns:
         A decorator that adds retry logic to a function.
     """
-    return retry(
-        retry=retry_if_exception_type(RETRYABLE_EXCEPTIONS),
+    retrying = retry(
+        retry=retry_if_exception(_should_retry),
         stop=stop_after_attempt(max_attempts),
-        wait=wait_exponential(multiplier=1, min=min_wait, max=max_wait),
+        wait=_Backoff(min_wait, max_wait),
         reraise=True,
     )
+
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        if service is None:
+            return retrying(func)
+        return retrying(_guarded(func, service, estimate_tokens))
+
+    return decorator
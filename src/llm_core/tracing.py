@@ -0,0 +1,248 @@
+"""Lightweight tracing: nested timed spans with counters, exportable as JSON or OTLP.
+
+Tracing is off by default and ``span()`` then returns a shared no-op
+object, so instrumented hot paths pay only a flag check.
+"""
+
+import contextvars
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor, Future
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+_current_span: contextvars.ContextVar["Span | None"] = contextvars.ContextVar("current_span", default=None)
+
+
+@dataclass
+class Span:
+    """A timed operation with attributes (counts, sizes, tokens)."""
+
+    name: str
+    span_id: str
+    parent_id: str | None
+    start_ns: int
+    end_ns: int | None = None
+    attributes: dict = field(default_factory=dict)
+
+    @property
+    def duration(self) -> float:
+        """Duration in seconds (0 while the span is still open)."""
+        return 0.0 if self.end_ns is None else (self.end_ns - self.start_ns) / 1e9
+
+    def set(self, **attributes) -> None:
+        """Set attributes, replacing existing values."""
+        self.attributes.update(attributes)
+
+    def add(self, key: str, value: int | float = 1) -> None:
+        """Increment a numeric counter attribute."""
+        self.attributes[key] = self.attributes.get(key, 0) + value
+
+
+class _NoopSpan:
+    """Stand-in returned while tracing is disabled."""
+
+    def set(self, **attributes) -> None:
+        pass
+
+    def add(self, key: str, value: int | float = 1) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+
+_NOOP = _NoopSpan()
+
+
+@dataclass(frozen=True)
+class StageSummary:
+    """Aggregate of all spans sharing a name."""
+
+    name: str
+    calls: int
+    seconds: float
+    counters: dict
+
+
+class Tracer:
+    """Collects spans for one process. Thread-safe."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop recorded spans and start a new trace."""
+        with self._lock:
+            self._spans: list[Span] = []
+            self.trace_id = os.urandom(16).hex()
+            # Span times are unix-epoch based but measured with the monotonic clock.
+            self._origin_unix_ns = time.time_ns()
+            self._origin_perf_ns = time.perf_counter_ns()
+
+    def _now_ns(self) -> int:
+        return self._origin_unix_ns + (time.perf_counter_ns() - self._origin_perf_ns)
+
+    def start_span(self, name: str, **attributes) -> Span:
+        """Open a span as a child of the current one and make it current."""
+        parent = _current_span.get()
+        span = Span(
+            name=name,
+            span_id=os.urandom(8).hex(),
+            parent_id=parent.span_id if parent else None,
+            start_ns=self._now_ns(),
+            attributes=dict(attributes),
+        )
+        span._token = _current_span.set(span)
+        return span
+
+    def end_span(self, span: Span) -> None:
+        """Close a span opened with start_span and record it."""
+        span.end_ns = self._now_ns()
+        try:
+            _current_span.reset(span._token)
+        except ValueError:
+            # Ended from a different context (e.g. a close callback); nothing to restore.
+            pass
+        with self._lock:
+            self._spans.append(span)
+
+    @contextmanager
+    def span(self, name: str, **attributes) -> Iterator[Span]:
+        """Time a block as a span."""
+        span = self.start_span(name, **attributes)
+        try:
+            yield span
+        except BaseException as e:
+            span.set(error=type(e).__name__)
+            raise
+        finally:
+            self.end_span(span)
+
+    @property
+    def spans(self) -> list[Span]:
+        """Finished spans in completion order."""
+        with self._lock:
+            return list(self._spans)
+
+    def summary(self) -> list[StageSummary]:
+        """Aggregate finished spans by name, summing durations and numeric attributes."""
+        stages: dict[str, StageSummary] = {}
+        for span in sorted(self.spans, key=lambda s: s.start_ns):
+            prev = stages.get(span.name)
+            counters = dict(prev.counters) if prev else {}
+            for key, value in span.attributes.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    counters[key] = counters.get(key, 0) + value
+            stages[span.name] = StageSummary(
+                name=span.name,
+                calls=(prev.calls if prev else 0) + 1,
+                seconds=(prev.seconds if prev else 0.0) + span.duration,
+                counters=counters,
+            )
+        return list(stages.values())
+
+    def to_dict(self) -> dict:
+        """Return the trace as plain JSON-serializable data."""
+        return {
+            "trace_id": self.trace_id,
+            "spans": [
+                {
+                    "name": s.name,
+                    "span_id": s.span_id,
+                    "parent_id": s.parent_id,
+                    "start_unix_nano": s.start_ns,
+                    "end_unix_nano": s.end_ns,
+                    "duration_seconds": s.duration,
+                    "attributes": s.attributes,
+                }
+                for s in self.spans
+            ],
+        }
+
+    def to_otlp(self, service_name: str = "rag-cli") -> dict:
+        """Return the trace in OTLP/JSON form, loadable by OpenTelemetry collectors."""
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": [_otlp_attribute("service.name", service_name)]},
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "llm_core.tracing"},
+                            "spans": [
+                                {
+                                    "traceId": self.trace_id,
+                                    "spanId": s.span_id,
+                                    "parentSpanId": s.parent_id or "",
+                                    "name": s.name,
+                                    "kind": 1,
+                                    "startTimeUnixNano": str(s.start_ns),
+                                    "endTimeUnixNano": str(s.end_ns),
+                                    "attributes": [_otlp_attribute(k, v) for k, v in s.attributes.items()],
+                                }
+                                for s in self.spans
+                            ],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    def export(self, path: Path, format: str = "json") -> None:
+        """Write the trace to a file as "json" or "otlp"."""
+        if format not in ("json", "otlp"):
+            raise ValueError(f"Unknown trace format {format!r}; expected 'json' or 'otlp'")
+        data = self.to_otlp() if format == "otlp" else self.to_dict()
+        Path(path).write_text(json.dumps(data, indent=2, default=str), encoding="utf-8")
+
+
+def _otlp_attribute(key: str, value) -> dict:
+    """Encode one attribute as an OTLP KeyValue."""
+    if isinstance(value, bool):
+        encoded = {"boolValue": value}
+    elif isinstance(value, int):
+        encoded = {"intValue": str(value)}
+    elif isinstance(value, float):
+        encoded = {"doubleValue": value}
+    else:
+        encoded = {"stringValue": str(value)}
+    return {"key": key, "value": encoded}
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Return the process-wide tracer."""
+    return _tracer
+
+
+def span(name: str, **attributes):
+    """Time a block as a span on the process-wide tracer.
+
+    Returns a no-op context manager while tracing is disabled.
+    """
+    if not _tracer.enabled:
+        return _NOOP
+    return _tracer.span(name, **attributes)
+
+
+def submit_in_context(pool: Executor, fn: Callable, /, *args, **kwargs) -> Future:
+    """Submit fn to an executor in a copy of the caller's context, so its spans nest correctly."""
+    return pool.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+def start_in_context(fn: Callable, /, *args, name: str | None = None) -> threading.Thread:
+    """Run fn on a new daemon thread in a copy of the caller's context, so its spans nest correctly."""
+    thread = threading.Thread(target=contextvars.copy_context().run, args=(fn, *args), name=name, daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,235 @@
+"""Token usage and cost accounting for generation and embedding calls."""
+
+import json
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+
+# USD per million tokens as (input, output). Keys are model-name prefixes so
+# dated snapshots (e.g. claude-3-5-sonnet-20241022) resolve to their family;
+# the longest matching prefix wins. Local providers are free.
+PRICES: dict[str, tuple[float, float]] = {
+    "claude-3-5-sonnet": (3.00, 15.00),
+    "claude-3-7-sonnet": (3.00, 15.00),
+    "claude-sonnet-4": (3.00, 15.00),
+    "claude-3-5-haiku": (0.80, 4.00),
+    "claude-3-haiku": (0.25, 1.25),
+    "claude-3-opus": (15.00, 75.00),
+    "claude-opus-4": (15.00, 75.00),
+    "text-embedding-3-small": (0.02, 0.0),
+    "text-embedding-3-large": (0.13, 0.0),
+    "text-embedding-ada-002": (0.10, 0.0),
+}
+
+# Prompt-cache pricing relative to the input price: writes cost a premium,
+# reads a small fraction (Anthropic's 5-minute cache).
+CACHE_WRITE_MULTIPLIER = 1.25
+CACHE_READ_MULTIPLIER = 0.10
+
+_FREE_PROVIDERS = {"ollama", "local"}
+
+
+def token_count(value) -> int:
+    """Return value if it is a token count, else 0 (missing or unexpected usage fields)."""
+    return value if isinstance(value, int) and not isinstance(value, bool) else 0
+
+
+def estimate_cost(
+    provider: str,
+    model: str,
+    input_tokens: int,
+    output_tokens: int,
+    *,
+    cache_read_tokens: int = 0,
+    cache_write_tokens: int = 0,
+) -> float | None:
+    """Estimate the USD cost of a call, or None when the model has no known price.
+
+    Cached prompt tokens are not part of input_tokens; they are priced
+    separately with the cache multipliers.
+    """
+    if provider in _FREE_PROVIDERS:
+        return 0.0
+    matches = [prefix for prefix in PRICES if model.startswith(prefix)]
+    if not matches:
+        return None
+    input_price, output_price = PRICES[max(matches, key=len)]
+    cached = cache_read_tokens * CACHE_READ_MULTIPLIER + cache_write_tokens * CACHE_WRITE_MULTIPLIER
+    return ((input_tokens + cached) * input_price + output_tokens * output_price) / 1_000_000
+
+
+@dataclass(frozen=True)
+class UsageRecord:
+    """Tokens and time spent by provider calls of one kind ("generate" or "embed")."""
+
+    kind: str
+    provider: str
+    model: str
+    input_tokens: int
+    output_tokens: int = 0
+    seconds: float = 0.0
+    calls: int = 1
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+
+    @property
+    def cost(self) -> float | None:
+        """Estimated USD cost, or None for models without a known price."""
+        return estimate_cost(
+            self.provider,
+            self.model,
+            self.input_tokens,
+            self.output_tokens,
+            cache_read_tokens=self.cache_read_tokens,
+            cache_write_tokens=self.cache_write_tokens,
+        )
+
+
+class UsageMeter:
+    """Collects usage records for the current process. Thread-safe."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._records: list[UsageRecord] = []
+
+    def record(self, record: UsageRecord) -> None:
+        """Add one call's usage."""
+        with self._lock:
+            self._records.append(record)
+
+    def reset(self) -> None:
+        """Drop all records."""
+        with self._lock:
+            self._records = []
+
+    @property
+    def records(self) -> list[UsageRecord]:
+        """Recorded calls in order."""
+        with self._lock:
+            return list(self._records)
+
+    def totals(self) -> list[UsageRecord]:
+        """Records summed per (kind, provider, model)."""
+        totals: dict[tuple[str, str, str], UsageRecord] = {}
+        for r in self.records:
+            key = (r.kind, r.provider, r.model)
+            prev = totals.get(key)
+            totals[key] = r if prev is None else replace(
+                prev,
+                input_tokens=prev.input_tokens + r.input_tokens,
+                output_tokens=prev.output_tokens + r.output_tokens,
+                seconds=prev.seconds + r.seconds,
+                calls=prev.calls + r.calls,
+                cache_read_tokens=prev.cache_read_tokens + r.cache_read_tokens,
+                cache_write_tokens=prev.cache_write_tokens + r.cache_write_tokens,
+            )
+        return list(totals.values())
+
+
+_meter = UsageMeter()
+
+
+def get_meter() -> UsageMeter:
+    """Return the process-wide usage meter."""
+    return _meter
+
+
+def append_usage_log(
+    path: Path, records: Iterable[UsageRecord], *, command: str, details: dict, seconds: float
+) -> None:
+    """Append one command run with its usage to a JSONL log."""
+    records = list(records)
+    costs = [r.cost for r in records]
+    entry = {
+        "timestamp": time.time(),
+        "command": command,
+        "seconds": seconds,
+        "details": details,
+        "usage": [asdict(r) for r in records],
+        "cost_usd": sum(c for c in costs if c is not None),
+        "cost_complete": all(c is not None for c in costs),
+    }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(entry) + "\n")
+
+
+def read_usage_log(path: Path) -> list[dict]:
+    """Read all entries of a usage log, skipping corrupt lines."""
+    path = Path(path)
+    if not path.exists():
+        return []
+    entries = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        try:
+            entries.append(json.loads(line))
+        except json.JSONDecodeError:
+            continue
+    return entries
+
+
+@dataclass(frozen=True)
+class UsageSummary:
+    """Usage aggregated over logged runs for one group."""
+
+    group: str
+    runs: int
+    calls: int
+    input_tokens: int
+    output_tokens: int
+    cost_usd: float
+    seconds: float
+
+
+def summarize_usage(entries: Iterable[dict], by: str = "model") -> list[UsageSummary]:
+    """Aggregate logged runs, grouped by "model", "command" or a logged setting (e.g. "top_k").
+
+    Grouping by model splits each run into its per-model records; other
+    groupings attribute the whole run to one group. Sorted by cost.
+    """
+    groups: dict[str, dict] = {}
+
+    def add(group: str, run_id: int, records: list[dict], seconds: float) -> None:
+        g = groups.setdefault(group, {"runs": set(), "calls": 0, "in": 0, "out": 0, "cost": 0.0, "seconds": 0.0})
+        g["runs"].add(run_id)
+        g["seconds"] += seconds
+        for r in records:
+            g["calls"] += r.get("calls", 1)
+            g["in"] += r.get("input_tokens", 0)
+            g["out"] += r.get("output_tokens", 0)
+            cost = estimate_cost(
+                r.get("provider", ""),
+                r.get("model", ""),
+                r.get("input_tokens", 0),
+                r.get("output_tokens", 0),
+                cache_read_tokens=r.get("cache_read_tokens", 0),
+                cache_write_tokens=r.get("cache_write_tokens", 0),
+            )
+            g["cost"] += cost or 0.0
+
+    for run_id, entry in enumerate(entries):
+        records = entry.get("usage", [])
+        if by == "model":
+            for r in records:
+                add(f"{r.get('provider') or '?'}:{r.get('model', '?')}", run_id, [r], r.get("seconds", 0.0))
+        elif by == "command":
+            add(str(entry.get("command", "?")), run_id, records, entry.get("seconds", 0.0))
+        else:
+            add(f"{by}={entry.get('details', {}).get(by, '?')}", run_id, records, entry.get("seconds", 0.0))
+
+    summaries = [
+        UsageSummary(
+            group=group,
+            runs=len(g["runs"]),
+            calls=g["calls"],
+            input_tokens=g["in"],
+            output_tokens=g["out"],
+            cost_usd=g["cost"],
+            seconds=g["seconds"],
+        )
+        for group, g in groups.items()
+    ]
+    return sorted(summaries, key=lambda s: (-s.cost_usd, s.group))
@@ -1,6 +1,6 @@
 """CLI commands for rag-cli."""
 
-import hashlib
+import re
 import time
 from pathlib import Path
 from typing import Annotated
@@ -16,12 +16,24 @@ app = typer.Typer(
     no_args_is_help=True,
 )
 
+_INDEX_DIR = Path(".rag-cli")
+_PERSIST_DIR = _INDEX_DIR / "chroma"
+_QUANTIZED_DIR = _INDEX_DIR / "quantized"
+_USAGE_LOG = _INDEX_DIR / "usage.jsonl"
+_RUNS_DIR = _INDEX_DIR / "runs"
+_ANSWER_CACHE = _INDEX_DIR / "answer_cache.sqlite"
+_SHARD_SUFFIX_RE = re.compile(r"\.s\d+$")
+
 
 def _get_settings():
     """Load settings, handling configuration errors gracefully."""
     try:
         from llm_core.config import LLMSettings
-        return LLMSettings()
+        from llm_core.ratelimit import configure_rate_limits
+
+        settings = LLMSettings()
+        configure_rate_limits(settings.rate_limit_rpm, settings.rate_limit_tpm)
+        return settings
     except Exception as e:
         print_error(f"Configuration error: {e}")
         raise typer.Exit(code=1)
@@ -30,65 +42,260 @@ def _get_settings():
 def _create_embedder(settings):
     """Create the appropriate embedder based on the embedding_model setting."""
     from llm_core.config import parse_model_string
+    from llm_core.factory import create_embedding_provider
 
     provider_name, model = parse_model_string(settings.embedding_model)
+    if provider_name == "local":
+        from rag_core.embeddings.local import LocalEmbedder
+
+        try:
+            return LocalEmbedder(
+                model,
+                num_threads=settings.local_embedding_threads,
+                backend=settings.local_embedding_backend,
+            )
+        except Exception as e:
+            print_error(f"Could not load local embedding model '{model}': {e}")
+            raise typer.Exit(code=1)
+
+    try:
+        embedding_provider = create_embedding_provider(settings)
+    except ValueError as e:
+        print_error(str(e))
+        raise typer.Exit(code=1)
 
     if provider_name == "ollama":
-        from llm_core.providers.ollama import OllamaEmbeddingProvider
         from rag_core.embeddings.ollama import OllamaEmbedder
 
-        embedding_provider = OllamaEmbeddingProvider(
-            model=model,
-            host=settings.ollama_host,
-        )
         return OllamaEmbedder(provider=embedding_provider)
 
-    # Default: OpenAI
-    if not settings.openai_api_key:
-        print_error(
-            "OPENAI_API_KEY not set. Required for embeddings "
-            "(or use 'ollama:' prefix, e.g. RAG_CLI_EMBEDDING_MODEL=ollama:nomic-embed-text)."
-        )
-        raise typer.Exit(code=1)
-
-    from llm_core.providers.openai import OpenAIEmbeddingProvider
     from rag_core.embeddings.openai import OpenAIEmbedder
 
-    embedding_provider = OpenAIEmbeddingProvider(
-        api_key=settings.openai_api_key,
-        model=model,
-    )
     return OpenAIEmbedder(provider=embedding_provider)
 
 
 def _create_llm_provider(settings):
     """Create the appropriate LLM provider based on the model setting."""
-    from llm_core.config import parse_model_string
+    from llm_core.factory import create_llm_provider
 
-    provider_name, model = parse_model_string(settings.model)
+    try:
+        return create_llm_provider(settings)
+    except ValueError as e:
+        print_error(str(e))
+        raise typer.Exit(code=1)
 
-    if provider_name == "ollama":
-        from llm_core.providers.ollama import OllamaProvider
 
-        return OllamaProvider(model=model, host=settings.ollama_host)
+def _warm_up(settings, *, model: str | None = None, embedding_model: str | None = None) -> None:
+    """Start loading Ollama models in the background so the first request does not pay the load."""
+    from llm_core.factory import warm_up_models
 
-    # Default: Anthropic
-    if not settings.anthropic_api_key:
-        print_error(
-            "ANTHROPIC_API_KEY not set. Required for answer generation "
-            "(or use 'ollama:' prefix, e.g. RAG_CLI_MODEL=ollama:llama3.2)."
-        )
+    warm_up_models(settings, model=model, embedding_model=embedding_model)
+
+
+def _store_dir(settings) -> Path:
+    """Return the directory holding collections for the configured store backend."""
+    return _PERSIST_DIR if settings.vector_quantization == "none" else _QUANTIZED_DIR
+
+
+def _generations(settings):
+    """Return the generations of the configured store backend's collections."""
+    from rag_core.vectorstores import Generations
+
+    return Generations(_store_dir(settings) / "generations.json")
+
+
+def _store_backend(settings):
+    """Return the store class and directory of the configured backend."""
+    from rag_core.vectorstores import ChromaStore, QuantizedStore
+
+    if settings.vector_quantization == "none":
+        return ChromaStore, _PERSIST_DIR
+    return QuantizedStore, _QUANTIZED_DIR
+
+
+def _stored_collections(settings) -> list[tuple[Path, str]]:
+    """Return (directory, name) of every stored collection of the configured backend, shards included."""
+    store_cls, persist_dir = _store_backend(settings)
+    shards_dir = persist_dir / "shards"
+    # Shard i of a sharded collection is stored as <collection>.s<i> in its own directory.
+    directories = [persist_dir, *(sorted(shards_dir.iterdir()) if shards_dir.is_dir() else [])]
+    return [(directory, name) for directory in directories for name in store_cls.list_collections(directory)]
+
+
+def _physical_collections(settings) -> list[str]:
+    """Return the physical collections of the configured store backend, counting shards once."""
+    return sorted({_SHARD_SUFFIX_RE.sub("", name) for _, name in _stored_collections(settings)})
+
+
+def _list_collections(settings) -> list[str]:
+    """Return the collection names of the configured store backend."""
+    return _generations(settings).logical_names(_physical_collections(settings))
+
+
+def _drop_collection(settings, physical: str) -> None:
+    """Delete a physical collection of the configured store backend, with any shards."""
+    store_cls, _ = _store_backend(settings)
+    for directory, name in _stored_collections(settings):
+        if _SHARD_SUFFIX_RE.sub("", name) == physical:
+            store_cls.drop_collection(directory, name)
+
+
+def _open_store(settings, collection: str, *, physical: str | None = None):
+    """Open a collection with the configured backend and profile, exiting on invalid settings.
+
+    The collection's active generation is opened unless a physical
+    collection (e.g. a rebuild's shadow) is named explicitly. An existing
+    collection is opened with the number of shards it was built with; a new
+    one is spread over RAG_CLI_VECTOR_SHARDS stores, each in its own
+    directory.
+    """
+    from rag_core.vectorstores import ChromaStore, QuantizedStore, get_profile, open_shards, shard_dir
+
+    name = physical or _generations(settings).active(collection)
+    _, persist_dir = _store_backend(settings)
+    stored = [n for _, n in _stored_collections(settings)]
+
+    def open_one(directory: Path, store_name: str):
+        if settings.vector_quantization != "none":
+            return QuantizedStore(
+                persist_dir=directory,
+                collection=store_name,
+                quantization=settings.vector_quantization,
+                space=settings.index_space,
+                rescore_factor=settings.quantization_rescore,
+            )
+        profile = get_profile(settings.index_profile, settings.index_space)
+        return ChromaStore(persist_dir=directory, collection=store_name, profile=profile)
+
+    try:
+        if name in stored:
+            return open_one(persist_dir, name)
+        shard_names = [n for n in stored if n != name and _SHARD_SUFFIX_RE.sub("", n) == name]
+        if shard_names:
+            # Shard 0 records the count; routing by shard_of depends on it.
+            first = open_one(shard_dir(persist_dir, 0), f"{name}.s0")
+            num_shards = first.get_settings().get("vector_shards", len(shard_names))
+            return open_shards(open_one, persist_dir, name, num_shards)
+        if settings.vector_shards < 1:
+            raise ValueError(f"RAG_CLI_VECTOR_SHARDS must be at least 1, got {settings.vector_shards}")
+        if settings.vector_shards == 1:
+            return open_one(persist_dir, name)
+        return open_shards(open_one, persist_dir, name, settings.vector_shards)
+    except ValueError as e:
+        print_error(str(e))
+        raise typer.Exit(code=1)
+
+
+def _num_shards(store) -> int:
+    """Number of stores a collection is spread over."""
+    from rag_core.vectorstores import ShardedStore
+
+    return len(store.shards) if isinstance(store, ShardedStore) else 1
+
+
+def _mark_updated(store) -> None:
+    """Record a new revision on a collection whose contents changed, invalidating cached answers."""
+    import uuid
+
+    store.set_settings({"revision": uuid.uuid4().hex[:12]})
+
+
+def _build_filter(sources: list[str] | None, extensions: list[str] | None, modified_after: str | None):
+    """Build a metadata filter from CLI options, or None when no option is set."""
+    from datetime import datetime
+
+    from rag_core.vectorstores import MetadataFilter
+
+    timestamp = None
+    if modified_after is not None:
+        try:
+            timestamp = datetime.fromisoformat(modified_after).timestamp()
+        except ValueError:
+            print_error(f"Invalid --modified-after date: {modified_after!r} (expected YYYY-MM-DD).")
+            raise typer.Exit(code=1)
+
+    where = MetadataFilter(
+        sources=tuple(sources or ()),
+        extensions=tuple(extensions or ()),
+        modified_after=timestamp,
+    )
+    return None if where.is_empty() else where
+
+
+def _start_tracing(
+    ctx: typer.Context, command: str, profile: bool, trace_file: Path | None, trace_format: str
+) -> None:
+    """Trace the running command; print the stage breakdown and/or export the trace when it ends."""
+    if not profile and trace_file is None:
+        return
+    if trace_format not in ("json", "otlp"):
+        print_error(f"Unknown --trace-format {trace_format!r}; expected 'json' or 'otlp'.")
         raise typer.Exit(code=1)
 
-    from llm_core.providers.anthropic import AnthropicProvider
+    from llm_core.tracing import get_tracer
 
-    return AnthropicProvider(api_key=settings.anthropic_api_key, model=model)
+    tracer = get_tracer()
+    tracer.reset()
+    tracer.enabled = True
+    root = tracer.start_span(command)
 
+    # Close callbacks also run when the command exits early via typer.Exit.
+    def finish() -> None:
+        tracer.end_span(root)
+        tracer.enabled = False
+        if profile:
+            from rag_cli.console import print_profile
 
-def _chunk_id(source: str, chunk_index: int) -> str:
-    """Generate a deterministic ID for a chunk."""
-    raw = f"{source}::chunk::{chunk_index}"
-    return hashlib.sha256(raw.encode()).hexdigest()[:16]
+            print_profile(tracer.summary(), total=root.duration)
+        if trace_file is not None:
+            tracer.export(trace_file, trace_format)
+            console.print(f"Trace written to {trace_file}")
+
+    ctx.call_on_close(finish)
+
+
+def _track_usage(ctx: typer.Context, command: str) -> dict:
+    """Meter provider usage of the running command; show and log it when the command ends.
+
+    Returns a dict for the command to fill with the settings logged
+    alongside the usage (model, top_k, chunking...).
+    """
+    from llm_core.usage import get_meter
+
+    meter = get_meter()
+    meter.reset()
+    details: dict = {}
+    start = time.time()
+
+    def finish() -> None:
+        records = meter.totals()
+        if not records:
+            return
+        from llm_core.usage import append_usage_log
+        from rag_cli.console import print_usage
+
+        print_usage(records)
+        try:
+            append_usage_log(_USAGE_LOG, records, command=command, details=details, seconds=time.time() - start)
+        except OSError as e:
+            print_error(f"Could not write usage log: {e}")
+
+    ctx.call_on_close(finish)
+    return details
+
+
+_ProfileOption = Annotated[
+    bool,
+    typer.Option("--profile", help="Print a per-stage timing breakdown."),
+]
+_TraceFileOption = Annotated[
+    Path,
+    typer.Option("--trace-file", help="Write a trace of all timed stages to this file."),
+]
+_TraceFormatOption = Annotated[
+    str,
+    typer.Option("--trace-format", help="Trace file format: json or otlp (OpenTelemetry JSON)."),
+]
 
 
 @app.command()
@@ -96,7 +303,7 @@ def index(
     path: Annotated[
         Path,
         typer.Argument(help="Path to directory containing documents to index."),
-    ],
+    ] = None,
     chunk_size: Annotated[
         int,
         typer.Option("--chunk-size", help="Maximum characters per chunk."),
@@ -109,9 +316,71 @@ def index(
         bool,
         typer.Option("--fresh", help="Wipe existing index and rebuild from scratch."),
     ] = False,
+    ignore: Annotated[
+        list[str],
+        typer.Option("--ignore", help="Gitignore-style pattern to skip (repeatable)."),
+    ] = None,
+    max_file_size: Annotated[
+        float,
+        typer.Option("--max-file-size", help="Skip files larger than this many MB (0 = no limit)."),
+    ] = None,
+    collection: Annotated[
+        str,
+        typer.Option("--collection", "-c", help="Collection to index into."),
+    ] = None,
+    resume: Annotated[
+        bool,
+        typer.Option("--resume", help="Continue the last interrupted run with its original options."),
+    ] = False,
+    workers: Annotated[
+        int,
+        typer.Option("--workers", "-w", help="Processes for loading and chunking documents."),
+    ] = 1,
+    profile: _ProfileOption = False,
+    trace_file: _TraceFileOption = None,
+    trace_format: _TraceFormatOption = "json",
+    ctx: typer.Context = None,
 ) -> None:
     """Index documents from a folder into the local vector store."""
     start = time.time()
+    _start_tracing(ctx, "index", profile, trace_file, trace_format)
+    usage_details = _track_usage(ctx, "index")
+
+    from rag_core.indexing.journal import RunJournal
+
+    settings = _get_settings()
+    _collection = collection if collection is not None else settings.collection
+
+    # Chunks are stored batch by batch and skipped when already present, so
+    # resuming re-runs the interrupted command without re-embedding finished
+    # batches. A --fresh run resumes into the shadow collection it started.
+    generations = _generations(settings)
+    journal = RunJournal.find_unfinished(_RUNS_DIR, collection=_collection)
+    shadow = None
+    if resume:
+        if journal is None:
+            print_error(f"No interrupted index run to resume for collection '{_collection}'.")
+            raise typer.Exit(code=1)
+        options = journal.data["options"]
+        if path is not None and path.absolute() != Path(journal.data["path"]).absolute():
+            print_error(f"The interrupted run indexed {journal.data['path']}, not {path}.")
+            raise typer.Exit(code=1)
+        path = Path(journal.data["path"])
+        chunk_size, chunk_overlap = options["chunk_size"], options["chunk_overlap"]
+        ignore, max_file_size = options["ignore"], options["max_file_size"]
+        fresh = options["fresh"]
+        if fresh:
+            shadow = options["shadow"]
+            if shadow != generations.building(_collection):
+                print_error(f"The rebuild into '{shadow}' was replaced by a newer one; run 'index --fresh' again.")
+                raise typer.Exit(code=1)
+        console.print(
+            f"[bold]Resuming[/bold] run {journal.data['run_id']} "
+            f"({journal.data['chunks_done']}/{journal.data['total_chunks']} chunk(s) stored)"
+        )
+    elif path is None:
+        print_error("Missing argument 'PATH'.")
+        raise typer.Exit(code=1)
 
     if not path.exists():
         print_error(f"Path does not exist: {path}")
@@ -121,87 +390,287 @@ def index(
         print_error(f"Path is not a directory: {path}")
         raise typer.Exit(code=1)
 
-    settings = _get_settings()
+    if workers < 1:
+        print_error(f"--workers must be at least 1, got {workers}")
+        raise typer.Exit(code=1)
+
     _chunk_size = chunk_size if chunk_size is not None else settings.chunk_size
     _chunk_overlap = chunk_overlap if chunk_overlap is not None else settings.chunk_overlap
+    _max_file_size = max_file_size if max_file_size is not None else settings.max_file_size_mb
 
-    from rag_core.loaders import load_documents
-
-    console.print(f"[bold]Scanning[/bold] {path}")
-    documents = load_documents(path)
+    usage_details.update(
+        collection=_collection,
+        embedding_model=settings.embedding_model,
+        chunk_size=_chunk_size,
+        chunk_overlap=_chunk_overlap,
+    )
 
-    if not documents:
-        print_error(f"No supported documents found in {path}")
+    # Each collection remembers how it was built; mixing models, chunking
+    # parameters or distance spaces in one collection would make its chunks
+    # incomparable. The profile name is informational only.
+    index_settings = {
+        "embedding_model": settings.embedding_model,
+        "chunk_size": _chunk_size,
+        "chunk_overlap": _chunk_overlap,
+        "space": settings.index_space,
+        "index_profile": settings.index_profile,
+        "vector_shards": settings.vector_shards,
+    }
+    # A --fresh rebuild goes to a new generation, so any settings are fine.
+    store = None if fresh else _open_store(settings, _collection)
+    recorded = {}
+    if store is not None:
+        # Collections built before shard counts were recorded: use their layout.
+        recorded = {"vector_shards": _num_shards(store), **store.get_settings()}
+    mismatched = [
+        f"{key}: {recorded[key]} -> {value}"
+        for key, value in index_settings.items()
+        if key in recorded and recorded[key] != value and key != "index_profile"
+    ]
+    if mismatched:
+        print_error(
+            f"Collection '{_collection}' was built with different settings "
+            f"({', '.join(mismatched)}). Use --fresh to rebuild it or choose another --collection."
+        )
         raise typer.Exit(code=1)
 
-    console.print(f"  Found {len(documents)} document(s)")
-
     from rag_core.chunking import RecursiveChunker
+    from rag_core.indexing import chunk_files
+    from rag_core.loaders import SUPPORTED_EXTENSIONS, scan_files
 
+    # The embedding model loads while files are scanned and chunked.
+    _warm_up(settings, embedding_model=settings.embedding_model)
+    console.print(f"[bold]Scanning[/bold] {path}")
+    files = scan_files(
+        path,
+        extensions=SUPPORTED_EXTENSIONS,
+        ignore_patterns=ignore or (),
+        max_file_size=int(_max_file_size * 1024 * 1024) if _max_file_size > 0 else None,
+    )
+    # Parsing and chunking run in worker processes; embedding and store
+    # writes stay in this one, which is the collection's only writer.
     chunker = RecursiveChunker(chunk_size=_chunk_size, chunk_overlap=_chunk_overlap)
+    loaded = chunk_files(files, chunker, workers=workers)
+    num_documents, all_chunks = loaded.documents, loaded.chunks
 
-    all_chunks: list[str] = []
-    all_ids: list[str] = []
-    all_metadatas: list[dict] = []
-
-    for doc in documents:
-        chunks = chunker.chunk(doc.content)
-        for i, chunk_text in enumerate(chunks):
-            all_chunks.append(chunk_text)
-            all_ids.append(_chunk_id(doc.source, i))
-            all_metadatas.append({"source": doc.source, "chunk_index": i})
+    if not num_documents:
+        print_error(f"No supported documents found in {path}")
+        raise typer.Exit(code=1)
 
+    console.print(f"  Found {num_documents} document(s)")
     console.print(f"  Created {len(all_chunks)} chunk(s)")
 
-    from rag_core.vectorstores import ChromaStore
-
-    persist_dir = Path(".rag-cli") / "chroma"
-    store = ChromaStore(persist_dir=persist_dir)
-
-    if fresh:
-        console.print("  [yellow]Wiping existing index (--fresh)[/yellow]")
-        store.reset()
+    if not resume:
+        if journal is not None:
+            journal.supersede()
+        if fresh:
+            shadow, abandoned = generations.begin_shadow(_collection)
+            if abandoned is not None:
+                _drop_collection(settings, abandoned)
+        journal = RunJournal.start(
+            _RUNS_DIR,
+            command="index",
+            path=str(path),
+            collection=_collection,
+            options={
+                "chunk_size": _chunk_size,
+                "chunk_overlap": _chunk_overlap,
+                "ignore": list(ignore or ()),
+                "max_file_size": _max_file_size,
+                "fresh": fresh,
+                "shadow": shadow,
+            },
+        )
+    usage_details.update(run_id=journal.data["run_id"])
+
+    # Rebuilds write into a shadow collection; queries keep using the current
+    # generation until the shadow is complete and swapped in.
+    if shadow is not None:
+        console.print(f"  [yellow]Rebuilding '{_collection}' into '{shadow}' (--fresh)[/yellow]")
+        store = _open_store(settings, _collection, physical=shadow)
+    store.set_settings(index_settings)
+    journal.update(total_chunks=len(all_chunks))
+
+    def complete() -> None:
+        journal.finish()
+        if shadow is None:
+            # This run superseded any unfinished rebuild, which can no longer be resumed.
+            abandoned = generations.abandon(_collection)
+            if abandoned is not None:
+                _drop_collection(settings, abandoned)
+        else:
+            retired = generations.promote(_collection, shadow)
+            if retired is not None:
+                _drop_collection(settings, retired)
+            console.print(f"  Swapped '{shadow}' in as '{_collection}' ('rag-cli rollback' restores the previous index)")
 
     existing = store.existing_ids()
-    new_indices = [i for i, cid in enumerate(all_ids) if cid not in existing]
+    new = all_chunks.select(i for i, cid in enumerate(all_chunks.ids) if cid not in existing)
 
-    if not new_indices:
+    if not new:
+        complete()
         print_success("All documents already indexed. Nothing to do.")
         raise typer.Exit(code=0)
 
-    new_chunks = [all_chunks[i] for i in new_indices]
-    new_ids = [all_ids[i] for i in new_indices]
-    new_metadatas = [all_metadatas[i] for i in new_indices]
+    new_chunks = new.chunks
 
     console.print(f"  Embedding {len(new_chunks)} new chunk(s)...")
 
     embedder = _create_embedder(settings)
 
+    from rag_core.embeddings.pipeline import PaddingStats, iter_embedding_batches
+
+    # Chunks are embedded in batches of similar length, so backends that pad
+    # to the longest text waste less compute. Each batch is stored as soon as
+    # it is embedded; a failure loses at most the batch in flight.
     batch_size = 100
-    all_embeddings: list[list[float]] = []
+    num_batches = -(-len(new_chunks) // batch_size)
     try:
-        for batch_start in track(range(0, len(new_chunks), batch_size), description="Embedding..."):
-            batch_end = min(batch_start + batch_size, len(new_chunks))
-            batch = new_chunks[batch_start:batch_end]
-            batch_embeddings = embedder.embed(batch)
-            all_embeddings.extend(batch_embeddings)
-    except Exception as e:
-        print_error(f"Embedding failed: {e}")
+        batches = iter_embedding_batches(embedder, new_chunks, batch_size)
+        for batch_number, (indices, vectors) in enumerate(
+            track(batches, total=num_batches, description="Embedding...")
+        ):
+            if batch_number == 0:
+                # Even a run that fails part-way changes the collection, so
+                # answers cached before it must not be served afterwards.
+                _mark_updated(store)
+            batch = new.select(indices)
+            store.add(ids=batch.ids, embeddings=vectors, documents=batch.chunks, metadatas=batch.metadatas)
+            journal.checkpoint(len(indices))
+    except (Exception, KeyboardInterrupt) as e:
+        journal.fail(str(e) or type(e).__name__)
+        print_error(
+            f"Embedding failed: {e}\n"
+            f"  {journal.data['chunks_done']} chunk(s) were saved. "
+            "Run 'rag-cli index --resume' to continue."
+        )
         raise typer.Exit(code=1)
-
-    store.add(
-        ids=new_ids,
-        embeddings=all_embeddings,
-        documents=new_chunks,
-        metadatas=new_metadatas,
-    )
+    # Bumped again, so answers cached while the run was in progress are dropped too.
+    _mark_updated(store)
+    complete()
 
     elapsed = time.time() - start
     print_index_summary(
-        num_documents=len(documents),
+        num_documents=num_documents,
         num_chunks=len(new_chunks),
         elapsed=elapsed,
+        padding=PaddingStats.for_texts(new_chunks, batch_size),
+    )
+
+
+@app.command()
+def watch(
+    path: Annotated[
+        Path,
+        typer.Argument(help="Directory to watch for document changes."),
+    ],
+    collection: Annotated[
+        str,
+        typer.Option("--collection", "-c", help="Collection to keep up to date."),
+    ] = None,
+    ignore: Annotated[
+        list[str],
+        typer.Option("--ignore", help="Gitignore-style pattern to skip (repeatable)."),
+    ] = None,
+    max_file_size: Annotated[
+        float,
+        typer.Option("--max-file-size", help="Skip files larger than this many MB (0 = no limit)."),
+    ] = None,
+    debounce: Annotated[
+        float,
+        typer.Option("--debounce", help="Seconds to let a burst of changes settle before indexing it."),
+    ] = 1.0,
+    poll: Annotated[
+        bool,
+        typer.Option("--poll", help="Poll file stats instead of using file system events."),
+    ] = False,
+) -> None:
+    """Re-index documents as they change, until interrupted."""
+    if not path.is_dir():
+        print_error(f"Path is not a directory: {path}")
+        raise typer.Exit(code=1)
+
+    settings = _get_settings()
+    _max_file_size = max_file_size if max_file_size is not None else settings.max_file_size_mb
+    _collection = collection if collection is not None else settings.collection
+
+    from rag_core.chunking import RecursiveChunker
+    from rag_core.indexing import Indexer, watch_changes
+
+    def open_generation(physical: str):
+        """Open a generation of the collection with an indexer matching how it was built."""
+        store = _open_store(settings, _collection, physical=physical)
+        # Updates must match the chunks already in the collection, so its
+        # recorded chunking and embedding model take precedence over settings.
+        recorded = store.get_settings()
+        if not recorded:
+            recorded = {
+                "embedding_model": settings.embedding_model,
+                "chunk_size": settings.chunk_size,
+                "chunk_overlap": settings.chunk_overlap,
+                "space": settings.index_space,
+                "index_profile": settings.index_profile,
+                "vector_shards": _num_shards(store),
+            }
+            store.set_settings(recorded)
+        _warm_up(settings, embedding_model=recorded["embedding_model"])
+        embedder = _create_embedder(settings.model_copy(update={"embedding_model": recorded["embedding_model"]}))
+        chunker = RecursiveChunker(chunk_size=recorded["chunk_size"], chunk_overlap=recorded["chunk_overlap"])
+        return store, Indexer(store, embedder, chunker)
+
+    generations = _generations(settings)
+    physical = generations.active(_collection)
+    store, indexer = open_generation(physical)
+
+    console.print(f"[bold]Watching[/bold] {path} for collection '{_collection}' (Ctrl+C to stop)")
+    if store.count() == 0:
+        console.print(f"  Collection is empty; run 'rag-cli index {path}' to index existing files.")
+
+    from rag_cli.console import print_watch_update
+
+    changes_iter = watch_changes(
+        path,
+        debounce=debounce,
+        ignore_patterns=ignore or (),
+        max_file_size=int(_max_file_size * 1024 * 1024) if _max_file_size > 0 else None,
+        poll=True if poll else None,
     )
+    # Changes made while a rebuild (index --fresh) is running may be missed
+    # by its scan; they are replayed into the new generation once it is swapped in.
+    pending_updated: set[Path] = set()
+    pending_removed: set[Path] = set()
+    try:
+        for changes in changes_iter:
+            updated, removed = set(changes.updated), set(changes.removed)
+            active = generations.active(_collection)
+            if active != physical:
+                close = getattr(store, "close", None)
+                if close is not None:
+                    close()
+                physical = active
+                store, indexer = open_generation(physical)
+                console.print(f"  Collection '{_collection}' is now served by '{physical}'; following it")
+            # A failed rebuild that never created its shadow is not running.
+            building = generations.building(_collection)
+            rebuilding = building is not None and building in _physical_collections(settings)
+            if not rebuilding:
+                # Replaying into a generation that already has the changes is harmless.
+                updated |= {p for p in pending_updated if p.exists()} - removed
+                removed |= ({p for p in pending_updated if not p.exists()} | pending_removed) - updated
+            try:
+                result = indexer.sync(sorted(updated), sorted(removed))
+            except Exception as e:
+                print_error(f"Update failed: {e}")
+                continue
+            _mark_updated(store)
+            print_watch_update(result)
+            if rebuilding:
+                pending_updated = (pending_updated - removed) | updated
+                pending_removed = (pending_removed - updated) | removed
+            else:
+                pending_updated, pending_removed = set(), set()
+    except KeyboardInterrupt:
+        console.print("Stopped watching.")
 
 
 @app.command()
@@ -209,37 +678,168 @@ def ask(
     question: Annotated[
         str,
         typer.Argument(help="The question to ask about your documents."),
-    ],
+    ] = None,
     top_k: Annotated[
         int,
         typer.Option("--top-k", help="Number of relevant chunks to retrieve."),
     ] = None,
+    collection: Annotated[
+        list[str],
+        typer.Option("--collection", "-c", help="Collection to search (repeatable)."),
+    ] = None,
+    source: Annotated[
+        list[str],
+        typer.Option("--source", help="Only search sources matching this glob, file or directory (repeatable)."),
+    ] = None,
+    ext: Annotated[
+        list[str],
+        typer.Option("--ext", help="Only search files with this extension, e.g. .md (repeatable)."),
+    ] = None,
+    modified_after: Annotated[
+        str,
+        typer.Option("--modified-after", help="Only search files modified on or after this date (YYYY-MM-DD)."),
+    ] = None,
+    batch: Annotated[
+        Path,
+        typer.Option("--batch", help='Answer every question in a JSONL file of {"question": ..., "id": ...}.'),
+    ] = None,
+    output: Annotated[
+        Path,
+        typer.Option("--output", "-o", help="JSONL results file for --batch (default: <batch>.answers.jsonl)."),
+    ] = None,
+    concurrency: Annotated[
+        int,
+        typer.Option("--concurrency", help="Answers generated in parallel with --batch."),
+    ] = None,
+    use_cache: Annotated[
+        bool,
+        typer.Option("--cache/--no-cache", help="Reuse answers to similar questions (when RAG_CLI_SEMANTIC_CACHE is on)."),
+    ] = True,
+    profile: _ProfileOption = False,
+    trace_file: _TraceFileOption = None,
+    trace_format: _TraceFormatOption = "json",
+    ctx: typer.Context = None,
 ) -> None:
     """Ask a question about your indexed documents."""
-    persist_dir = Path(".rag-cli") / "chroma"
+    _start_tracing(ctx, "ask", profile, trace_file, trace_format)
+    usage_details = _track_usage(ctx, "ask")
+    settings = _get_settings()
 
-    if not persist_dir.exists():
+    if (question is None) == (batch is None):
+        print_error("Pass either a question or --batch <questions.jsonl>.")
+        raise typer.Exit(code=1)
+
+    if not _store_dir(settings).exists():
         print_error("No index found. Run 'rag-cli index <path>' first.")
         raise typer.Exit(code=1)
 
-    settings = _get_settings()
     _top_k = top_k if top_k is not None else settings.top_k
+    _collections = collection or [settings.collection]
+    where = _build_filter(source, ext, modified_after)
 
     from rag_core.retrieval import SimilarityRetriever
-    from rag_core.vectorstores import ChromaStore
 
-    store = ChromaStore(persist_dir=persist_dir)
+    available = _list_collections(settings)
+    missing = [name for name in _collections if name not in available]
+    if missing:
+        print_error(f"Collection(s) not found: {', '.join(missing)}. Run 'rag-cli collections' to list them.")
+        raise typer.Exit(code=1)
 
-    if store.count() == 0:
+    stores = [_open_store(settings, name) for name in _collections]
+
+    if sum(store.count() for store in stores) == 0:
         print_error("Index is empty. Run 'rag-cli index <path>' first.")
         raise typer.Exit(code=1)
 
+    # Queries must be embedded with the model the collections were built with.
+    recorded = [store.get_settings() for store in stores]
+    models = {r.get("embedding_model") for r in recorded} - {None}
+    if len(models) > 1:
+        print_error(
+            f"Collections were indexed with different embedding models ({', '.join(sorted(models))}); "
+            "query them separately."
+        )
+        raise typer.Exit(code=1)
+    # Results are merged by distance, which is only comparable within one distance space.
+    # Collections without a recorded space predate index profiles and use Chroma's default, l2.
+    spaces = {r.get("space", "l2") for r in recorded}
+    if len(spaces) > 1:
+        print_error(
+            f"Collections use different distance spaces ({', '.join(sorted(spaces))}), "
+            "so their results cannot be merged; query them separately."
+        )
+        raise typer.Exit(code=1)
+    if models:
+        settings = settings.model_copy(update={"embedding_model": models.pop()})
+    usage_details.update(
+        collection=",".join(_collections),
+        model=settings.model,
+        embedding_model=settings.embedding_model,
+        top_k=_top_k,
+    )
+
+    _warm_up(settings, embedding_model=settings.embedding_model)
     embedder = _create_embedder(settings)
-    retriever = SimilarityRetriever(embedder=embedder, store=store)
+    retriever = SimilarityRetriever(embedder=embedder, store=stores)
+
+    if batch is not None:
+        _warm_up(settings, model=settings.model)
+        _ask_batch(
+            batch,
+            output,
+            retriever,
+            _create_llm_provider(settings),
+            top_k=_top_k,
+            where=where,
+            concurrency=concurrency if concurrency is not None else settings.ask_concurrency,
+        )
+        return
+
+    from rag_cli.console import print_answer
+
+    # Answers are reused only while the collections (active generation and
+    # revision), models, top_k and filters are unchanged.
+    cache = scope = query_embedding = None
+    if settings.semantic_cache and use_cache:
+        from rag_core.generation import SemanticCache, cache_scope
+
+        try:
+            cache = SemanticCache(_ANSWER_CACHE, threshold=settings.semantic_cache_threshold)
+        except ValueError as e:
+            print_error(str(e))
+            raise typer.Exit(code=1)
+        generations = _generations(settings)
+        scope = cache_scope(
+            collections=[
+                (generations.active(name), store.get_settings().get("revision"))
+                for name, store in zip(_collections, stores)
+            ],
+            embedding_model=settings.embedding_model,
+            model=settings.model,
+            top_k=_top_k,
+            where=where,
+        )
 
     console.print("[bold]Searching[/bold] for relevant context...")
     try:
-        results = retriever.retrieve(question, top_k=_top_k)
+        if cache is None:
+            # The generation model loads while the question is embedded and searched.
+            _warm_up(settings, model=settings.model)
+            results = retriever.retrieve(question, top_k=_top_k, where=where)
+        else:
+            query_embedding = embedder.embed([question])[0]
+            hit = cache.lookup(scope, query_embedding)
+            if hit is not None:
+                usage_details.update(cache="hit")
+                console.print(
+                    f"  [dim]Cached answer to a similar question ({hit.similarity:.1%} similar): "
+                    f"{hit.question}[/dim]"
+                )
+                print_answer(hit.answer, hit.sources)
+                return
+            # Only a cache miss needs the generation model; it loads during the search.
+            _warm_up(settings, model=settings.model)
+            results = retriever.retrieve_embedding(query_embedding, top_k=_top_k, where=where)
     except Exception as e:
         print_error(f"Retrieval failed: {e}")
         raise typer.Exit(code=1)
@@ -248,39 +848,385 @@ def ask(
         print_error("No relevant documents found for your question.")
         raise typer.Exit(code=1)
 
-    context_parts = []
-    for i, result in enumerate(results, 1):
-        source = result.metadata.get("source", "unknown")
-        context_parts.append(f"[Source {i}: {source}]\n{result.document}")
-    context = "\n\n---\n\n".join(context_parts)
+    from rag_core.generation import SYSTEM_BLOCKS, build_prompt_blocks, is_no_answer, order_for_reuse
 
     provider = _create_llm_provider(settings)
 
-    system_prompt = (
-        "You are a helpful assistant that answers questions based ONLY on the provided context. "
-        "If the context does not contain enough information to answer the question, say "
-        "'I don't have enough information in the provided documents to answer this question.' "
-        "Do not use any knowledge outside the provided context. "
-        "Cite the source numbers [Source N] when referencing information."
-    )
-
-    user_prompt = f"""Context:
-{context}
-
-Question: {question}
-
-Answer based ONLY on the context above."""
-
+    # A canonical chunk order keeps the prompt prefix stable for the provider's prompt cache.
+    results = order_for_reuse(results)
     console.print("[bold]Generating[/bold] answer...")
     try:
-        response = provider.generate(user_prompt, system=system_prompt)
+        response = provider.generate(build_prompt_blocks(question, results), system=SYSTEM_BLOCKS)
     except Exception as e:
         print_error(f"Generation failed: {e}")
         raise typer.Exit(code=1)
 
-    from rag_cli.console import print_answer
-
     # Suppress sources when the model couldn't answer from context
-    no_info = "don't have enough information" in response.text.lower()
+    no_info = is_no_answer(response.text)
     sources = [] if no_info else [result.metadata for result in results]
+    if cache is not None and not no_info:
+        cache.store(scope, question, query_embedding, response.text, sources)
     print_answer(response.text, sources)
+
+
+def _ask_batch(batch: Path, output: Path | None, retriever, provider, *, top_k, where, concurrency: int) -> None:
+    """Answer a file of questions, writing one JSON line per question in input order."""
+    import json
+
+    from rag_core.generation import answer_batch, load_batch_questions
+
+    try:
+        questions = load_batch_questions(batch)
+    except (OSError, ValueError) as e:
+        print_error(f"Could not read questions: {e}")
+        raise typer.Exit(code=1)
+    if not questions:
+        print_error(f"No questions found in {batch}")
+        raise typer.Exit(code=1)
+    if concurrency < 1:
+        print_error(f"--concurrency must be at least 1, got {concurrency}")
+        raise typer.Exit(code=1)
+
+    output = output or batch.with_name(f"{batch.stem}.answers.jsonl")
+    start = time.perf_counter()
+    failed = input_tokens = output_tokens = 0
+    console.print(f"[bold]Answering[/bold] {len(questions)} question(s), {concurrency} at a time")
+    try:
+        with output.open("w", encoding="utf-8") as f:
+            answers = answer_batch(questions, retriever, provider, top_k=top_k, where=where, concurrency=concurrency)
+            for answer in track(answers, total=len(questions), description="Answering..."):
+                f.write(json.dumps(answer.to_dict(), ensure_ascii=False) + "\n")
+                f.flush()
+                failed += answer.error is not None
+                input_tokens += answer.input_tokens
+                output_tokens += answer.output_tokens
+    except Exception as e:
+        print_error(f"Batch failed: {e}")
+        raise typer.Exit(code=1)
+
+    elapsed = time.perf_counter() - start
+    summary = (
+        f"Wrote {len(questions)} answer(s) to {output} in {elapsed:.1f}s "
+        f"({input_tokens:,} input / {output_tokens:,} output tokens)"
+    )
+    if failed:
+        print_error(f"{failed} question(s) failed; see the 'error' field. {summary}")
+        raise typer.Exit(code=1)
+    print_success(summary)
+
+
+@app.command(name="eval")
+def eval_(
+    questions_file: Annotated[
+        Path,
+        typer.Argument(help='JSONL file of {"question": ..., "source": ...} pairs.'),
+    ],
+    collection: Annotated[
+        list[str],
+        typer.Option("--collection", "-c", help="Collection to evaluate (repeatable, compared side by side)."),
+    ] = None,
+    top_k: Annotated[
+        list[int],
+        typer.Option("--top-k", help="Number of chunks to retrieve (repeatable)."),
+    ] = None,
+    batch_size: Annotated[
+        int,
+        typer.Option("--batch-size", help="Questions embedded and searched per batch."),
+    ] = 16,
+    latency: Annotated[
+        bool,
+        typer.Option("--latency", help="Also time each question on its own (embeds every question twice)."),
+    ] = False,
+) -> None:
+    """Measure retrieval recall@k, MRR and latency on a labelled question set."""
+    settings = _get_settings()
+
+    if not _store_dir(settings).exists():
+        print_error("No index found. Run 'rag-cli index <path>' first.")
+        raise typer.Exit(code=1)
+
+    from rag_core.evaluation import evaluate_retriever, load_questions
+    from rag_core.retrieval import SimilarityRetriever
+
+    try:
+        questions = load_questions(questions_file)
+    except (OSError, ValueError) as e:
+        print_error(f"Could not read questions: {e}")
+        raise typer.Exit(code=1)
+    if not questions:
+        print_error(f"No questions found in {questions_file}")
+        raise typer.Exit(code=1)
+
+    _collections = collection or [settings.collection]
+    _top_ks = top_k or [settings.top_k]
+    available = _list_collections(settings)
+    missing = [name for name in _collections if name not in available]
+    if missing:
+        print_error(f"Collection(s) not found: {', '.join(missing)}. Run 'rag-cli collections' to list them.")
+        raise typer.Exit(code=1)
+
+    console.print(f"[bold]Evaluating[/bold] {len(questions)} question(s)")
+    rows = []
+    for name in _collections:
+        store = _open_store(settings, name)
+        index_settings = store.get_settings()
+        # Embed questions with the model this collection was built with.
+        model = index_settings.get("embedding_model", settings.embedding_model)
+        embedder = _create_embedder(settings.model_copy(update={"embedding_model": model}))
+        retriever = SimilarityRetriever(embedder=embedder, store=store)
+        for k in _top_ks:
+            try:
+                report = evaluate_retriever(
+                    retriever, questions, top_k=k, batch_size=batch_size, name=name, time_each=latency
+                )
+            except ValueError as e:
+                print_error(str(e))
+                raise typer.Exit(code=1)
+            except Exception as e:
+                print_error(f"Retrieval failed: {e}")
+                raise typer.Exit(code=1)
+            rows.append((report, index_settings))
+
+    from rag_cli.console import print_evaluation
+
+    print_evaluation(rows)
+
+
+@app.command()
+def collections() -> None:
+    """List indexed collections with their document counts and settings."""
+    settings = _get_settings()
+
+    if not _store_dir(settings).exists():
+        print_error("No index found. Run 'rag-cli index <path>' first.")
+        raise typer.Exit(code=1)
+
+    from rag_cli.console import print_collections
+
+    rows = []
+    for name in _list_collections(settings):
+        store = _open_store(settings, name)
+        rows.append((name, store.count(), store.get_settings()))
+    print_collections(rows)
+
+
+@app.command()
+def rollback(
+    collection: Annotated[
+        str,
+        typer.Option("--collection", "-c", help="Collection to roll back."),
+    ] = None,
+) -> None:
+    """Swap a collection back to the index it had before the last --fresh rebuild."""
+    settings = _get_settings()
+    _collection = collection if collection is not None else settings.collection
+
+    try:
+        active = _generations(settings).rollback(_collection)
+    except ValueError as e:
+        print_error(str(e))
+        raise typer.Exit(code=1)
+    print_success(f"Collection '{_collection}' now served by '{active}'. Run rollback again to undo.")
+
+
+@app.command(name="export")
+def export_(
+    output: Annotated[
+        Path,
+        typer.Argument(help="Snapshot file to write (e.g. docs.zip)."),
+    ],
+    collection: Annotated[
+        str,
+        typer.Option("--collection", "-c", help="Collection to export."),
+    ] = None,
+    dtype: Annotated[
+        str,
+        typer.Option("--dtype", help="Vector precision: float16 (half the size) or float32."),
+    ] = "float16",
+) -> None:
+    """Export a collection as a portable snapshot, without embedding anything."""
+    settings = _get_settings()
+    _collection = collection if collection is not None else settings.collection
+
+    if _collection not in _list_collections(settings):
+        print_error(f"Collection not found: {_collection}. Run 'rag-cli collections' to list them.")
+        raise typer.Exit(code=1)
+
+    from rag_core.vectorstores import export_snapshot
+
+    store = _open_store(settings, _collection)
+    console.print(f"[bold]Exporting[/bold] {store.count()} chunk(s) from '{_collection}'")
+    try:
+        manifest = export_snapshot(store, output, dtype=dtype, collection=_collection)
+    except (OSError, ValueError) as e:
+        print_error(f"Export failed: {e}")
+        raise typer.Exit(code=1)
+    size_mb = output.stat().st_size / (1024 * 1024)
+    print_success(f"Wrote {manifest.count} chunk(s) ({manifest.dim}-d {manifest.dtype}) to {output} ({size_mb:.1f} MB)")
+
+
+@app.command(name="import")
+def import_(
+    snapshot: Annotated[
+        Path,
+        typer.Argument(help="Snapshot file written by 'rag-cli export'."),
+    ],
+    collection: Annotated[
+        str,
+        typer.Option("--collection", "-c", help="Collection to load into (default: the exported collection's name)."),
+    ] = None,
+) -> None:
+    """Load a snapshot into a collection, replacing its contents atomically."""
+    import zipfile
+
+    from rag_core.vectorstores import import_snapshot, read_manifest
+
+    settings = _get_settings()
+    try:
+        manifest = read_manifest(snapshot)
+    except (OSError, KeyError, TypeError, ValueError, zipfile.BadZipFile) as e:
+        print_error(f"Not a valid snapshot: {snapshot} ({e})")
+        raise typer.Exit(code=1)
+    _collection = collection or manifest.collection or settings.collection
+
+    # The snapshot's distance space decides how its vectors are compared.
+    if "space" in manifest.settings:
+        settings = settings.model_copy(update={"index_space": manifest.settings["space"]})
+
+    # Like a --fresh rebuild, the snapshot is loaded into a new generation and
+    # swapped in once complete, so queries never see a partial collection.
+    generations = _generations(settings)
+    shadow, abandoned = generations.begin_shadow(_collection)
+    if abandoned is not None:
+        _drop_collection(settings, abandoned)
+    store = _open_store(settings, _collection, physical=shadow)
+
+    console.print(f"[bold]Importing[/bold] {manifest.count} chunk(s) into '{_collection}'")
+    try:
+        import_snapshot(snapshot, store)
+        # The snapshot records the exporting collection's layout, not this one's.
+        store.set_settings({"vector_shards": _num_shards(store)})
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile) as e:
+        print_error(f"Import failed: {e}")
+        raise typer.Exit(code=1)
+    retired = generations.promote(_collection, shadow)
+    if retired is not None:
+        _drop_collection(settings, retired)
+    print_success(
+        f"Imported {manifest.count} chunk(s) into '{_collection}' "
+        f"(embedding model: {manifest.settings.get('embedding_model', 'unknown')})"
+    )
+
+
+@app.command()
+def stats(
+    by: Annotated[
+        str,
+        typer.Option("--by", help="Group by model, command, or a logged setting (collection, top_k, chunk_size...)."),
+    ] = "model",
+    since: Annotated[
+        str,
+        typer.Option("--since", help="Only include runs on or after this date (YYYY-MM-DD)."),
+    ] = None,
+) -> None:
+    """Show token usage, estimated cost and time from the local usage log."""
+    from datetime import datetime
+
+    from llm_core.usage import read_usage_log, summarize_usage
+
+    entries = read_usage_log(_USAGE_LOG)
+    if since is not None:
+        try:
+            cutoff = datetime.fromisoformat(since).timestamp()
+        except ValueError:
+            print_error(f"Invalid --since date: {since!r} (expected YYYY-MM-DD).")
+            raise typer.Exit(code=1)
+        entries = [e for e in entries if e.get("timestamp", 0) >= cutoff]
+
+    if not entries:
+        console.print("No usage recorded yet.")
+        return
+
+    from rag_cli.console import print_usage_stats
+
+    print_usage_stats(summarize_usage(entries, by=by), by=by, runs=len(entries))
+
+
+@app.command()
+def bench(
+    collection: Annotated[
+        str,
+        typer.Option("--collection", "-c", help="Collection whose embeddings to benchmark."),
+    ] = None,
+    profile: Annotated[
+        list[str],
+        typer.Option("--profile", help="Index profile to benchmark (repeatable, default: all)."),
+    ] = None,
+    queries: Annotated[
+        int,
+        typer.Option("--queries", help="Number of held-out vectors used as queries."),
+    ] = 100,
+    top_k: Annotated[
+        int,
+        typer.Option("--top-k", help="Recall is measured at this k."),
+    ] = 10,
+    sample: Annotated[
+        int,
+        typer.Option("--sample", help="Maximum number of stored vectors to load."),
+    ] = 20000,
+) -> None:
+    """Benchmark recall vs. latency of index profiles and quantized storage against exact search."""
+    settings = _get_settings()
+
+    if not _store_dir(settings).exists():
+        print_error("No index found. Run 'rag-cli index <path>' first.")
+        raise typer.Exit(code=1)
+
+    _collection = collection if collection is not None else settings.collection
+
+    import numpy as np
+
+    from rag_core.evaluation import benchmark_profiles, benchmark_quantization
+    from rag_core.vectorstores import INDEX_PROFILES, QUANTIZATIONS, get_profile
+
+    if _collection not in _list_collections(settings):
+        print_error(f"Collection not found: {_collection}. Run 'rag-cli collections' to list them.")
+        raise typer.Exit(code=1)
+
+    store = _open_store(settings, _collection)
+    space = store.get_settings().get("space", settings.index_space)
+    try:
+        profiles = {name: get_profile(name, space) for name in (profile or INDEX_PROFILES)}
+    except ValueError as e:
+        print_error(str(e))
+        raise typer.Exit(code=1)
+
+    console.print(f"[bold]Loading[/bold] up to {sample} vectors from '{_collection}'")
+    batches = []
+    loaded = 0
+    for batch in store.iter_records(batch_size=min(sample, 5000)):
+        batches.append(batch.embeddings[: sample - loaded])
+        loaded += len(batches[-1])
+        if loaded >= sample:
+            break
+
+    if loaded <= queries:
+        print_error(f"Collection has {loaded} vectors; need more than --queries ({queries}).")
+        raise typer.Exit(code=1)
+
+    embeddings = np.concatenate(batches)
+    console.print(f"  Benchmarking {len(profiles)} profile(s) on {loaded} vectors ({space})...")
+    results = benchmark_profiles(embeddings, profiles, num_queries=queries, top_k=top_k)
+    console.print(f"  Benchmarking quantized storage ({', '.join(QUANTIZATIONS)})...")
+    results += benchmark_quantization(
+        embeddings,
+        QUANTIZATIONS,
+        space=space,
+        rescore_factor=settings.quantization_rescore,
+        num_queries=queries,
+        top_k=top_k,
+    )[1:]
+
+    from rag_cli.console import print_benchmark
+
+    print_benchmark(results, top_k=top_k)
@@ -1,5 +1,7 @@
 """Rich console helpers for CLI output."""
 
+import time
+
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
@@ -36,13 +38,203 @@ def print_answer(answer: str, sources: list[dict]) -> None:
                 console.print(f"  [dim]•[/dim] {source_str} (chunk {chunk_id})")
 
 
-def print_index_summary(num_documents: int, num_chunks: int, elapsed: float) -> None:
-    """Print indexing summary."""
+def print_index_summary(num_documents: int, num_chunks: int, elapsed: float, padding=None) -> None:
+    """Print indexing summary, with the padding saved by length-bucketed batching if given."""
     table = Table(show_header=False, box=None)
     table.add_column(style="bold")
     table.add_column()
     table.add_row("Documents", str(num_documents))
     table.add_row("Chunks", str(num_chunks))
     table.add_row("Time", f"{elapsed:.1f}s")
+    if padding is not None and padding.saved > 0:
+        table.add_row(
+            "Batching",
+            f"{padding.saved:.0%} less padding by length (est. {padding.speedup:.2f}x faster embedding)",
+        )
     console.print()
     console.print(Panel(table, title="Indexing Complete", border_style="green"))
+
+
+def print_watch_update(result) -> None:
+    """Print one line per batch of re-indexed files."""
+    parts = []
+    if result.files_updated:
+        parts.append(f"{result.files_updated} file(s) updated")
+    if result.files_removed:
+        parts.append(f"{result.files_removed} removed")
+    stamp = time.strftime("%H:%M:%S")
+    console.print(
+        f"[dim]{stamp}[/dim]  {', '.join(parts) or 'no indexable changes'}: "
+        f"+{result.chunks_added} / -{result.chunks_removed} chunk(s) in {result.seconds:.1f}s"
+    )
+    for source, reason in result.skipped:
+        console.print(f"  [yellow]Skipped {source}: {reason}[/yellow]")
+
+
+def print_collections(rows: list[tuple[str, int, dict]]) -> None:
+    """Print a table of collections with their chunk counts and index settings."""
+    if not rows:
+        console.print("No collections found.")
+        return
+    table = Table(title="Collections")
+    table.add_column("Name", style="bold")
+    table.add_column("Chunks", justify="right")
+    table.add_column("Embedding model")
+    table.add_column("Chunk size", justify="right")
+    table.add_column("Overlap", justify="right")
+    for name, count, settings in rows:
+        table.add_row(
+            name,
+            str(count),
+            str(settings.get("embedding_model", "?")),
+            str(settings.get("chunk_size", "?")),
+            str(settings.get("chunk_overlap", "?")),
+        )
+    console.print(table)
+
+
+def print_benchmark(results: list, top_k: int) -> None:
+    """Print recall and latency for each benchmarked index profile."""
+    table = Table(title="Index Profiles")
+    table.add_column("Profile", style="bold")
+    table.add_column(f"Recall@{top_k}", justify="right")
+    table.add_column("p50", justify="right")
+    table.add_column("p95", justify="right")
+    table.add_column("Build", justify="right")
+    for r in results:
+        table.add_row(
+            r.name,
+            f"{r.recall:.3f}",
+            f"{r.p50_ms:.2f} ms",
+            f"{r.p95_ms:.2f} ms",
+            f"{r.build_seconds:.1f}s" if r.name != "exact" else "-",
+        )
+    console.print(table)
+
+
+def print_evaluation(rows: list[tuple]) -> None:
+    """Print retrieval quality and latency per collection and top_k, side by side."""
+    table = Table(title="Retrieval Evaluation")
+    table.add_column("Collection", style="bold")
+    table.add_column("Chunk size", justify="right")
+    table.add_column("Overlap", justify="right")
+    table.add_column("k", justify="right")
+    table.add_column("Recall@k", justify="right")
+    table.add_column("MRR", justify="right")
+    table.add_column("p50", justify="right")
+    table.add_column("p95", justify="right")
+    table.add_column("p99", justify="right")
+    for report, settings in rows:
+        table.add_row(
+            report.name,
+            str(settings.get("chunk_size", "?")),
+            str(settings.get("chunk_overlap", "?")),
+            str(report.top_k),
+            f"{report.recall:.3f}",
+            f"{report.mrr:.3f}",
+            f"{report.p50_ms:.1f} ms",
+            f"{report.p95_ms:.1f} ms",
+            f"{report.p99_ms:.1f} ms",
+        )
+    console.print(table)
+
+
+def _format_cost(cost: float | None) -> str:
+    return "-" if cost is None else f"${cost:.4f}"
+
+
+def _format_input_tokens(record) -> str:
+    """Input tokens, with prompt-cache reads and writes when there were any."""
+    text = f"{record.input_tokens:,}"
+    cached = [
+        f"{count:,} {label}"
+        for count, label in ((record.cache_read_tokens, "cache read"), (record.cache_write_tokens, "cache write"))
+        if count
+    ]
+    return f"{text} (+{', '.join(cached)})" if cached else text
+
+
+def print_usage(records: list) -> None:
+    """Print tokens and estimated cost of the provider calls made by a command."""
+    table = Table(title="Usage", title_justify="left", box=None)
+    table.add_column("Call", style="bold")
+    table.add_column("Model")
+    table.add_column("Calls", justify="right")
+    table.add_column("Input tokens", justify="right")
+    table.add_column("Output tokens", justify="right")
+    table.add_column("Time", justify="right")
+    table.add_column("Cost", justify="right")
+    for r in records:
+        table.add_row(
+            r.kind,
+            r.model,
+            str(r.calls),
+            _format_input_tokens(r),
+            f"{r.output_tokens:,}" if r.kind == "generate" else "-",
+            f"{r.seconds:.1f}s",
+            _format_cost(r.cost),
+        )
+    console.print()
+    console.print(table)
+
+
+def print_usage_stats(summaries: list, by: str, runs: int) -> None:
+    """Print logged usage aggregated per group."""
+    table = Table(title=f"Usage by {by} ({runs} run(s))")
+    table.add_column(by.replace("_", " ").capitalize(), style="bold")
+    table.add_column("Runs", justify="right")
+    table.add_column("Calls", justify="right")
+    table.add_column("Input tokens", justify="right")
+    table.add_column("Output tokens", justify="right")
+    table.add_column("Time", justify="right")
+    table.add_column("Cost", justify="right")
+    for s in summaries:
+        table.add_row(
+            s.group,
+            str(s.runs),
+            str(s.calls),
+            f"{s.input_tokens:,}",
+            f"{s.output_tokens:,}",
+            f"{s.seconds:.1f}s",
+            _format_cost(s.cost_usd),
+        )
+    table.add_row(
+        "Total",
+        str(runs),
+        str(sum(s.calls for s in summaries)),
+        f"{sum(s.input_tokens for s in summaries):,}",
+        f"{sum(s.output_tokens for s in summaries):,}",
+        f"{sum(s.seconds for s in summaries):.1f}s",
+        _format_cost(sum(s.cost_usd for s in summaries)),
+        style="bold",
+    )
+    console.print(table)
+
+
+# Span attributes worth showing in the profile table, in display order.
+_PROFILE_COUNTERS = (
+    "files", "bytes", "documents", "chars", "chunks", "texts", "tokens",
+    "rows", "results", "input_tokens", "output_tokens", "cache_read_tokens",
+    "load_seconds",
+)
+
+
+def print_profile(stages: list, total: float) -> None:
+    """Print time spent per pipeline stage with its counters."""
+    table = Table(title="Profile")
+    table.add_column("Stage", style="bold")
+    table.add_column("Calls", justify="right")
+    table.add_column("Time", justify="right")
+    table.add_column("%", justify="right")
+    table.add_column("Details")
+    for stage in stages:
+        details = ", ".join(
+            f"{key}={stage.counters[key]:,.2f}" if isinstance(stage.counters[key], float)
+            else f"{key}={stage.counters[key]:,}"
+            for key in _PROFILE_COUNTERS
+            if key in stage.counters
+        )
+        share = 100 * stage.seconds / total if total > 0 else 0.0
+        table.add_row(stage.name, str(stage.calls), f"{stage.seconds:.3f}s", f"{share:.1f}", details)
+    console.print()
+    console.print(table)
@@ -0,0 +1,37 @@
+"""Helpers for the float32 NumPy representation of embeddings."""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+Vectors = np.ndarray | Sequence[Sequence[float]]
+
+
+def as_matrix(vectors: Vectors) -> np.ndarray:
+    """Return vectors as a C-contiguous float32 matrix of shape (n, dim).
+
+    Accepts NumPy arrays (no copy when already float32 and contiguous)
+    as well as nested lists for backward compatibility.
+    """
+    matrix = np.ascontiguousarray(vectors, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(0, 0) if matrix.size == 0 else matrix.reshape(1, -1)
+    if matrix.ndim != 2:
+        raise ValueError(f"Expected a 2-D array of embeddings, got shape {matrix.shape}")
+    return matrix
+
+
+def as_vector(vector: np.ndarray | Sequence[float]) -> np.ndarray:
+    """Return a single embedding as a 1-D float32 array."""
+    return np.ascontiguousarray(vector, dtype=np.float32).reshape(-1)
+
+
+def normalize(matrix: np.ndarray) -> np.ndarray:
+    """Scale each row to unit length; zero rows are left as zeros."""
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    return matrix / np.maximum(norms, 1e-12)
+
+
+def cosine_similarity(queries: np.ndarray, vectors: np.ndarray) -> np.ndarray:
+    """Cosine similarity between every query row and every vector row."""
+    return normalize(np.atleast_2d(queries)) @ normalize(np.atleast_2d(vectors)).T
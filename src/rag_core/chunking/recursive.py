@@ -1,5 +1,7 @@
 """Recursive character text splitter."""
 
+from llm_core.tracing import span
+
 from rag_core.chunking.base import BaseChunker
 
 _SEPARATORS = ["\n\n", "\n", ". ", " ", ""]
@@ -22,7 +24,10 @@ class RecursiveChunker(BaseChunker):
         """Split text into overlapping chunks."""
         if not text.strip():
             return []
-        return self._split(text, _SEPARATORS)
+        with span("chunk", chars=len(text)) as s:
+            chunks = self._split(text, _SEPARATORS)
+            s.set(chunks=len(chunks))
+        return chunks
 
     def _split(self, text: str, separators: list[str]) -> list[str]:
         """Recursively split text using the given separators."""
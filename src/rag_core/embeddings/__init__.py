@@ -1,5 +1,16 @@
 from rag_core.embeddings.base import BaseEmbedder
+from rag_core.embeddings.local import LocalEmbedder
 from rag_core.embeddings.ollama import OllamaEmbedder
 from rag_core.embeddings.openai import OpenAIEmbedder
+from rag_core.embeddings.pipeline import PaddingStats, embed_by_length, iter_embedding_batches, length_buckets
 
-__all__ = ["BaseEmbedder", "OllamaEmbedder", "OpenAIEmbedder"]
+__all__ = [
+    "BaseEmbedder",
+    "LocalEmbedder",
+    "OllamaEmbedder",
+    "OpenAIEmbedder",
+    "PaddingStats",
+    "embed_by_length",
+    "iter_embedding_batches",
+    "length_buckets",
+]
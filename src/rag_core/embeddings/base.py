@@ -2,11 +2,13 @@
 
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 
 class BaseEmbedder(ABC):
     """Abstract interface for text embedding."""
 
     @abstractmethod
-    def embed(self, texts: list[str]) -> list[list[float]]:
-        """Generate embeddings for a list of texts."""
+    def embed(self, texts: list[str]) -> np.ndarray:
+        """Generate embeddings for a list of texts as a float32 (n, dim) array."""
         ...
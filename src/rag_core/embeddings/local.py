@@ -0,0 +1,96 @@
+"""In-process sentence-transformers embeddings for rag_core (optional dependency)."""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from llm_core.ratelimit import estimate_tokens
+from llm_core.tracing import span
+from llm_core.usage import UsageRecord, get_meter
+
+from rag_core.arrays import as_matrix
+from rag_core.embeddings.base import BaseEmbedder
+from rag_core.embeddings.pipeline import length_buckets
+
+_INSTALL_HINT = "Local embeddings need sentence-transformers: pip install 'rag-cli-tool[local]'"
+
+
+def _load_model(model_name: str, device: str, backend: str):
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError as e:
+        raise ImportError(_INSTALL_HINT) from e
+    if backend == "torch":
+        return SentenceTransformer(model_name, device=device)
+    return SentenceTransformer(model_name, device=device, backend=backend)
+
+
+class LocalEmbedder(BaseEmbedder):
+    """Embedder running a sentence-transformers model in this process.
+
+    Texts are sorted into length buckets so each batch is padded only to
+    similar lengths, and batches are encoded on a small thread pool (the
+    model's native kernels release the GIL).
+
+    Args:
+        model_name: Hugging Face model id or local path, e.g. "all-MiniLM-L6-v2".
+        batch_size: Texts per inference batch.
+        num_threads: Concurrent batches; 0 picks a value from the CPU count.
+        device: Torch device, usually "cpu".
+        backend: "torch", or "onnx" / "openvino" for exported models.
+        model: A preloaded model (anything with sentence-transformers' encode).
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        *,
+        batch_size: int = 32,
+        num_threads: int = 0,
+        device: str = "cpu",
+        backend: str = "torch",
+        model=None,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        self._model_name = model_name
+        self._batch_size = batch_size
+        self._num_threads = num_threads or min(4, os.cpu_count() or 1)
+        self._model = model if model is not None else _load_model(model_name, device, backend)
+        if model is None and backend == "torch" and device == "cpu":
+            # Split the cores between concurrent batches instead of oversubscribing them.
+            import torch
+
+            torch.set_num_threads(max(1, (os.cpu_count() or 1) // self._num_threads))
+
+    def _encode(self, batch: list[str]) -> np.ndarray:
+        return as_matrix(self._model.encode(batch, batch_size=len(batch), convert_to_numpy=True))
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        """Generate embeddings as a float32 (n, dim) array, in input order."""
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+        buckets = length_buckets(texts, self._batch_size)
+        with span("embed", provider="local", model=self._model_name, texts=len(texts), batches=len(buckets)):
+            start = time.perf_counter()
+            batches = [[texts[i] for i in bucket] for bucket in buckets]
+            if len(batches) == 1 or self._num_threads == 1:
+                results = [self._encode(batch) for batch in batches]
+            else:
+                with ThreadPoolExecutor(max_workers=self._num_threads) as pool:
+                    results = list(pool.map(self._encode, batches))
+
+            embeddings = np.empty((len(texts), results[0].shape[1]), dtype=np.float32)
+            for bucket, result in zip(buckets, results):
+                embeddings[bucket] = result
+        get_meter().record(
+            UsageRecord(
+                kind="embed",
+                provider="local",
+                model=self._model_name,
+                input_tokens=estimate_tokens(*texts),
+                seconds=time.perf_counter() - start,
+            )
+        )
+        return embeddings
@@ -1,7 +1,9 @@
 """Ollama embeddings adapter for rag_core."""
 
+import numpy as np
 from llm_core.providers.ollama import OllamaEmbeddingProvider
 
+from rag_core.arrays import as_matrix
 from rag_core.embeddings.base import BaseEmbedder
 
 
@@ -12,13 +14,13 @@ class OllamaEmbedder(BaseEmbedder):
         self._provider = provider
         self._batch_size = batch_size
 
-    def embed(self, texts: list[str]) -> list[list[float]]:
-        """Generate embeddings, batching if needed."""
+    def embed(self, texts: list[str]) -> np.ndarray:
+        """Generate embeddings as a float32 (n, dim) array, batching if needed."""
         if len(texts) <= self._batch_size:
-            return self._provider.embed(texts)
+            return as_matrix(self._provider.embed(texts))
 
-        all_vectors: list[list[float]] = []
-        for i in range(0, len(texts), self._batch_size):
-            batch = texts[i : i + self._batch_size]
-            all_vectors.extend(self._provider.embed(batch))
-        return all_vectors
+        batches = [
+            as_matrix(self._provider.embed(texts[i : i + self._batch_size]))
+            for i in range(0, len(texts), self._batch_size)
+        ]
+        return np.concatenate(batches)
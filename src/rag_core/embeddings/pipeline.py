@@ -0,0 +1,91 @@
+"""Length-bucketed batching for embedding many texts."""
+
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+
+import numpy as np
+
+from rag_core.arrays import as_matrix
+from rag_core.embeddings.base import BaseEmbedder
+
+
+def length_buckets(texts: list[str], batch_size: int) -> list[list[int]]:
+    """Group text indices into batches of similar length, longest first.
+
+    Models pad every text in a batch to its longest member, so batching
+    similar lengths together wastes far less compute on padding.
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]), reverse=True)
+    return [order[i : i + batch_size] for i in range(0, len(order), batch_size)]
+
+
+def padded_size(lengths: list[int], batches: Iterable[list[int]]) -> int:
+    """Total size of the batches once each is padded to its longest item."""
+    return sum(max(lengths[i] for i in batch) * len(batch) for batch in batches if batch)
+
+
+@dataclass(frozen=True)
+class PaddingStats:
+    """Padded batch size (in characters) with and without length bucketing."""
+
+    content: int
+    in_order: int
+    bucketed: int
+
+    @classmethod
+    def for_texts(cls, texts: list[str], batch_size: int) -> "PaddingStats":
+        lengths = [len(t) for t in texts]
+        in_order = [list(range(i, min(i + batch_size, len(texts)))) for i in range(0, len(texts), batch_size)]
+        return cls(
+            content=sum(lengths),
+            in_order=padded_size(lengths, in_order),
+            bucketed=padded_size(lengths, length_buckets(texts, batch_size)),
+        )
+
+    @property
+    def saved(self) -> float:
+        """Fraction of the in-order padded size avoided by bucketing."""
+        return 1.0 - self.bucketed / self.in_order if self.in_order else 0.0
+
+    @property
+    def speedup(self) -> float:
+        """Estimated embedding speedup for backends whose cost follows padded size."""
+        return self.in_order / self.bucketed if self.bucketed else 1.0
+
+
+def iter_embedding_batches(
+    embedder: BaseEmbedder, texts: list[str], batch_size: int = 100
+) -> Iterator[tuple[list[int], np.ndarray]]:
+    """Embed texts in length buckets, yielding (indices into texts, embeddings) per batch."""
+    for bucket in length_buckets(texts, batch_size):
+        yield bucket, as_matrix(embedder.embed([texts[i] for i in bucket]))
+
+
+def embed_by_length(
+    embedder: BaseEmbedder,
+    texts: list[str],
+    batch_size: int = 100,
+    *,
+    progress: Callable[[Iterable], Iterable] | None = None,
+) -> np.ndarray:
+    """Embed texts in length buckets and return the embeddings in input order.
+
+    Args:
+        embedder: Embedder called once per batch.
+        texts: Texts to embed.
+        batch_size: Texts per embedder call.
+        progress: Optional wrapper around the batch iterator, e.g. rich's track.
+    """
+    if not texts:
+        return np.empty((0, 0), dtype=np.float32)
+    batches = iter_embedding_batches(embedder, texts, batch_size)
+    if progress is not None:
+        batches = progress(batches)
+    embeddings: np.ndarray | None = None
+    for bucket, vectors in batches:
+        if embeddings is None:
+            embeddings = np.empty((len(texts), vectors.shape[1]), dtype=np.float32)
+        embeddings[bucket] = vectors
+    return embeddings
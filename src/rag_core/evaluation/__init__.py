@@ -0,0 +1,15 @@
+from rag_core.evaluation.ann import ProfileResult, benchmark_profiles, benchmark_quantization, exact_search
+from rag_core.evaluation.metrics import percentile
+from rag_core.evaluation.retrieval import EvalQuestion, RetrievalReport, evaluate_retriever, load_questions
+
+__all__ = [
+    "EvalQuestion",
+    "ProfileResult",
+    "RetrievalReport",
+    "benchmark_profiles",
+    "benchmark_quantization",
+    "evaluate_retriever",
+    "exact_search",
+    "load_questions",
+    "percentile",
+]
@@ -0,0 +1,193 @@
+"""Recall-vs-latency benchmarks of index profiles and quantized storage against exact search."""
+
+import tempfile
+import time
+import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+import chromadb
+import numpy as np
+
+from rag_core.arrays import as_matrix, normalize
+from rag_core.evaluation.metrics import percentile
+from rag_core.vectorstores.profiles import IndexProfile
+from rag_core.vectorstores.quantized import QuantizedStore
+
+_ADD_BATCH_SIZE = 5000
+
+
+@dataclass(frozen=True)
+class ProfileResult:
+    """Benchmark outcome for one profile (or for exact search)."""
+
+    name: str
+    recall: float
+    p50_ms: float
+    p95_ms: float
+    build_seconds: float
+
+
+def _distances(embeddings: np.ndarray, queries: np.ndarray, space: str) -> np.ndarray:
+    """Distances between every query and every embedding, using Chroma's definitions."""
+    if space == "cosine":
+        return 1.0 - normalize(queries) @ normalize(embeddings).T
+    if space == "ip":
+        return 1.0 - queries @ embeddings.T
+    # Squared L2, expanded so the work is a single matrix product.
+    sq = (embeddings * embeddings).sum(axis=1)
+    return sq[None, :] - 2.0 * (queries @ embeddings.T) + (queries * queries).sum(axis=1)[:, None]
+
+
+def exact_search(embeddings: np.ndarray, queries: np.ndarray, top_k: int, space: str = "l2") -> np.ndarray:
+    """Brute-force top_k row indices of embeddings for each query, nearest first."""
+    top_k = min(top_k, len(embeddings))
+    dist = _distances(embeddings, queries, space)
+    idx = np.argpartition(dist, top_k - 1, axis=1)[:, :top_k]
+    order = np.take_along_axis(dist, idx, axis=1).argsort(axis=1)
+    return np.take_along_axis(idx, order, axis=1)
+
+
+def _hold_out(embeddings: np.ndarray, num_queries: int, seed: int) -> tuple[np.ndarray, np.ndarray]:
+    """Split embeddings into (queries, base) with a random hold-out."""
+    embeddings = as_matrix(embeddings)
+    if len(embeddings) <= num_queries:
+        raise ValueError(f"Need more than {num_queries} vectors to benchmark, got {len(embeddings)}")
+    order = np.random.default_rng(seed).permutation(len(embeddings))
+    return embeddings[order[:num_queries]], embeddings[order[num_queries:]]
+
+
+def _exact_truth(
+    base: np.ndarray, queries: np.ndarray, top_k: int, spaces: Iterable[str]
+) -> tuple[dict[str, list[set[int]]], ProfileResult]:
+    """Ground-truth neighbours per space, plus the exact-search latency result."""
+    truth: dict[str, list[set[int]]] = {}
+    latencies: list[float] = []
+    for space in spaces:
+        rows = []
+        for q in queries:
+            start = time.perf_counter()
+            rows.append(set(exact_search(base, q[None, :], top_k, space)[0].tolist()))
+            latencies.append((time.perf_counter() - start) * 1000)
+        truth[space] = rows
+    exact = ProfileResult(
+        name="exact",
+        recall=1.0,
+        p50_ms=percentile(latencies, 50),
+        p95_ms=percentile(latencies, 95),
+        build_seconds=0.0,
+    )
+    return truth, exact
+
+
+def benchmark_profiles(
+    embeddings: np.ndarray,
+    profiles: dict[str, IndexProfile],
+    *,
+    num_queries: int = 100,
+    top_k: int = 10,
+    seed: int = 0,
+) -> list[ProfileResult]:
+    """Measure recall@top_k and query latency of each profile.
+
+    A random hold-out of num_queries vectors serves as queries; the rest is
+    indexed into a throwaway in-memory collection per profile. Exact search
+    over the same vectors is the ground truth and is reported first.
+    """
+    queries, base = _hold_out(embeddings, num_queries, seed)
+    top_k = min(top_k, len(base))
+    truth, exact = _exact_truth(base, queries, top_k, {p.space for p in profiles.values()} or {"l2"})
+    results = [exact]
+
+    client = chromadb.EphemeralClient()
+    ids = [str(i) for i in range(len(base))]
+    for name, profile in profiles.items():
+        collection_name = f"bench-{uuid.uuid4().hex[:12]}"
+        start = time.perf_counter()
+        collection = client.create_collection(name=collection_name, metadata=profile.to_metadata())
+        try:
+            for i in range(0, len(base), _ADD_BATCH_SIZE):
+                collection.add(ids=ids[i : i + _ADD_BATCH_SIZE], embeddings=base[i : i + _ADD_BATCH_SIZE])
+            build_seconds = time.perf_counter() - start
+
+            latencies: list[float] = []
+            hits = 0
+            for q, expected in zip(queries, truth[profile.space]):
+                start = time.perf_counter()
+                found = collection.query(query_embeddings=[q], n_results=top_k, include=[])
+                latencies.append((time.perf_counter() - start) * 1000)
+                hits += len(expected.intersection(int(i) for i in found["ids"][0]))
+        finally:
+            client.delete_collection(name=collection_name)
+
+        results.append(
+            ProfileResult(
+                name=name,
+                recall=hits / (len(queries) * top_k),
+                p50_ms=percentile(latencies, 50),
+                p95_ms=percentile(latencies, 95),
+                build_seconds=build_seconds,
+            )
+        )
+    return results
+
+
+def benchmark_quantization(
+    embeddings: np.ndarray,
+    quantizations: Iterable[str],
+    *,
+    space: str = "l2",
+    rescore_factor: int = 4,
+    num_queries: int = 100,
+    top_k: int = 10,
+    seed: int = 0,
+) -> list[ProfileResult]:
+    """Measure recall@top_k and query latency of QuantizedStore per quantization.
+
+    Uses the same hold-out and exact ground truth as benchmark_profiles,
+    which is reported first.
+    """
+    queries, base = _hold_out(embeddings, num_queries, seed)
+    top_k = min(top_k, len(base))
+    truth, exact = _exact_truth(base, queries, top_k, [space])
+    results = [exact]
+
+    ids = [str(i) for i in range(len(base))]
+    with tempfile.TemporaryDirectory() as tmp:
+        for quantization in quantizations:
+            start = time.perf_counter()
+            store = QuantizedStore(
+                persist_dir=Path(tmp),
+                collection=f"bench-{quantization}",
+                quantization=quantization,
+                space=space,
+                rescore_factor=rescore_factor,
+            )
+            try:
+                for i in range(0, len(base), _ADD_BATCH_SIZE):
+                    batch_ids = ids[i : i + _ADD_BATCH_SIZE]
+                    store.add(batch_ids, base[i : i + _ADD_BATCH_SIZE], [""] * len(batch_ids), [{}] * len(batch_ids))
+                store.query(queries[0], top_k=top_k)  # load codes before timing
+                build_seconds = time.perf_counter() - start
+
+                latencies: list[float] = []
+                hits = 0
+                for q, expected in zip(queries, truth[space]):
+                    start = time.perf_counter()
+                    found = store.query(q, top_k=top_k)
+                    latencies.append((time.perf_counter() - start) * 1000)
+                    hits += len(expected.intersection(int(r.id) for r in found))
+            finally:
+                store.close()
+
+            results.append(
+                ProfileResult(
+                    name=f"{quantization}+rescore",
+                    recall=hits / (len(queries) * top_k),
+                    p50_ms=percentile(latencies, 50),
+                    p95_ms=percentile(latencies, 95),
+                    build_seconds=build_seconds,
+                )
+            )
+    return results
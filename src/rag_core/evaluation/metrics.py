@@ -0,0 +1,12 @@
+"""Metrics shared by retrieval evaluations and benchmarks."""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Return the q-th percentile (0-100) of values, or 0.0 for no values."""
+    if len(values) == 0:
+        return 0.0
+    return float(np.percentile(values, q))
@@ -0,0 +1,139 @@
+"""Retrieval quality (recall@k, MRR) and latency over a labelled question set."""
+
+import json
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from rag_core.evaluation.metrics import percentile
+from rag_core.retrieval.base import BaseRetriever
+from rag_core.vectorstores.base import SearchResult
+
+
+@dataclass(frozen=True)
+class EvalQuestion:
+    """A question and the source files that should be retrieved for it."""
+
+    question: str
+    expected_sources: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class RetrievalReport:
+    """Quality and latency of one retriever configuration.
+
+    Latencies are per question: each batch's time divided by its size, or
+    single-question retrieve calls when evaluated with time_each.
+    """
+
+    name: str
+    top_k: int
+    questions: int
+    recall: float
+    mrr: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+
+def load_questions(path: Path) -> list[EvalQuestion]:
+    """Load questions from a JSONL file.
+
+    Each line is an object with a ``question`` and either a ``source``
+    string or a ``sources`` list. Blank lines are ignored.
+    """
+    questions: list[EvalQuestion] = []
+    for line_number, line in enumerate(Path(path).read_text(encoding="utf-8").splitlines(), 1):
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+            sources = item.get("sources") or [item["source"]]
+            if isinstance(sources, str):
+                sources = [sources]
+            questions.append(EvalQuestion(question=item["question"], expected_sources=tuple(sources)))
+        except (json.JSONDecodeError, KeyError, TypeError, AttributeError) as e:
+            raise ValueError(
+                f"{path}:{line_number}: expected {{\"question\": ..., \"source\": ...}} ({e})"
+            ) from None
+    return questions
+
+
+def source_matches(source: str, expected: str) -> bool:
+    """Check whether a stored source path refers to an expected source.
+
+    The expected path may be the full indexed path or any trailing part
+    of it (``guide.md`` matches ``docs/guide.md``).
+    """
+    source = source.replace("\\", "/")
+    expected = expected.replace("\\", "/").removeprefix("./")
+    return source == expected or source.endswith("/" + expected)
+
+
+def _score(results: list[SearchResult], expected: tuple[str, ...]) -> tuple[float, float]:
+    """Return (recall, reciprocal rank) of one question's results."""
+    sources = [r.metadata.get("source", "") for r in results]
+    found = sum(1 for e in expected if any(source_matches(s, e) for s in sources))
+    recall = found / len(expected) if expected else 0.0
+    for rank, source in enumerate(sources, 1):
+        if any(source_matches(source, e) for e in expected):
+            return recall, 1.0 / rank
+    return recall, 0.0
+
+
+def evaluate_retriever(
+    retriever: BaseRetriever,
+    questions: list[EvalQuestion],
+    *,
+    top_k: int = 3,
+    batch_size: int = 16,
+    name: str = "",
+    time_each: bool = False,
+) -> RetrievalReport:
+    """Run questions through a retriever in batches and score the results.
+
+    Each question's latency is its batch's time divided by the batch size.
+    That hides slow single questions, so with time_each every question is
+    also retrieved on its own and timed, at the cost of a second embedding
+    call per question.
+
+    Args:
+        retriever: Retriever under test.
+        questions: Labelled questions.
+        top_k: Number of chunks retrieved per question; recall is measured at this k.
+        batch_size: Questions per retrieve_batch call.
+        name: Label for the report.
+        time_each: Time single-question retrieve calls for the latency percentiles.
+    """
+    if batch_size <= 0:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+    recalls: list[float] = []
+    reciprocal_ranks: list[float] = []
+    latencies_ms: list[float] = []
+    for start in range(0, len(questions), batch_size):
+        batch = questions[start : start + batch_size]
+        started = time.perf_counter()
+        results = retriever.retrieve_batch([q.question for q in batch], top_k=top_k)
+        if not time_each:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            latencies_ms.extend([elapsed_ms / len(batch)] * len(batch))
+        for question, question_results in zip(batch, results):
+            recall, rr = _score(question_results, question.expected_sources)
+            recalls.append(recall)
+            reciprocal_ranks.append(rr)
+    for question in questions if time_each else []:
+        started = time.perf_counter()
+        retriever.retrieve(question.question, top_k=top_k)
+        latencies_ms.append((time.perf_counter() - started) * 1000)
+
+    n = len(questions)
+    return RetrievalReport(
+        name=name,
+        top_k=top_k,
+        questions=n,
+        recall=sum(recalls) / n if n else 0.0,
+        mrr=sum(reciprocal_ranks) / n if n else 0.0,
+        p50_ms=percentile(latencies_ms, 50),
+        p95_ms=percentile(latencies_ms, 95),
+        p99_ms=percentile(latencies_ms, 99),
+    )
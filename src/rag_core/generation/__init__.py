@@ -0,0 +1,28 @@
+from rag_core.generation.batch import BatchAnswer, BatchQuestion, answer_batch, load_batch_questions
+from rag_core.generation.cache import CachedAnswer, SemanticCache, cache_scope
+from rag_core.generation.prompts import (
+    SYSTEM_BLOCKS,
+    SYSTEM_PROMPT,
+    build_context,
+    build_prompt,
+    build_prompt_blocks,
+    is_no_answer,
+    order_for_reuse,
+)
+
+__all__ = [
+    "SYSTEM_BLOCKS",
+    "SYSTEM_PROMPT",
+    "BatchAnswer",
+    "BatchQuestion",
+    "CachedAnswer",
+    "SemanticCache",
+    "answer_batch",
+    "build_context",
+    "build_prompt",
+    "build_prompt_blocks",
+    "cache_scope",
+    "is_no_answer",
+    "load_batch_questions",
+    "order_for_reuse",
+]
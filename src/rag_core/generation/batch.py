@@ -0,0 +1,156 @@
+"""Answering many questions with bulk retrieval and concurrent generation."""
+
+import json
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from llm_core.providers.base import BaseLLMProvider
+from llm_core.tracing import span, submit_in_context
+
+from rag_core.generation.prompts import SYSTEM_BLOCKS, build_prompt_blocks, is_no_answer, order_for_reuse
+from rag_core.retrieval.base import BaseRetriever
+from rag_core.vectorstores.base import SearchResult
+from rag_core.vectorstores.filters import MetadataFilter
+
+
+@dataclass(frozen=True)
+class BatchQuestion:
+    """One question of a batch, with an optional caller-chosen id."""
+
+    question: str
+    id: str | None = None
+
+
+@dataclass
+class BatchAnswer:
+    """The answer to one batch question, or the error that prevented it.
+
+    retrieval_seconds is the question's share of its bulk retrieval call.
+    """
+
+    question: BatchQuestion
+    answer: str = ""
+    sources: list[dict] = field(default_factory=list)
+    model: str = ""
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    retrieval_seconds: float = 0.0
+    generation_seconds: float = 0.0
+    error: str | None = None
+
+    def to_dict(self) -> dict:
+        """JSON-serializable form, one line of the results file."""
+        return {
+            "id": self.question.id,
+            "question": self.question.question,
+            "answer": self.answer,
+            "sources": self.sources,
+            "model": self.model,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "cache_read_tokens": self.cache_read_tokens,
+            "retrieval_seconds": round(self.retrieval_seconds, 4),
+            "generation_seconds": round(self.generation_seconds, 4),
+            "error": self.error,
+        }
+
+
+def load_batch_questions(path: Path) -> list[BatchQuestion]:
+    """Load questions from a JSONL file.
+
+    Each line is an object with a ``question`` and an optional ``id``; other
+    keys (e.g. the ``source`` of eval files) are ignored. Blank lines are ignored.
+    """
+    questions: list[BatchQuestion] = []
+    for line_number, line in enumerate(Path(path).read_text(encoding="utf-8").splitlines(), 1):
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+            question_id = item.get("id")
+            questions.append(
+                BatchQuestion(question=str(item["question"]), id=None if question_id is None else str(question_id))
+            )
+        except (json.JSONDecodeError, KeyError, TypeError, AttributeError) as e:
+            raise ValueError(f'{path}:{line_number}: expected {{"question": ...}} ({e})') from None
+    return questions
+
+
+def _sources(results: list[SearchResult]) -> list[dict]:
+    return [
+        {
+            "source": r.metadata.get("source", "unknown"),
+            "chunk_index": r.metadata.get("chunk_index"),
+            "distance": round(float(r.distance), 6),
+        }
+        for r in results
+    ]
+
+
+def answer_batch(
+    questions: list[BatchQuestion],
+    retriever: BaseRetriever,
+    provider: BaseLLMProvider,
+    *,
+    top_k: int = 3,
+    where: MetadataFilter | None = None,
+    concurrency: int = 4,
+    retrieval_batch_size: int = 64,
+) -> Iterator[BatchAnswer]:
+    """Answer questions, yielding results in input order as they complete.
+
+    Questions are embedded and searched in bulk (retrieval_batch_size per
+    call); prompts are then generated concurrently by up to `concurrency`
+    threads, within the provider's shared rate limits and retries. A failed
+    generation is reported on its answer instead of stopping the batch.
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+    if retrieval_batch_size < 1:
+        raise ValueError(f"retrieval_batch_size must be at least 1, got {retrieval_batch_size}")
+
+    def generate(answer: BatchAnswer, results: list[SearchResult]) -> BatchAnswer:
+        if not results:
+            answer.error = "No relevant documents found"
+            return answer
+        results = order_for_reuse(results)
+        start = time.perf_counter()
+        try:
+            response = provider.generate(build_prompt_blocks(answer.question.question, results), system=SYSTEM_BLOCKS)
+        except Exception as e:
+            answer.error = f"Generation failed: {e}"
+            return answer
+        finally:
+            answer.generation_seconds = time.perf_counter() - start
+        answer.answer = response.text
+        answer.model = response.model
+        answer.input_tokens = response.input_tokens
+        answer.output_tokens = response.output_tokens
+        answer.cache_read_tokens = response.cache_read_tokens
+        answer.sources = [] if is_no_answer(response.text) else _sources(results)
+        return answer
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = []
+        try:
+            for start in range(0, len(questions), retrieval_batch_size):
+                batch = questions[start : start + retrieval_batch_size]
+                with span("batch.retrieve", questions=len(batch)):
+                    t0 = time.perf_counter()
+                    per_question = retriever.retrieve_batch([q.question for q in batch], top_k=top_k, where=where)
+                    share = (time.perf_counter() - t0) / len(batch)
+                for question, results in zip(batch, per_question, strict=True):
+                    answer = BatchAnswer(question=question, retrieval_seconds=share)
+                    futures.append(submit_in_context(pool, generate, answer, results))
+                # Hand back finished answers while later batches are retrieved.
+                while futures and futures[0].done():
+                    yield futures.pop(0).result()
+            for future in futures:
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
@@ -0,0 +1,116 @@
+"""Semantic cache of answers, keyed by question embeddings."""
+
+import hashlib
+import json
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from rag_core.arrays import as_vector, cosine_similarity
+
+
+@dataclass(frozen=True)
+class CachedAnswer:
+    """An earlier answer returned for a similar question."""
+
+    question: str
+    answer: str
+    sources: list[dict]
+    similarity: float
+    created: float
+
+
+def cache_scope(**parts) -> str:
+    """Digest of everything an answer depends on besides the question.
+
+    Pass the collections' identities (active generation and revision),
+    models, top_k and filters; answers are only reused within one scope, so
+    any change to the index or settings starts from an empty cache.
+    """
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, default=repr).encode()).hexdigest()
+
+
+class SemanticCache:
+    """Stores answered questions with their embeddings in a local SQLite file.
+
+    A lookup compares the new question's embedding with those cached in the
+    same scope and returns the closest answer if its cosine similarity
+    reaches the threshold, so rewordings of a question hit the cache.
+
+    Args:
+        path: SQLite file holding the cache.
+        threshold: Minimum cosine similarity (0-1] for a hit.
+        max_entries: Oldest entries beyond this count are evicted.
+    """
+
+    def __init__(self, path: Path, *, threshold: float = 0.95, max_entries: int = 10000) -> None:
+        if not 0 < threshold <= 1:
+            raise ValueError(f"threshold must be in (0, 1], got {threshold}")
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+        self._threshold = threshold
+        self._max_entries = max_entries
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS answers (
+                id INTEGER PRIMARY KEY,
+                scope TEXT NOT NULL,
+                question TEXT NOT NULL,
+                embedding BLOB NOT NULL,
+                answer TEXT NOT NULL,
+                sources TEXT NOT NULL,
+                created REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS answers_scope ON answers (scope);
+            """
+        )
+
+    def lookup(self, scope: str, embedding: np.ndarray | list[float]) -> CachedAnswer | None:
+        """Return the most similar cached answer in scope, if similar enough."""
+        rows = self._conn.execute(
+            "SELECT question, embedding, answer, sources, created FROM answers WHERE scope = ?", (scope,)
+        ).fetchall()
+        query = as_vector(embedding)
+        rows = [row for row in rows if len(row[1]) == query.nbytes]
+        if not rows:
+            return None
+        matrix = np.frombuffer(b"".join(row[1] for row in rows), dtype=np.float32).reshape(len(rows), -1)
+        similarities = cosine_similarity(query, matrix)[0]
+        best = int(np.argmax(similarities))
+        if similarities[best] < self._threshold:
+            return None
+        question, _, answer, sources, created = rows[best]
+        return CachedAnswer(
+            question=question,
+            answer=answer,
+            sources=json.loads(sources),
+            similarity=float(similarities[best]),
+            created=created,
+        )
+
+    def store(
+        self, scope: str, question: str, embedding: np.ndarray | list[float], answer: str, sources: list[dict]
+    ) -> None:
+        """Cache an answer, evicting the oldest entries beyond max_entries."""
+        with self._conn:
+            self._conn.execute(
+                "INSERT INTO answers (scope, question, embedding, answer, sources, created) VALUES (?, ?, ?, ?, ?, ?)",
+                (scope, question, as_vector(embedding).tobytes(), answer, json.dumps(sources), time.time()),
+            )
+            self._conn.execute(
+                "DELETE FROM answers WHERE id NOT IN (SELECT id FROM answers ORDER BY id DESC LIMIT ?)",
+                (self._max_entries,),
+            )
+
+    def clear(self) -> int:
+        """Delete every cached answer; returns how many there were."""
+        with self._conn:
+            return self._conn.execute("DELETE FROM answers").rowcount
+
+    def close(self) -> None:
+        self._conn.close()
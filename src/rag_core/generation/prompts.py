@@ -0,0 +1,63 @@
+"""Prompts for answering questions from retrieved context.
+
+Prompts are laid out for prefix caching: the fixed system prompt, then the
+retrieved context in a canonical order, then the question. Requests that
+retrieve the same chunks share everything but the question, which providers
+with prompt caching can then serve from cache.
+"""
+
+from llm_core.providers.base import ContentBlock, prompt_text
+
+from rag_core.vectorstores.base import SearchResult
+
+SYSTEM_PROMPT = (
+    "You are a helpful assistant that answers questions based ONLY on the provided context. "
+    "If the context does not contain enough information to answer the question, say "
+    "'I don't have enough information in the provided documents to answer this question.' "
+    "Do not use any knowledge outside the provided context. "
+    "Cite the source numbers [Source N] when referencing information."
+)
+
+NO_ANSWER_MARKER = "don't have enough information"
+
+# The system prompt as a cached block, the first prefix shared by every request.
+SYSTEM_BLOCKS = (ContentBlock(SYSTEM_PROMPT, cache=True),)
+
+
+def order_for_reuse(results: list[SearchResult]) -> list[SearchResult]:
+    """Sort retrieved chunks by source and position instead of by distance.
+
+    The same set of chunks then always yields the same context text, so
+    follow-up questions that retrieve them in another rank order still hit
+    the prompt cache. Reorder before numbering sources so citations match.
+    """
+    return sorted(
+        results, key=lambda r: (str(r.metadata.get("source", "")), r.metadata.get("chunk_index", 0), r.id)
+    )
+
+
+def build_context(results: list[SearchResult]) -> str:
+    """Number the retrieved chunks so the answer can cite them as [Source N]."""
+    parts = []
+    for i, result in enumerate(results, 1):
+        source = result.metadata.get("source", "unknown")
+        parts.append(f"[Source {i}: {source}]\n{result.document}")
+    return "\n\n---\n\n".join(parts)
+
+
+def build_prompt_blocks(question: str, results: list[SearchResult]) -> list[ContentBlock]:
+    """User prompt as a cached context block followed by the question."""
+    return [
+        ContentBlock(f"Context:\n{build_context(results)}", cache=True),
+        ContentBlock(f"Question: {question}\n\nAnswer based ONLY on the context above."),
+    ]
+
+
+def build_prompt(question: str, results: list[SearchResult]) -> str:
+    """User prompt asking the question over the retrieved chunks, as plain text."""
+    return prompt_text(build_prompt_blocks(question, results))
+
+
+def is_no_answer(text: str) -> bool:
+    """True if the model said the context did not contain the answer."""
+    return NO_ANSWER_MARKER in text.lower()
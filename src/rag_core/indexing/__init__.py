@@ -0,0 +1,21 @@
+from rag_core.indexing.chunks import ChunkSet, chunk_documents, chunk_id
+from rag_core.indexing.indexer import Indexer, SyncResult
+from rag_core.indexing.journal import RunJournal
+from rag_core.indexing.parallel import ChunkedFiles, chunk_files, partition, shard_of
+from rag_core.indexing.watch import FileChanges, coalesce_changes, watch_changes
+
+__all__ = [
+    "ChunkSet",
+    "ChunkedFiles",
+    "FileChanges",
+    "Indexer",
+    "RunJournal",
+    "SyncResult",
+    "chunk_documents",
+    "chunk_files",
+    "chunk_id",
+    "coalesce_changes",
+    "partition",
+    "shard_of",
+    "watch_changes",
+]
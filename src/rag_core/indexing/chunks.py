@@ -0,0 +1,52 @@
+"""Turning loaded documents into identified, annotated chunks."""
+
+import hashlib
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from rag_core.chunking.base import BaseChunker
+from rag_core.loaders.documents import Document
+
+
+def chunk_id(source: str, chunk_index: int) -> str:
+    """Generate a deterministic ID for a chunk."""
+    raw = f"{source}::chunk::{chunk_index}"
+    return hashlib.sha256(raw.encode()).hexdigest()[:16]
+
+
+@dataclass
+class ChunkSet:
+    """Parallel lists of chunk ids, texts and metadata, ready for a vector store."""
+
+    ids: list[str] = field(default_factory=list)
+    chunks: list[str] = field(default_factory=list)
+    metadatas: list[dict] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def select(self, indices: Iterable[int]) -> "ChunkSet":
+        """Return the chunks at the given positions, in that order."""
+        indices = list(indices)
+        return ChunkSet(
+            ids=[self.ids[i] for i in indices],
+            chunks=[self.chunks[i] for i in indices],
+            metadatas=[self.metadatas[i] for i in indices],
+        )
+
+
+def chunk_documents(documents: Iterable[Document], chunker: BaseChunker) -> ChunkSet:
+    """Chunk documents, giving each chunk a stable id and source metadata."""
+    result = ChunkSet()
+    for doc in documents:
+        for i, text in enumerate(chunker.chunk(doc.content)):
+            result.chunks.append(text)
+            result.ids.append(chunk_id(doc.source, i))
+            result.metadatas.append({
+                "source": doc.source,
+                "chunk_index": i,
+                "extension": Path(doc.source).suffix.lower(),
+                "modified": int(doc.modified),
+            })
+    return result
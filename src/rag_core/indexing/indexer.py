@@ -0,0 +1,92 @@
+"""Incremental indexing of individual files into a vector store."""
+
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from rag_core.chunking.base import BaseChunker
+from rag_core.embeddings.base import BaseEmbedder
+from rag_core.embeddings.pipeline import embed_by_length
+from rag_core.indexing.chunks import chunk_documents
+from rag_core.loaders.documents import Document, load_document
+from rag_core.vectorstores.base import BaseVectorStore
+
+
+@dataclass(frozen=True)
+class SyncResult:
+    """What one Indexer.sync call changed."""
+
+    files_updated: int
+    files_removed: int
+    chunks_added: int
+    chunks_removed: int
+    seconds: float
+    skipped: list[tuple[str, str]] = field(default_factory=list)
+
+
+class Indexer:
+    """Re-chunks and re-embeds only the files it is told about.
+
+    Args:
+        store: Vector store to keep in sync.
+        embedder: Embedder for new chunks.
+        chunker: Chunker matching the collection's recorded settings.
+        batch_size: Chunks per embedder call.
+    """
+
+    def __init__(
+        self, store: BaseVectorStore, embedder: BaseEmbedder, chunker: BaseChunker, *, batch_size: int = 100
+    ) -> None:
+        self._store = store
+        self._embedder = embedder
+        self._chunker = chunker
+        self._batch_size = batch_size
+
+    def sync(self, updated: Iterable[Path], removed: Iterable[Path] = ()) -> SyncResult:
+        """Replace the chunks of updated files and drop those of removed files or directories.
+
+        A removed path drops the chunks of the file of that name and of every
+        file indexed below it, since a deleted directory's name may look like
+        a file name (``docs/v1.2``) and vice versa. New chunks are
+        embedded before anything is deleted, so a failing embedder leaves the
+        store unchanged. Files that cannot be read are skipped and keep their
+        previous chunks.
+        """
+        start = time.perf_counter()
+        documents: list[Document] = []
+        removed = [str(p) for p in removed]
+        stale: list[str] = []
+        skipped: list[tuple[str, str]] = []
+        for path in updated:
+            try:
+                document = load_document(path)
+            except Exception as e:
+                skipped.append((str(path), str(e)))
+                continue
+            if document.content.strip():
+                documents.append(document)
+            else:
+                stale.append(document.source)
+
+        chunks = chunk_documents(documents, self._chunker)
+        embeddings = embed_by_length(self._embedder, chunks.chunks, self._batch_size) if len(chunks) else None
+
+        chunks_removed = self._store.delete_sources(
+            [d.source for d in documents] + stale + removed + [f"{p}/" for p in removed]
+        )
+        if embeddings is not None:
+            self._store.add(
+                ids=chunks.ids,
+                embeddings=embeddings,
+                documents=chunks.chunks,
+                metadatas=chunks.metadatas,
+            )
+        return SyncResult(
+            files_updated=len(documents),
+            files_removed=len(removed) + len(stale),
+            chunks_added=len(chunks),
+            chunks_removed=chunks_removed,
+            seconds=time.perf_counter() - start,
+            skipped=skipped,
+        )
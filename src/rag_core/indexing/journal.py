@@ -0,0 +1,123 @@
+"""Durable journals of indexing runs, so interrupted runs can be resumed."""
+
+import json
+import os
+import time
+import uuid
+from pathlib import Path
+
+RUNNING = "running"
+FAILED = "failed"
+COMPLETED = "completed"
+SUPERSEDED = "superseded"
+
+# Finished journals kept per runs directory; older ones are deleted.
+_KEEP_FINISHED = 20
+
+
+class RunJournal:
+    """A JSON record of one indexing run, rewritten atomically at every checkpoint.
+
+    The journal stores what is needed to repeat the run (path, collection,
+    options) and how far it got. Chunks are written to the store batch by
+    batch, so resuming only has to embed the chunks that are still missing.
+    """
+
+    def __init__(self, path: Path, data: dict) -> None:
+        self.path = Path(path)
+        self.data = data
+
+    @classmethod
+    def start(cls, runs_dir: Path, *, command: str, path: str, collection: str, options: dict) -> "RunJournal":
+        """Create and write the journal of a new run."""
+        now = time.time()
+        run_id = f"{time.strftime('%Y%m%d-%H%M%S', time.localtime(now))}-{uuid.uuid4().hex[:6]}"
+        journal = cls(
+            Path(runs_dir) / f"{run_id}.json",
+            {
+                "run_id": run_id,
+                "command": command,
+                "path": path,
+                "collection": collection,
+                "options": options,
+                "status": RUNNING,
+                "started": now,
+                "updated": now,
+                "total_chunks": 0,
+                "chunks_done": 0,
+                "batches_done": 0,
+                "error": None,
+            },
+        )
+        journal._write()
+        return journal
+
+    @classmethod
+    def load(cls, path: Path) -> "RunJournal":
+        """Read a journal file."""
+        return cls(path, json.loads(Path(path).read_text(encoding="utf-8")))
+
+    @classmethod
+    def list_runs(cls, runs_dir: Path) -> list["RunJournal"]:
+        """All readable journals in a directory, oldest first."""
+        runs_dir = Path(runs_dir)
+        if not runs_dir.is_dir():
+            return []
+        journals = []
+        for path in runs_dir.glob("*.json"):
+            try:
+                journals.append(cls.load(path))
+            except (OSError, ValueError):
+                continue
+        return sorted(journals, key=lambda j: j.data.get("started", 0))
+
+    @classmethod
+    def find_unfinished(cls, runs_dir: Path, collection: str | None = None) -> "RunJournal | None":
+        """The most recent run that failed or never finished, optionally for one collection."""
+        candidates = [
+            j
+            for j in cls.list_runs(runs_dir)
+            if j.status in (RUNNING, FAILED) and (collection is None or j.data.get("collection") == collection)
+        ]
+        return candidates[-1] if candidates else None
+
+    @property
+    def status(self) -> str:
+        return self.data.get("status", RUNNING)
+
+    def _write(self) -> None:
+        """Write via a temporary file and rename, so a crash never leaves half a journal."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(self.data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+
+    def update(self, **fields) -> None:
+        """Merge fields into the journal and persist it."""
+        self.data.update(fields, updated=time.time())
+        self._write()
+
+    def checkpoint(self, chunks: int) -> None:
+        """Record one batch of chunks as durably stored."""
+        self.update(
+            chunks_done=self.data.get("chunks_done", 0) + chunks,
+            batches_done=self.data.get("batches_done", 0) + 1,
+        )
+
+    def finish(self) -> None:
+        """Mark the run completed and prune old finished journals."""
+        self.update(status=COMPLETED, error=None)
+        finished = [j for j in RunJournal.list_runs(self.path.parent) if j.status in (COMPLETED, SUPERSEDED)]
+        for old in finished[:-_KEEP_FINISHED]:
+            old.path.unlink(missing_ok=True)
+
+    def fail(self, error: str) -> None:
+        """Mark the run failed; it can then be resumed."""
+        self.update(status=FAILED, error=error)
+
+    def supersede(self) -> None:
+        """Mark an unfinished run as replaced by a newer one."""
+        self.update(status=SUPERSEDED)
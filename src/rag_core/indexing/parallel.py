@@ -0,0 +1,125 @@
+"""Loading and chunking a corpus across several processes."""
+
+import multiprocessing
+import warnings
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from itertools import repeat
+from pathlib import Path
+
+from llm_core.tracing import span
+
+from rag_core.chunking.base import BaseChunker
+from rag_core.indexing.chunks import ChunkSet, chunk_documents
+from rag_core.loaders.documents import load_document
+from rag_core.vectorstores.sharded import shard_of
+
+
+def partition(paths: Iterable[Path], num_shards: int) -> list[list[Path]]:
+    """Split paths into num_shards lists by shard_of, keeping their order within each.
+
+    Uses the same hash as ShardedStore, so a file's worker and store shard agree.
+    """
+    if num_shards < 1:
+        raise ValueError(f"num_shards must be at least 1, got {num_shards}")
+    shards: list[list[Path]] = [[] for _ in range(num_shards)]
+    for path in paths:
+        shards[shard_of(path, num_shards)].append(path)
+    return shards
+
+
+@dataclass
+class ChunkedFiles:
+    """Chunks of a set of files, with counts of what was loaded."""
+
+    chunks: ChunkSet = field(default_factory=ChunkSet)
+    documents: int = 0
+    bytes: int = 0
+    skipped: list[tuple[str, str]] = field(default_factory=list)
+
+
+def _worker_context():
+    """Process start method for workers.
+
+    Not fork: the parent may already run store and HTTP client threads,
+    which must not be copied mid-operation. A forkserver imports this module
+    once and forks every worker from that clean process, so workers do not
+    each pay the import cost as with spawn (the fallback where forkserver
+    is unavailable).
+    """
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload([__name__])
+    return context
+
+
+def _chunk_shard(paths: list[Path], chunker: BaseChunker) -> ChunkedFiles:
+    """Load and chunk one shard; runs in a worker process."""
+    documents = []
+    result = ChunkedFiles()
+    for path in paths:
+        try:
+            document = load_document(path)
+            result.bytes += path.stat().st_size
+        except Exception as e:
+            result.skipped.append((str(path), str(e)))
+            continue
+        if document.content.strip():
+            documents.append(document)
+    result.chunks = chunk_documents(documents, chunker)
+    result.documents = len(documents)
+    return result
+
+
+def chunk_files(paths: Iterable[Path], chunker: BaseChunker, *, workers: int = 1) -> ChunkedFiles:
+    """Load and chunk files, sharding them across worker processes.
+
+    Files are partitioned by a hash of their path, so each worker always gets
+    the same files. Workers only parse and chunk; results are merged in shard
+    order and the caller embeds and writes them from a single process.
+    Unreadable files are skipped with a warning.
+
+    Workers re-import the caller's main module, so a script that calls this
+    (or the CLI app) without an ``if __name__ == "__main__":`` guard makes
+    them fail at startup. The files are then loaded in this process instead,
+    with a warning.
+
+    Args:
+        paths: Files to load, e.g. from scan_files.
+        chunker: Chunker to apply; must be picklable when workers > 1.
+        workers: Number of processes. 1 loads everything in this process.
+    """
+    paths = list(paths)
+    with span("load_documents", files=len(paths), workers=workers) as s:
+        shards = [shard for shard in partition(paths, workers) if shard]
+        if len(shards) <= 1:
+            results = [_chunk_shard(paths, chunker)]
+        else:
+            try:
+                with ProcessPoolExecutor(max_workers=len(shards), mp_context=_worker_context()) as pool:
+                    results = list(pool.map(_chunk_shard, shards, repeat(chunker)))
+            except BrokenProcessPool:
+                warnings.warn(
+                    "Worker processes failed to start (is the main module missing an "
+                    'if __name__ == "__main__": guard?); loading in a single process.',
+                    stacklevel=2,
+                )
+                results = [_chunk_shard(paths, chunker)]
+                s.set(workers=1)
+
+        merged = ChunkedFiles()
+        for result in results:
+            merged.chunks.ids.extend(result.chunks.ids)
+            merged.chunks.chunks.extend(result.chunks.chunks)
+            merged.chunks.metadatas.extend(result.chunks.metadatas)
+            merged.documents += result.documents
+            merged.bytes += result.bytes
+            merged.skipped.extend(result.skipped)
+        for source, error in merged.skipped:
+            warnings.warn(f"Skipping {source}: {error}", stacklevel=2)
+        s.set(documents=merged.documents, chunks=len(merged.chunks))
+        s.add("bytes", merged.bytes)
+    return merged
@@ -0,0 +1,176 @@
+"""Filesystem change detection for continuous indexing.
+
+Uses native file events through the optional ``watchfiles`` package
+(inotify, FSEvents, ReadDirectoryChangesW) and falls back to polling file
+stats when it is not installed.
+"""
+
+import os
+import threading
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+from rag_core.loaders.documents import SUPPORTED_EXTENSIONS
+from rag_core.loaders.scanner import is_ignored_path, scan_files
+
+ADDED = "added"
+MODIFIED = "modified"
+DELETED = "deleted"
+
+
+@dataclass(frozen=True)
+class FileChanges:
+    """Files to re-index and paths (files or directories) to drop from the index."""
+
+    updated: tuple[Path, ...] = ()
+    removed: tuple[Path, ...] = ()
+
+    def __bool__(self) -> bool:
+        return bool(self.updated or self.removed)
+
+
+def coalesce_changes(
+    events: Iterable[tuple[str, str | Path]],
+    root: Path,
+    *,
+    extensions: Iterable[str] = SUPPORTED_EXTENSIONS,
+    ignore_patterns: Iterable[str] = (),
+    max_file_size: int | None = None,
+) -> FileChanges:
+    """Reduce raw (kind, path) events to one action per path.
+
+    Each path is classified by its state on disk now, so any burst of
+    events on it (create, several writes, rename, delete) collapses into a
+    single update or removal. Returned paths are spelled like scan_files
+    spells them (root joined with the relative path), matching the chunk
+    sources written by indexing. A new directory expands to its files.
+    A vanished path may have been a file or a directory, so every one is
+    reported as removed and the indexer drops whatever was indexed under it.
+    """
+    root = Path(root)
+    root_abs = root.absolute()
+    allowed = {e.lower() for e in extensions}
+    ignore_patterns = tuple(ignore_patterns)
+    kinds: dict[Path, str] = {}
+    for kind, raw in events:
+        try:
+            rel = Path(os.path.abspath(raw)).relative_to(root_abs)
+        except ValueError:
+            continue
+        if rel.parts:
+            kinds[root / rel] = kind
+
+    updated: dict[Path, None] = {}
+    removed: dict[Path, None] = {}
+    for path, kind in kinds.items():
+        if is_ignored_path(root, path, ignore_patterns=ignore_patterns):
+            continue
+        if path.is_dir():
+            if kind == ADDED:
+                for file_path in scan_files(
+                    path, extensions=allowed, ignore_patterns=ignore_patterns, max_file_size=max_file_size
+                ):
+                    if not is_ignored_path(root, file_path, ignore_patterns=ignore_patterns):
+                        updated[file_path] = None
+            continue
+        if path.is_file():
+            if path.suffix.lower() not in allowed:
+                continue
+            try:
+                too_large = max_file_size is not None and path.stat().st_size > max_file_size
+            except OSError:
+                continue
+            (removed if too_large else updated)[path] = None
+        elif not path.exists():
+            # Gone: a deleted document, or a directory (its name may contain a dot) that held some.
+            removed[path] = None
+    return FileChanges(updated=tuple(updated), removed=tuple(removed))
+
+
+def _native_events(
+    root: Path, debounce: float, stop_event: threading.Event | None
+) -> Iterator[list[tuple[str, str]]]:
+    import watchfiles
+
+    for changes in watchfiles.watch(root, debounce=int(debounce * 1000), stop_event=stop_event):
+        yield [(change.name, path) for change, path in changes]
+
+
+def _snapshot(root: Path, extensions: set[str], ignore_patterns: tuple[str, ...]) -> dict[str, tuple[int, int]]:
+    snapshot = {}
+    for path in scan_files(root, extensions=extensions, ignore_patterns=ignore_patterns):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        snapshot[str(path)] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+def _polled_events(
+    root: Path,
+    interval: float,
+    stop_event: threading.Event | None,
+    extensions: set[str],
+    ignore_patterns: tuple[str, ...],
+) -> Iterator[list[tuple[str, str]]]:
+    """Diff file stats every interval; yield once a poll finds nothing new (the burst has settled)."""
+    stop_event = stop_event or threading.Event()
+    previous = _snapshot(root, extensions, ignore_patterns)
+    pending: list[tuple[str, str]] = []
+    while not stop_event.wait(interval):
+        current = _snapshot(root, extensions, ignore_patterns)
+        events = [(DELETED, p) for p in previous.keys() - current.keys()]
+        events += [(ADDED, p) for p in current.keys() - previous.keys()]
+        events += [(MODIFIED, p) for p in current.keys() & previous.keys() if current[p] != previous[p]]
+        previous = current
+        if events:
+            pending.extend(events)
+        elif pending:
+            yield pending
+            pending = []
+
+
+def watch_changes(
+    root: Path,
+    *,
+    debounce: float = 1.0,
+    extensions: Iterable[str] = SUPPORTED_EXTENSIONS,
+    ignore_patterns: Iterable[str] = (),
+    max_file_size: int | None = None,
+    stop_event: threading.Event | None = None,
+    poll: bool | None = None,
+) -> Iterator[FileChanges]:
+    """Yield coalesced changes below root until stop_event is set.
+
+    Args:
+        root: Directory to watch.
+        debounce: Seconds to group a burst of events into one batch.
+        extensions: Document suffixes to report.
+        ignore_patterns: Extra gitignore-style patterns, as for scan_files.
+        max_file_size: Files growing beyond this many bytes are reported as removed.
+        stop_event: Set it to end the iteration.
+        poll: Force polling (True) or native events (False); None uses
+            native events when watchfiles is installed.
+    """
+    if poll is None:
+        try:
+            import watchfiles  # noqa: F401
+
+            poll = False
+        except ImportError:
+            poll = True
+    allowed = {e.lower() for e in extensions}
+    ignore_patterns = tuple(ignore_patterns)
+    if poll:
+        batches = _polled_events(Path(root), debounce, stop_event, allowed, ignore_patterns)
+    else:
+        batches = _native_events(Path(root), debounce, stop_event)
+    for events in batches:
+        changes = coalesce_changes(
+            events, root, extensions=allowed, ignore_patterns=ignore_patterns, max_file_size=max_file_size
+        )
+        if changes:
+            yield changes
+
@@ -1,3 +1,11 @@
-from rag_core.loaders.documents import Document, load_documents
+from rag_core.loaders.documents import SUPPORTED_EXTENSIONS, Document, load_document, load_documents
+from rag_core.loaders.scanner import is_ignored_path, scan_files
 
-__all__ = ["Document", "load_documents"]
+__all__ = [
+    "SUPPORTED_EXTENSIONS",
+    "Document",
+    "is_ignored_path",
+    "load_document",
+    "load_documents",
+    "scan_files",
+]
@@ -1,20 +1,25 @@
 """Document loading from local files (PDF, MD, TXT, DOCX)."""
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
 
 import docx2txt
+from llm_core.tracing import span
 from pypdf import PdfReader
 
+from rag_core.loaders.scanner import scan_files
+
 SUPPORTED_EXTENSIONS = {".txt", ".md", ".pdf", ".docx"}
 
 
 @dataclass(frozen=True)
 class Document:
-    """A loaded document with its content and source path."""
+    """A loaded document with its content, source path, and modification time."""
 
     content: str
     source: str
+    modified: float = 0.0
 
 
 def _load_txt(path: Path) -> str:
@@ -42,21 +47,54 @@ _LOADERS: dict[str, callable] = {
 }
 
 
-def load_documents(path: Path) -> list[Document]:
-    """Recursively load all supported documents from a directory."""
+def load_document(path: Path) -> Document:
+    """Load a single supported file.
+
+    Raises:
+        ValueError: If the file type is not supported.
+        OSError: If the file cannot be read (loader errors propagate as well).
+    """
+    path = Path(path)
+    loader = _LOADERS.get(path.suffix.lower())
+    if loader is None:
+        raise ValueError(f"Unsupported file type: {path}")
+    content = loader(path)
+    return Document(content=content, source=str(path), modified=path.stat().st_mtime)
+
+
+def load_documents(
+    path: Path,
+    *,
+    ignore_patterns: Iterable[str] = (),
+    max_file_size: int | None = None,
+) -> list[Document]:
+    """Recursively load all supported documents from a directory.
+
+    Args:
+        path: Directory to scan.
+        ignore_patterns: Extra gitignore-style patterns to skip.
+        max_file_size: Skip files larger than this many bytes. None disables the limit.
+    """
     import warnings
 
     documents: list[Document] = []
 
-    for file_path in sorted(path.rglob("*")):
-        if file_path.is_file() and file_path.suffix.lower() in SUPPORTED_EXTENSIONS:
-            loader = _LOADERS[file_path.suffix.lower()]
+    with span("load_documents", path=str(path)) as s:
+        for file_path in scan_files(
+            path,
+            extensions=SUPPORTED_EXTENSIONS,
+            ignore_patterns=ignore_patterns,
+            max_file_size=max_file_size,
+        ):
             try:
-                content = loader(file_path)
+                document = load_document(file_path)
             except Exception as e:
                 warnings.warn(f"Skipping {file_path}: {e}", stacklevel=2)
                 continue
-            if content.strip():
-                documents.append(Document(content=content, source=str(file_path)))
+            s.add("files")
+            s.add("bytes", file_path.stat().st_size)
+            if document.content.strip():
+                documents.append(document)
+        s.set(documents=len(documents))
 
     return documents
@@ -0,0 +1,233 @@
+"""Fast recursive file scanning with gitignore-style patterns and size filters."""
+
+import os
+import re
+import warnings
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+# Directories that never contain documents worth indexing.
+DEFAULT_IGNORE_PATTERNS = (
+    ".git/",
+    ".hg/",
+    ".svn/",
+    ".rag-cli/",
+    ".venv/",
+    "__pycache__/",
+    "node_modules/",
+)
+
+# Per-directory ignore files, read while walking (like git does).
+IGNORE_FILES = (".gitignore", ".ragignore")
+
+
+def _translate(pattern: str) -> str:
+    """Translate a gitignore glob into a regular expression."""
+    out: list[str] = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif c == "*":
+            out.append("[^/]*")
+            i += 1
+        elif c == "?":
+            out.append("[^/]")
+            i += 1
+        elif c == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                out.append(re.escape(c))
+                i += 1
+            else:
+                body = pattern[i + 1:end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+                i = end + 1
+        else:
+            out.append(re.escape(c))
+            i += 1
+    return "".join(out)
+
+
+@dataclass(frozen=True)
+class _Rule:
+    """A single compiled ignore pattern."""
+
+    regex: re.Pattern
+    base: str
+    negated: bool
+    dir_only: bool
+    anchored: bool
+
+    def matches(self, rel_path: str) -> bool:
+        """Check a root-relative POSIX path against this rule."""
+        if self.base:
+            if not rel_path.startswith(self.base + "/"):
+                return False
+            rel_path = rel_path[len(self.base) + 1:]
+        if not self.anchored:
+            rel_path = rel_path.rpartition("/")[2]
+        return self.regex.fullmatch(rel_path) is not None
+
+
+def _compile(line: str, base: str) -> _Rule | None:
+    """Compile one line of an ignore file. Returns None for blanks and comments."""
+    line = line.rstrip("\n").rstrip()
+    if not line or line.startswith("#"):
+        return None
+    negated = line.startswith("!")
+    if negated:
+        line = line[1:]
+    elif line.startswith("\\"):
+        line = line[1:]
+    dir_only = line.endswith("/")
+    line = line.rstrip("/")
+    if not line:
+        return None
+    anchored = "/" in line
+    line = line.lstrip("/")
+    return _Rule(
+        regex=re.compile(_translate(line)),
+        base=base,
+        negated=negated,
+        dir_only=dir_only,
+        anchored=anchored,
+    )
+
+
+class IgnoreRules:
+    """Ordered gitignore-style rules. The last matching rule wins."""
+
+    def __init__(self, rules: tuple[_Rule, ...] = ()) -> None:
+        self._rules = rules
+
+    def extend(self, patterns: Iterable[str], base: str = "") -> "IgnoreRules":
+        """Return new rules with patterns appended, relative to base."""
+        compiled = tuple(r for line in patterns if (r := _compile(line, base)))
+        return IgnoreRules(self._rules + compiled) if compiled else self
+
+    def is_ignored(self, rel_path: str, is_dir: bool) -> bool:
+        """Check whether a root-relative POSIX path is ignored."""
+        ignored = False
+        for rule in self._rules:
+            if rule.dir_only and not is_dir:
+                continue
+            if rule.matches(rel_path):
+                ignored = not rule.negated
+        return ignored
+
+
+def _read_ignore_file(path: str) -> list[str]:
+    """Read the lines of an ignore file, tolerating bad encodings."""
+    try:
+        with open(path, encoding="utf-8", errors="ignore") as f:
+            return f.readlines()
+    except OSError:
+        return []
+
+
+def scan_files(
+    root: Path,
+    *,
+    extensions: Iterable[str] | None = None,
+    ignore_patterns: Iterable[str] = (),
+    max_file_size: int | None = None,
+    use_ignore_files: bool = True,
+) -> Iterator[Path]:
+    """Lazily yield files under root, pruning ignored directories during the walk.
+
+    Entries are visited in name order so results are deterministic.
+
+    Args:
+        root: Directory to scan.
+        extensions: Lowercase suffixes to keep (e.g. {".md"}). None keeps everything.
+        ignore_patterns: Extra gitignore-style patterns, applied after the defaults.
+        max_file_size: Skip files larger than this many bytes. None disables the limit.
+        use_ignore_files: Honour .gitignore and .ragignore files found while walking.
+    """
+    allowed = {e.lower() for e in extensions} if extensions is not None else None
+    rules = IgnoreRules().extend(DEFAULT_IGNORE_PATTERNS).extend(ignore_patterns)
+    yield from _walk(os.fspath(root), "", rules, allowed, max_file_size, use_ignore_files)
+
+
+def is_ignored_path(
+    root: Path,
+    path: Path,
+    *,
+    ignore_patterns: Iterable[str] = (),
+    use_ignore_files: bool = True,
+) -> bool:
+    """Check whether scan_files(root) would skip a path because of ignore rules.
+
+    Applies the same defaults, patterns and per-directory ignore files as
+    the walk, without scanning any other entries. Paths outside root count
+    as ignored.
+    """
+    try:
+        parts = Path(path).resolve().relative_to(Path(root).resolve()).parts
+    except ValueError:
+        return True
+    rules = IgnoreRules().extend(DEFAULT_IGNORE_PATTERNS).extend(ignore_patterns)
+    directory = os.fspath(Path(root).resolve())
+    rel_dir = ""
+    for i, name in enumerate(parts):
+        if use_ignore_files:
+            for ignore_file in IGNORE_FILES:
+                ignore_path = os.path.join(directory, ignore_file)
+                if os.path.isfile(ignore_path):
+                    rules = rules.extend(_read_ignore_file(ignore_path), base=rel_dir)
+        rel_path = f"{rel_dir}/{name}" if rel_dir else name
+        if rules.is_ignored(rel_path, is_dir=i < len(parts) - 1):
+            return True
+        directory = os.path.join(directory, name)
+        rel_dir = rel_path
+    return False
+
+
+def _walk(
+    directory: str,
+    rel_dir: str,
+    rules: IgnoreRules,
+    allowed: set[str] | None,
+    max_file_size: int | None,
+    use_ignore_files: bool,
+) -> Iterator[Path]:
+    """Walk one directory level with os.scandir and recurse into kept subdirectories."""
+    try:
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except OSError as e:
+        warnings.warn(f"Skipping {directory}: {e}", stacklevel=3)
+        return
+
+    if use_ignore_files:
+        for entry in entries:
+            if entry.name in IGNORE_FILES and entry.is_file():
+                rules = rules.extend(_read_ignore_file(entry.path), base=rel_dir)
+
+    for entry in entries:
+        rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                if not rules.is_ignored(rel_path, is_dir=True):
+                    yield from _walk(entry.path, rel_path, rules, allowed, max_file_size, use_ignore_files)
+                continue
+            if not entry.is_file():
+                continue
+            if allowed is not None and os.path.splitext(entry.name)[1].lower() not in allowed:
+                continue
+            if rules.is_ignored(rel_path, is_dir=False):
+                continue
+            if max_file_size is not None and entry.stat().st_size > max_file_size:
+                continue
+        except OSError:
+            continue
+        yield Path(entry.path)
@@ -3,12 +3,19 @@
 from abc import ABC, abstractmethod
 
 from rag_core.vectorstores.base import SearchResult
+from rag_core.vectorstores.filters import MetadataFilter
 
 
 class BaseRetriever(ABC):
     """Abstract interface for document retrieval."""
 
     @abstractmethod
-    def retrieve(self, query: str, top_k: int = 3) -> list[SearchResult]:
-        """Retrieve relevant document chunks for a query."""
+    def retrieve(self, query: str, top_k: int = 3, where: MetadataFilter | None = None) -> list[SearchResult]:
+        """Retrieve relevant document chunks for a query, optionally filtered by metadata."""
         ...
+
+    def retrieve_batch(
+        self, queries: list[str], top_k: int = 3, where: MetadataFilter | None = None
+    ) -> list[list[SearchResult]]:
+        """Retrieve chunks for several queries; one result list per query."""
+        return [self.retrieve(query, top_k=top_k, where=where) for query in queries]
@@ -1,18 +1,56 @@
 """Similarity-based retrieval using embeddings."""
 
+from collections.abc import Sequence
+
+import numpy as np
+from llm_core.tracing import span
+
 from rag_core.embeddings.base import BaseEmbedder
 from rag_core.retrieval.base import BaseRetriever
-from rag_core.vectorstores.base import BaseVectorStore, SearchResult
+from rag_core.vectorstores.base import BaseVectorStore, SearchResult, merge_results
+from rag_core.vectorstores.filters import MetadataFilter
 
 
 class SimilarityRetriever(BaseRetriever):
-    """Retriever that embeds the query and finds similar chunks."""
+    """Retriever that embeds the query and finds similar chunks.
+
+    Accepts one store or several (e.g. one per collection); the query is
+    embedded once and results from all stores are merged by distance.
+    """
 
-    def __init__(self, embedder: BaseEmbedder, store: BaseVectorStore) -> None:
+    def __init__(self, embedder: BaseEmbedder, store: BaseVectorStore | Sequence[BaseVectorStore]) -> None:
         self._embedder = embedder
-        self._store = store
+        self._stores = list(store) if isinstance(store, (list, tuple)) else [store]
+
+    def retrieve(self, query: str, top_k: int = 3, where: MetadataFilter | None = None) -> list[SearchResult]:
+        """Retrieve the most similar chunks to the query.
+
+        The optional metadata filter is applied by the store before the
+        similarity search, so top_k results all satisfy it.
+        """
+        with span("retrieve", stores=len(self._stores)):
+            return self.retrieve_embedding(self._embedder.embed([query])[0], top_k=top_k, where=where)
+
+    def retrieve_embedding(
+        self, query_embedding: np.ndarray | list[float], top_k: int = 3, where: MetadataFilter | None = None
+    ) -> list[SearchResult]:
+        """Retrieve chunks for an already embedded query."""
+        if len(self._stores) == 1:
+            return self._stores[0].query(query_embedding=query_embedding, top_k=top_k, where=where)
+        return merge_results(
+            (store.query(query_embedding=query_embedding, top_k=top_k, where=where) for store in self._stores),
+            top_k,
+        )
 
-    def retrieve(self, query: str, top_k: int = 3) -> list[SearchResult]:
-        """Retrieve the most similar chunks to the query."""
-        query_embedding = self._embedder.embed([query])[0]
-        return self._store.query(query_embedding=query_embedding, top_k=top_k)
+    def retrieve_batch(
+        self, queries: list[str], top_k: int = 3, where: MetadataFilter | None = None
+    ) -> list[list[SearchResult]]:
+        """Retrieve chunks for several queries with one embedding call and one search per store."""
+        if not queries:
+            return []
+        with span("retrieve", stores=len(self._stores), queries=len(queries)):
+            query_embeddings = self._embedder.embed(queries)
+            per_store = [store.query_batch(query_embeddings, top_k=top_k, where=where) for store in self._stores]
+            if len(per_store) == 1:
+                return per_store[0]
+            return [merge_results(results, top_k) for results in zip(*per_store)]
@@ -1,4 +1,32 @@
-from rag_core.vectorstores.base import BaseVectorStore, SearchResult
-from rag_core.vectorstores.chroma import ChromaStore
+from rag_core.vectorstores.base import BaseVectorStore, RecordBatch, SearchResult, merge_results
+from rag_core.vectorstores.chroma import DEFAULT_COLLECTION, ChromaStore
+from rag_core.vectorstores.filters import MetadataFilter
+from rag_core.vectorstores.generations import Generations
+from rag_core.vectorstores.profiles import INDEX_PROFILES, IndexProfile, get_profile
+from rag_core.vectorstores.quantized import QUANTIZATIONS, QuantizedStore
+from rag_core.vectorstores.sharded import ShardedStore, open_shards, shard_dir, shard_of
+from rag_core.vectorstores.snapshot import SnapshotManifest, export_snapshot, import_snapshot, read_manifest
 
-__all__ = ["BaseVectorStore", "ChromaStore", "SearchResult"]
+__all__ = [
+    "DEFAULT_COLLECTION",
+    "INDEX_PROFILES",
+    "QUANTIZATIONS",
+    "BaseVectorStore",
+    "ChromaStore",
+    "Generations",
+    "IndexProfile",
+    "MetadataFilter",
+    "QuantizedStore",
+    "RecordBatch",
+    "SearchResult",
+    "ShardedStore",
+    "SnapshotManifest",
+    "export_snapshot",
+    "get_profile",
+    "import_snapshot",
+    "merge_results",
+    "open_shards",
+    "read_manifest",
+    "shard_dir",
+    "shard_of",
+]
@@ -1,8 +1,16 @@
 """Abstract base class for vector stores."""
 
+import heapq
+import itertools
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 
+import numpy as np
+
+from rag_core.arrays import Vectors, as_matrix
+from rag_core.vectorstores.filters import MetadataFilter
+
 
 @dataclass(frozen=True)
 class SearchResult:
@@ -14,6 +22,26 @@ class SearchResult:
     distance: float
 
 
+@dataclass(frozen=True)
+class RecordBatch:
+    """A page of stored records, as returned by BaseVectorStore.iter_records."""
+
+    ids: list[str]
+    embeddings: np.ndarray | None
+    documents: list[str]
+    metadatas: list[dict]
+
+
+def _matches_any(source: str, sources: list[str]) -> bool:
+    """True if source equals one of the sources, or lies below one ending in "/"."""
+    return any(source.startswith(s) if s.endswith("/") else source == s for s in sources)
+
+
+def merge_results(result_lists: Iterable[list[SearchResult]], top_k: int) -> list[SearchResult]:
+    """Merge results from several stores into one list ordered by distance."""
+    return heapq.nsmallest(top_k, itertools.chain.from_iterable(result_lists), key=lambda r: r.distance)
+
+
 class BaseVectorStore(ABC):
     """Abstract interface for vector stores."""
 
@@ -21,18 +49,42 @@ class BaseVectorStore(ABC):
     def add(
         self,
         ids: list[str],
-        embeddings: list[list[float]],
+        embeddings: Vectors,
         documents: list[str],
         metadatas: list[dict],
     ) -> None:
-        """Add documents with their embeddings to the store."""
+        """Add documents with their embeddings (a float32 matrix or nested lists) to the store."""
         ...
 
     @abstractmethod
     def query(
-        self, query_embedding: list[float], top_k: int = 3
+        self, query_embedding: np.ndarray | list[float], top_k: int = 3, where: MetadataFilter | None = None
     ) -> list[SearchResult]:
-        """Query for the most similar documents."""
+        """Query for the most similar documents, optionally restricted by metadata."""
+        ...
+
+    def query_batch(
+        self, query_embeddings: Vectors, top_k: int = 3, where: MetadataFilter | None = None
+    ) -> list[list[SearchResult]]:
+        """Run several queries; one result list per query row.
+
+        The default issues one query per row; backends that can search
+        many vectors in one call override it.
+        """
+        return [self.query(query_embedding=q, top_k=top_k, where=where) for q in as_matrix(query_embeddings)]
+
+    @abstractmethod
+    def iter_records(self, batch_size: int = 1000, include_embeddings: bool = True) -> Iterator[RecordBatch]:
+        """Iterate over all stored records in pages of at most batch_size."""
+        ...
+
+    @abstractmethod
+    def delete_sources(self, sources: Iterable[str]) -> int:
+        """Delete the chunks of the given source files.
+
+        A source ending in "/" is a directory: every chunk below it is
+        deleted. Returns the number of chunks deleted.
+        """
         ...
 
     @abstractmethod
@@ -45,6 +97,16 @@ class BaseVectorStore(ABC):
         """Return the number of documents in the store."""
         ...
 
+    @abstractmethod
+    def get_settings(self) -> dict:
+        """Return the index settings recorded with the store (embedding model, chunking)."""
+        ...
+
+    @abstractmethod
+    def set_settings(self, settings: dict) -> None:
+        """Record index settings with the store, merging with existing ones."""
+        ...
+
     @abstractmethod
     def reset(self) -> None:
         """Delete all data from the store."""
@@ -1,60 +1,285 @@
 """ChromaDB vector store adapter."""
 
+import re
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
 import chromadb
+import numpy as np
+from llm_core.tracing import span
 
-from rag_core.vectorstores.base import BaseVectorStore, SearchResult
+from rag_core.arrays import Vectors, as_matrix, as_vector
+from rag_core.vectorstores.base import BaseVectorStore, RecordBatch, SearchResult, _matches_any
+from rag_core.vectorstores.filters import _GLOB_CHARS, MetadataFilter
+from rag_core.vectorstores.profiles import IndexProfile
 
-_COLLECTION_NAME = "rag_cli_docs"
+DEFAULT_COLLECTION = "rag_cli_docs"
 
+# Index settings are stored in collection metadata under this prefix,
+# keeping them apart from Chroma's own keys (e.g. "hnsw:space").
+_SETTINGS_PREFIX = "rag_cli:"
+
+# Chroma cannot match string prefixes, so each chunk also records the
+# directories above its source as "dir1", "dir2", ... ("docs", "docs/api").
+# They are internal: query results and exports return metadata without them.
+_SOURCE_DIRS_SETTING = "source_dirs"
+_DIR_KEY_RE = re.compile(r"^dir\d+$")
+
+_COLLECTION_NAME_RE = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9._-]{1,510}[a-zA-Z0-9]$")
 
-class ChromaStore(BaseVectorStore):
-    """Vector store backed by ChromaDB with local persistence."""
 
-    def __init__(self, persist_dir: Path) -> None:
-        self._client = chromadb.PersistentClient(path=str(persist_dir))
-        self._collection = self._client.get_or_create_collection(
-            name=_COLLECTION_NAME
+def validate_collection_name(name: str) -> str:
+    """Check a collection name against ChromaDB's naming rules."""
+    if not _COLLECTION_NAME_RE.match(name) or ".." in name:
+        raise ValueError(
+            f"Invalid collection name {name!r}: use 3-512 characters from "
+            "[a-zA-Z0-9._-], starting and ending with a letter or digit."
         )
+    return name
+
+
+def _collection_names(client) -> set[str]:
+    """Return collection names; chromadb releases differ in returning names or objects."""
+    return {c if isinstance(c, str) else c.name for c in client.list_collections()}
+
+
+def _client(persist_dir: Path):
+    """Open a persistent client.
+
+    chromadb caches clients by path string, so the path is made absolute
+    to keep a relative directory from resolving to a previous cwd.
+    """
+    return chromadb.PersistentClient(path=str(Path(persist_dir).resolve()))
+
+
+def _dir_key(path: str) -> str:
+    """Metadata key holding the ancestor directory at the depth of path."""
+    return f"dir{path.count('/') + 1}"
+
+
+def _with_dirs(metadata: dict) -> dict:
+    """Add the directories above a chunk's source to its metadata."""
+    source = metadata.get("source")
+    if not isinstance(source, str):
+        return metadata
+    parts = source.replace("\\", "/").split("/")[:-1]
+    dirs = ["/".join(parts[:depth]) for depth in range(1, len(parts) + 1)]
+    return {**metadata, **{_dir_key(d): d for d in dirs}}
+
+
+def _without_dirs(metadata: dict | None) -> dict:
+    """Drop the dir fields again, returning the metadata as it was added."""
+    return {key: value for key, value in (metadata or {}).items() if not _DIR_KEY_RE.match(key)}
+
+
+def _prefix_clause(prefix: str) -> dict:
+    """Match a file, or the files below a directory, with native operators."""
+    path = prefix.rstrip("/")
+    below = {_dir_key(path): path}
+    return below if prefix.endswith("/") else {"$or": [{"source": path}, below]}
+
+
+class ChromaStore(BaseVectorStore):
+    """Vector store backed by ChromaDB with local persistence.
+
+    Each store wraps one named collection, so several corpora can live
+    side by side in the same persist directory. An optional IndexProfile
+    sets the HNSW parameters of newly created collections; for existing
+    ones only its ef_search is applied.
+    """
+
+    def __init__(
+        self,
+        persist_dir: Path,
+        collection: str = DEFAULT_COLLECTION,
+        profile: IndexProfile | None = None,
+    ) -> None:
+        self._client = _client(persist_dir)
+        self._name = validate_collection_name(collection)
+        self._profile = profile
+        if self._name in _collection_names(self._client):
+            self._collection = self._client.get_collection(name=self._name)
+            if profile is not None:
+                self._apply_search_ef(profile.ef_search)
+        else:
+            self._collection = self._create_collection()
+        self._sources: set[str] | None = None
+
+    def _create_collection(self):
+        """Create the collection with the profile's HNSW metadata."""
+        metadata = self._profile.to_metadata() if self._profile is not None else None
+        return self._client.create_collection(name=self._name, metadata=metadata)
+
+    def _apply_search_ef(self, ef_search: int) -> None:
+        """Change ef_search of an existing collection where chromadb allows it."""
+        configuration = getattr(self._collection, "configuration", None) or {}
+        hnsw = configuration.get("hnsw") or {}
+        if hnsw.get("ef_search") == ef_search:
+            return
+        try:
+            self._collection.modify(configuration={"hnsw": {"ef_search": ef_search}})
+        except (TypeError, ValueError):
+            # Older chromadb releases fix all HNSW parameters at creation.
+            pass
+
+    @staticmethod
+    def list_collections(persist_dir: Path) -> list[str]:
+        """Return the names of all collections in a persist directory."""
+        return sorted(_collection_names(_client(persist_dir)))
+
+    @staticmethod
+    def drop_collection(persist_dir: Path, collection: str) -> None:
+        """Delete a collection from a persist directory if it exists."""
+        client = _client(persist_dir)
+        if collection in _collection_names(client):
+            client.delete_collection(name=collection)
+
+    @property
+    def name(self) -> str:
+        """Name of the underlying collection."""
+        return self._name
 
     def add(
         self,
         ids: list[str],
-        embeddings: list[list[float]],
+        embeddings: Vectors,
         documents: list[str],
         metadatas: list[dict],
     ) -> None:
         """Add documents with embeddings to ChromaDB."""
+        if not self.get_settings().get(_SOURCE_DIRS_SETTING) and self._collection.count() == 0:
+            # Every chunk of a collection filled from empty carries the dir fields.
+            self.set_settings({_SOURCE_DIRS_SETTING: True})
         # ChromaDB rejects empty metadata dicts; convert them to None.
-        cleaned = [m if m else None for m in metadatas]
-        self._collection.upsert(
-            ids=ids,
-            embeddings=embeddings,
-            documents=documents,
-            metadatas=cleaned,
-        )
+        cleaned = [_with_dirs(m) if m else None for m in metadatas]
+        with span("store.add", backend="chroma", rows=len(ids)):
+            self._collection.upsert(
+                ids=ids,
+                embeddings=as_matrix(embeddings),
+                documents=documents,
+                metadatas=cleaned,
+            )
+        self._sources = None
+
+    def _all_sources(self) -> set[str]:
+        """Return the distinct chunk sources, cached until the next write."""
+        if self._sources is None:
+            result = self._collection.get(include=["metadatas"])
+            self._sources = {m["source"] for m in result["metadatas"] if m and "source" in m}
+        return self._sources
+
+    def _source_clause(self, patterns: tuple[str, ...]) -> dict | None:
+        """Compile source globs and prefixes into a Chroma where clause.
+
+        Prefixes match the recorded dir fields directly. Chroma cannot glob
+        metadata strings, so globs (and all patterns of collections filled
+        before the dir fields existed) are resolved against the known
+        sources and passed as an exact "$in" list. Returns None when no
+        source can match.
+        """
+        native = self.get_settings().get(_SOURCE_DIRS_SETTING)
+        resolve = [p for p in patterns if not native or _GLOB_CHARS.intersection(p)]
+        options = [_prefix_clause(p) for p in patterns if p not in resolve]
+        if resolve:
+            pattern_filter = MetadataFilter(sources=tuple(resolve))
+            sources = sorted(s for s in self._all_sources() if pattern_filter.matches_source(s))
+            if sources:
+                options.append({"source": {"$in": sources}})
+        if not options:
+            return None
+        return options[0] if len(options) == 1 else {"$or": options}
+
+    def _where(self, where: MetadataFilter) -> dict | None:
+        """Compile a MetadataFilter into a Chroma where clause.
+
+        Returns an impossible clause when no source matches.
+        """
+        clauses: list[dict] = []
+        if where.extensions:
+            clauses.append({"extension": {"$in": list(where.extensions)}})
+        if where.modified_after is not None:
+            clauses.append({"modified": {"$gte": where.modified_after}})
+        if where.sources:
+            sources = self._source_clause(where.sources)
+            if sources is None:
+                return None
+            clauses.append(sources)
+        if not clauses:
+            return {}
+        return clauses[0] if len(clauses) == 1 else {"$and": clauses}
 
     def query(
-        self, query_embedding: list[float], top_k: int = 3
+        self, query_embedding: np.ndarray | list[float], top_k: int = 3, where: MetadataFilter | None = None
     ) -> list[SearchResult]:
         """Query ChromaDB for the most similar documents."""
-        results = self._collection.query(
-            query_embeddings=[query_embedding],
-            n_results=top_k,
-            include=["documents", "metadatas", "distances"],
-        )
-        search_results: list[SearchResult] = []
-        for i in range(len(results["ids"][0])):
-            search_results.append(
+        return self.query_batch(as_vector(query_embedding)[None, :], top_k=top_k, where=where)[0]
+
+    def query_batch(
+        self, query_embeddings: Vectors, top_k: int = 3, where: MetadataFilter | None = None
+    ) -> list[list[SearchResult]]:
+        """Search for several query vectors in a single ChromaDB call."""
+        queries = as_matrix(query_embeddings)
+        clause = self._where(where) if where is not None else {}
+        if clause is None or len(queries) == 0:
+            return [[] for _ in range(len(queries))]
+        with span("store.query", backend="chroma", top_k=top_k, queries=len(queries)) as s:
+            results = self._collection.query(
+                query_embeddings=queries,
+                n_results=top_k,
+                where=clause or None,
+                include=["documents", "metadatas", "distances"],
+            )
+            s.set(results=sum(len(ids) for ids in results["ids"]))
+        return [
+            [
                 SearchResult(
-                    id=results["ids"][0][i],
-                    document=results["documents"][0][i],
-                    metadata=results["metadatas"][0][i],
-                    distance=results["distances"][0][i],
+                    id=results["ids"][q][i],
+                    document=results["documents"][q][i],
+                    metadata=_without_dirs(results["metadatas"][q][i]),
+                    distance=results["distances"][q][i],
                 )
+                for i in range(len(results["ids"][q]))
+            ]
+            for q in range(len(queries))
+        ]
+
+    def iter_records(self, batch_size: int = 1000, include_embeddings: bool = True) -> Iterator[RecordBatch]:
+        """Page through all stored records."""
+        include = ["documents", "metadatas"] + (["embeddings"] if include_embeddings else [])
+        offset = 0
+        while True:
+            result = self._collection.get(include=include, limit=batch_size, offset=offset)
+            if not result["ids"]:
+                return
+            embeddings = result.get("embeddings") if include_embeddings else None
+            yield RecordBatch(
+                ids=result["ids"],
+                embeddings=np.asarray(embeddings, dtype=np.float32) if embeddings is not None else None,
+                documents=result["documents"],
+                metadatas=[_without_dirs(m) for m in result["metadatas"]],
             )
-        return search_results
+            offset += len(result["ids"])
+
+    def delete_sources(self, sources: Iterable[str]) -> int:
+        """Delete the chunks of the given files, or of all files below a "dir/" source."""
+        sources = [str(s) for s in sources]
+        matched = [s for s in sources if not s.endswith("/")]
+        directories = [s for s in sources if s.endswith("/")]
+        options = [_prefix_clause(d) for d in directories]
+        if directories and not self.get_settings().get(_SOURCE_DIRS_SETTING):
+            # Older collections lack the dir fields, so directories are resolved against the known sources.
+            matched += [s for s in self._all_sources() if _matches_any(s, directories)]
+            options = []
+        if matched:
+            options.append({"source": {"$in": sorted(set(matched))}})
+        if not options:
+            return 0
+        clause = options[0] if len(options) == 1 else {"$or": options}
+        ids = self._collection.get(where=clause, include=[])["ids"]
+        if ids:
+            self._collection.delete(ids=ids)
+        self._sources = None
+        return len(ids)
 
     def existing_ids(self) -> set[str]:
         """Return all document IDs currently in the store."""
@@ -65,7 +290,27 @@ class ChromaStore(BaseVectorStore):
         """Return the number of documents in the store."""
         return self._collection.count()
 
+    def get_settings(self) -> dict:
+        """Return the index settings recorded on the collection."""
+        metadata = self._collection.metadata or {}
+        return {
+            key[len(_SETTINGS_PREFIX):]: value
+            for key, value in metadata.items()
+            if key.startswith(_SETTINGS_PREFIX)
+        }
+
+    def set_settings(self, settings: dict) -> None:
+        """Record index settings on the collection, merging with existing ones."""
+        metadata = {
+            key: value
+            for key, value in (self._collection.metadata or {}).items()
+            if key.startswith(_SETTINGS_PREFIX)
+        }
+        metadata.update({f"{_SETTINGS_PREFIX}{key}": value for key, value in settings.items()})
+        self._collection.modify(metadata=metadata)
+
     def reset(self) -> None:
         """Delete the collection and recreate it empty."""
-        self._client.delete_collection(name=_COLLECTION_NAME)
-        self._collection = self._client.create_collection(name=_COLLECTION_NAME)
+        self._client.delete_collection(name=self._name)
+        self._collection = self._create_collection()
+        self._sources = None
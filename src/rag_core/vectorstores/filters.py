@@ -0,0 +1,62 @@
+"""Metadata filters applied before the similarity search."""
+
+import fnmatch
+from dataclasses import dataclass
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+def _normalize_extension(ext: str) -> str:
+    """Lowercase an extension and make sure it starts with a dot."""
+    ext = ext.lower()
+    return ext if ext.startswith(".") else f".{ext}"
+
+
+@dataclass(frozen=True)
+class MetadataFilter:
+    """Conditions a chunk's metadata must satisfy to be searched.
+
+    All given conditions must hold. Within ``sources`` and ``extensions``
+    any single entry may match.
+
+    Attributes:
+        sources: Source path globs (``docs/*.md``), files (``docs/a.md``) or
+            directories (``docs/`` or ``docs``) whose files all match.
+        extensions: File extensions such as ``.md`` or ``pdf``.
+        modified_after: Only chunks whose file was modified at or after this
+            POSIX timestamp.
+    """
+
+    sources: tuple[str, ...] = ()
+    extensions: tuple[str, ...] = ()
+    modified_after: float | None = None
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "sources", tuple(s.replace("\\", "/") for s in self.sources))
+        object.__setattr__(self, "extensions", tuple(_normalize_extension(e) for e in self.extensions))
+
+    def is_empty(self) -> bool:
+        """Return True when the filter has no conditions."""
+        return not self.sources and not self.extensions and self.modified_after is None
+
+    def matches_source(self, source: str) -> bool:
+        """Check a source path against the glob/prefix conditions."""
+        if not self.sources:
+            return True
+        source = source.replace("\\", "/")
+        for pattern in self.sources:
+            if _GLOB_CHARS.intersection(pattern):
+                if fnmatch.fnmatchcase(source, pattern):
+                    return True
+            elif source.startswith(pattern.rstrip("/") + "/") or source == pattern:
+                return True
+        return False
+
+    def matches(self, metadata: dict) -> bool:
+        """Check a chunk's metadata against every condition."""
+        metadata = metadata or {}
+        if self.extensions and metadata.get("extension") not in self.extensions:
+            return False
+        if self.modified_after is not None and metadata.get("modified", 0) < self.modified_after:
+            return False
+        return self.matches_source(metadata.get("source", ""))
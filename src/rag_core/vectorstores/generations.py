@@ -0,0 +1,148 @@
+"""Generations of a collection, for rebuilding indexes without downtime."""
+
+import json
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from rag_core.vectorstores.chroma import validate_collection_name
+
+
+class Generations:
+    """Maps logical collection names to the physical collections serving them.
+
+    A rebuild writes into a new physical collection (a shadow, named
+    ``<collection>.g<n>``) while queries keep using the active one. Promoting
+    the shadow is a single atomic rewrite of the JSON file, and the replaced
+    generation is kept so the swap can be rolled back. Collections without an
+    entry are served by the physical collection of the same name. Changes
+    hold a lock file, so concurrent index and watch processes do not lose
+    each other's updates.
+
+    Args:
+        path: JSON file recording the generations, usually next to the store.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = Path(path)
+
+    def _read(self) -> dict:
+        if not self._path.exists():
+            return {}
+        return json.loads(self._path.read_text(encoding="utf-8"))
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold an exclusive lock for a read-modify-write of the JSON file."""
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with self._path.with_suffix(".lock").open("a+b") as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                yield
+                return
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def _write(self, data: dict) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self._path.with_suffix(".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self._path)
+
+    def _entry(self, data: dict, collection: str) -> dict:
+        return data.get(collection) or {"active": collection, "previous": None, "building": None, "generation": 0}
+
+    def active(self, collection: str) -> str:
+        """Physical collection currently answering queries for a logical collection."""
+        return self._entry(self._read(), collection)["active"]
+
+    def previous(self, collection: str) -> str | None:
+        """Physical collection that a rollback would restore, if any."""
+        return self._entry(self._read(), collection)["previous"]
+
+    def building(self, collection: str) -> str | None:
+        """Shadow collection of an unfinished rebuild, if any."""
+        return self._entry(self._read(), collection)["building"]
+
+    def begin_shadow(self, collection: str) -> tuple[str, str | None]:
+        """Reserve a new shadow collection for a rebuild.
+
+        Returns the shadow's name and the name of an abandoned shadow from an
+        earlier unfinished rebuild, which the caller should drop.
+        """
+        with self._locked():
+            data = self._read()
+            entry = self._entry(data, collection)
+            abandoned = entry["building"]
+            entry["generation"] += 1
+            entry["building"] = validate_collection_name(f"{collection}.g{entry['generation']}")
+            data[collection] = entry
+            self._write(data)
+        return entry["building"], abandoned
+
+    def abandon(self, collection: str) -> str | None:
+        """Forget an unfinished rebuild; returns its shadow, which the caller should drop."""
+        with self._locked():
+            data = self._read()
+            entry = self._entry(data, collection)
+            abandoned = entry["building"]
+            if abandoned is not None:
+                entry["building"] = None
+                data[collection] = entry
+                self._write(data)
+        return abandoned
+
+    def promote(self, collection: str, shadow: str) -> str | None:
+        """Make a finished shadow the active collection.
+
+        The replaced collection becomes the rollback target. Returns the
+        generation before that, which is no longer referenced and can be dropped.
+        """
+        with self._locked():
+            data = self._read()
+            entry = self._entry(data, collection)
+            if entry["building"] != shadow:
+                raise ValueError(f"{shadow!r} is not the collection being built for {collection!r}")
+            retired = entry["previous"]
+            entry.update(previous=entry["active"], active=shadow, building=None)
+            data[collection] = entry
+            self._write(data)
+        return retired
+
+    def rollback(self, collection: str) -> str:
+        """Swap the active and previous generations; returns the now active collection."""
+        with self._locked():
+            data = self._read()
+            entry = self._entry(data, collection)
+            if entry["previous"] is None:
+                raise ValueError(f"Collection {collection!r} has no previous generation to roll back to")
+            entry.update(active=entry["previous"], previous=entry["active"])
+            data[collection] = entry
+            self._write(data)
+        return entry["active"]
+
+    def logical_names(self, physical: list[str]) -> list[str]:
+        """Names to show for existing physical collections, hiding shadows and old generations."""
+        data = self._read()
+        names = {}
+        hidden = set()
+        for collection, entry in data.items():
+            if entry["active"] in physical:
+                names[entry["active"]] = collection
+            hidden.update(n for n in (entry["previous"], entry["building"]) if n is not None)
+        return sorted({names.get(name, name) for name in physical if name in names or name not in hidden})
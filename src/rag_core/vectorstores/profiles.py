@@ -0,0 +1,57 @@
+"""Named HNSW build/search profiles for vector store collections."""
+
+from dataclasses import dataclass, replace
+
+SPACES = ("l2", "cosine", "ip")
+
+
+@dataclass(frozen=True)
+class IndexProfile:
+    """HNSW parameters for a collection.
+
+    ``space``, ``ef_construction`` and ``m`` are fixed when a collection is
+    created; ``ef_search`` can be changed later to trade recall for latency.
+    """
+
+    space: str = "l2"
+    ef_construction: int = 100
+    ef_search: int = 100
+    m: int = 16
+
+    def __post_init__(self) -> None:
+        if self.space not in SPACES:
+            raise ValueError(f"Unknown distance space {self.space!r}; expected one of {', '.join(SPACES)}")
+        for name in ("ef_construction", "ef_search", "m"):
+            if getattr(self, name) <= 0:
+                raise ValueError(f"{name} must be positive, got {getattr(self, name)}")
+
+    def with_space(self, space: str) -> "IndexProfile":
+        """Return a copy of the profile using a different distance space."""
+        return replace(self, space=space)
+
+    def to_metadata(self) -> dict:
+        """Return the profile as ChromaDB collection metadata."""
+        return {
+            "hnsw:space": self.space,
+            "hnsw:construction_ef": self.ef_construction,
+            "hnsw:search_ef": self.ef_search,
+            "hnsw:M": self.m,
+        }
+
+
+INDEX_PROFILES: dict[str, IndexProfile] = {
+    "fast": IndexProfile(ef_construction=64, ef_search=32, m=12),
+    "balanced": IndexProfile(ef_construction=100, ef_search=100, m=16),
+    "high-recall": IndexProfile(ef_construction=400, ef_search=400, m=48),
+}
+
+
+def get_profile(name: str, space: str | None = None) -> IndexProfile:
+    """Look up a named profile, optionally overriding its distance space."""
+    try:
+        profile = INDEX_PROFILES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown index profile {name!r}; expected one of {', '.join(INDEX_PROFILES)}"
+        ) from None
+    return profile.with_space(space) if space else profile
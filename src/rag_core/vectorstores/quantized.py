@@ -0,0 +1,440 @@
+"""Vector store with quantized (int8 / float16) search and full-precision rescoring."""
+
+import json
+import os
+import shutil
+import sqlite3
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+import numpy as np
+from llm_core.tracing import span
+
+from rag_core.arrays import Vectors, as_matrix, as_vector, normalize
+from rag_core.vectorstores.base import BaseVectorStore, RecordBatch, SearchResult
+from rag_core.vectorstores.chroma import DEFAULT_COLLECTION, validate_collection_name
+from rag_core.vectorstores.filters import MetadataFilter
+from rag_core.vectorstores.profiles import SPACES
+
+QUANTIZATIONS = ("int8", "float16")
+
+# Rows scored per block during the approximate pass; bounds the float32
+# scratch memory needed to upcast the compressed codes.
+_SEARCH_BLOCK_ROWS = 65536
+
+# SQLite's default limit on bound parameters per statement.
+_SQL_BATCH = 900
+
+
+class QuantizedStore(BaseVectorStore):
+    """Vector store that searches compressed vectors and rescores at full precision.
+
+    Each collection is a directory holding:
+
+    - ``codes.bin``: int8 or float16 vectors, loaded into memory for search
+    - ``scales.bin``: per-row float32 scales (int8 only)
+    - ``vectors.bin``: float32 vectors, memory-mapped and read only for rescoring
+    - ``records.sqlite``: ids, documents, metadata, index settings, and the
+      rows freed by deletions, which later additions reuse
+
+    A query scores every compressed vector, keeps the best
+    ``top_k * rescore_factor`` candidates, and reranks those using the
+    full-precision vectors. int8 uses symmetric per-vector scaling, so
+    vectors can be appended without recalibration.
+    """
+
+    def __init__(
+        self,
+        persist_dir: Path,
+        collection: str = DEFAULT_COLLECTION,
+        quantization: str = "int8",
+        space: str = "l2",
+        rescore_factor: int = 4,
+    ) -> None:
+        if quantization not in QUANTIZATIONS:
+            raise ValueError(f"Unknown quantization {quantization!r}; expected one of {', '.join(QUANTIZATIONS)}")
+        if space not in SPACES:
+            raise ValueError(f"Unknown distance space {space!r}; expected one of {', '.join(SPACES)}")
+        if rescore_factor < 1:
+            raise ValueError(f"rescore_factor must be at least 1, got {rescore_factor}")
+
+        self._dir = Path(persist_dir) / validate_collection_name(collection)
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._rescore_factor = rescore_factor
+        self._conn = sqlite3.connect(self._dir / "records.sqlite", check_same_thread=False)
+        tracks_free_rows = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'free_rows'"
+        ).fetchone()
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS records (
+                row INTEGER PRIMARY KEY,
+                id TEXT UNIQUE NOT NULL,
+                document TEXT NOT NULL,
+                metadata TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS records_source ON records (json_extract(metadata, '$.source'));
+            CREATE TABLE IF NOT EXISTS free_rows (row INTEGER PRIMARY KEY);
+            CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+            """
+        )
+        if not tracks_free_rows:
+            self._record_holes()
+        # Storage layout is fixed by the first open; later opens must agree.
+        row = self._conn.execute("SELECT value FROM settings WHERE key = '__layout__'").fetchone()
+        stored = json.loads(row[0]) if row else {}
+        if stored and (stored["quantization"], stored["space"]) != (quantization, space):
+            raise ValueError(
+                f"Collection {collection!r} was created with {stored['quantization']} / {stored['space']}, "
+                f"not {quantization} / {space}. Use a different collection or reset it."
+            )
+        self._quantization = quantization
+        self._space = space
+        self._dim: int | None = stored.get("dim")
+        self._write_layout()
+        self._invalidate()
+
+    @staticmethod
+    def list_collections(persist_dir: Path) -> list[str]:
+        """Return the names of all collections in a persist directory."""
+        persist_dir = Path(persist_dir)
+        if not persist_dir.is_dir():
+            return []
+        return sorted(p.name for p in persist_dir.iterdir() if (p / "records.sqlite").exists())
+
+    @staticmethod
+    def drop_collection(persist_dir: Path, collection: str) -> None:
+        """Delete a collection's directory if it exists."""
+        shutil.rmtree(Path(persist_dir) / validate_collection_name(collection), ignore_errors=True)
+
+    # -- layout and caches -------------------------------------------------
+
+    def _write_layout(self) -> None:
+        """Persist quantization, space, and dimension."""
+        layout = {"quantization": self._quantization, "space": self._space, "dim": self._dim}
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO settings (key, value) VALUES ('__layout__', ?)", (json.dumps(layout),)
+            )
+
+    @property
+    def _code_dtype(self) -> np.dtype:
+        return np.dtype(np.int8 if self._quantization == "int8" else np.float16)
+
+    def _num_rows(self) -> int:
+        """Rows in the row files, live or free."""
+        row = self._conn.execute(
+            "SELECT MAX(m) FROM (SELECT MAX(row) AS m FROM records UNION ALL SELECT MAX(row) FROM free_rows)"
+        ).fetchone()
+        return 0 if row[0] is None else row[0] + 1
+
+    def _record_holes(self) -> None:
+        """List the unused rows of a collection written before free rows were tracked."""
+        live = np.fromiter((r for (r,) in self._conn.execute("SELECT row FROM records")), dtype=np.int64)
+        holes = np.setdiff1d(np.arange(self._num_rows()), live)
+        with self._conn:
+            self._conn.executemany("INSERT OR IGNORE INTO free_rows (row) VALUES (?)", ((int(r),) for r in holes))
+
+    def _invalidate(self) -> None:
+        """Drop in-memory views so the next query reloads them from disk."""
+        self._codes: np.ndarray | None = None
+        self._scales: np.ndarray | None = None
+        self._sq_norms: np.ndarray | None = None
+        self._vectors: np.ndarray | None = None
+        self._live_rows: np.ndarray | None = None
+
+    def _load(self) -> None:
+        """Load compressed codes into memory and memory-map full vectors."""
+        n, dim = self._num_rows(), self._dim
+        if self._codes is not None or not n or dim is None:
+            return
+        # Rows freed by deletions and not yet reused are skipped by searches.
+        free = np.fromiter((r for (r,) in self._conn.execute("SELECT row FROM free_rows")), dtype=np.int64)
+        if len(free):
+            self._live_rows = np.setdiff1d(np.arange(n), free)
+        self._codes = np.fromfile(self._dir / "codes.bin", dtype=self._code_dtype, count=n * dim).reshape(n, dim)
+        if self._quantization == "int8":
+            self._scales = np.fromfile(self._dir / "scales.bin", dtype=np.float32, count=n)
+        self._vectors = np.memmap(self._dir / "vectors.bin", dtype=np.float32, mode="r", shape=(n, dim))
+        if self._space == "l2":
+            norms = np.empty(n, dtype=np.float32)
+            for start in range(0, n, _SEARCH_BLOCK_ROWS):
+                block = self._dequantize(start, start + _SEARCH_BLOCK_ROWS)
+                norms[start : start + len(block)] = np.einsum("ij,ij->i", block, block)
+            self._sq_norms = norms
+
+    def _dequantize(self, start: int, end: int) -> np.ndarray:
+        """Return approximate float32 vectors for rows [start, end)."""
+        block = self._codes[start:end].astype(np.float32)
+        if self._scales is not None:
+            block *= self._scales[start:end, None]
+        return block
+
+    # -- writes ------------------------------------------------------------
+
+    def _encode(self, vectors: np.ndarray) -> tuple[np.ndarray, np.ndarray | None]:
+        """Quantize float32 vectors into codes (and per-row scales for int8)."""
+        if self._quantization == "float16":
+            return vectors.astype(np.float16), None
+        scales = np.abs(vectors).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        codes = np.clip(np.rint(vectors / scales[:, None]), -127, 127).astype(np.int8)
+        return codes, scales.astype(np.float32)
+
+    @staticmethod
+    def _write_rows(path: Path, rows: np.ndarray, positions: np.ndarray) -> None:
+        """Write array rows at the given row positions, extending the file as needed.
+
+        Consecutive positions (the common append case) are written in one call.
+        """
+        rows = np.ascontiguousarray(rows)
+        row_bytes = rows[0].nbytes
+        breaks = np.flatnonzero(np.diff(positions) != 1) + 1
+        with open(path, "r+b" if path.exists() else "w+b") as f:
+            for run in np.split(np.arange(len(positions)), breaks):
+                f.seek(int(positions[run[0]]) * row_bytes)
+                f.write(rows[run[0] : run[-1] + 1].tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+
+    def add(
+        self,
+        ids: list[str],
+        embeddings: Vectors,
+        documents: list[str],
+        metadatas: list[dict],
+    ) -> None:
+        """Add or overwrite documents and their vectors."""
+        if not ids:
+            return
+        with span("store.add", backend="quantized", rows=len(ids)):
+            self._upsert(ids, as_matrix(embeddings), documents, metadatas)
+
+    def _upsert(self, ids: list[str], vectors: np.ndarray, documents: list[str], metadatas: list[dict]) -> None:
+        """Write vectors to their rows (reusing rows of known ids), then commit the records."""
+        if self._dim is None:
+            self._dim = vectors.shape[1]
+            self._write_layout()
+        elif vectors.shape[1] != self._dim:
+            raise ValueError(
+                f"Embedding dimension {vectors.shape[1]} does not match collection dimension {self._dim}"
+            )
+        if self._space == "cosine":
+            vectors = normalize(vectors)
+
+        existing: dict[str, int] = {}
+        for i in range(0, len(ids), _SQL_BATCH):
+            batch = ids[i : i + _SQL_BATCH]
+            sql = f"SELECT id, row FROM records WHERE id IN ({','.join('?' * len(batch))})"
+            existing.update(self._conn.execute(sql, batch).fetchall())
+
+        # New ids fill rows freed by deletions before the files are extended,
+        # so replacing a file's chunks (as watch does) does not grow them.
+        num_new = len(set(ids) - existing.keys())
+        free = [r for (r,) in self._conn.execute("SELECT row FROM free_rows ORDER BY row LIMIT ?", (num_new,))]
+        available = iter(free)
+        next_row = self._num_rows()
+        positions = np.empty(len(ids), dtype=np.int64)
+        for i, chunk_id in enumerate(ids):
+            if chunk_id in existing:
+                positions[i] = existing[chunk_id]
+            else:
+                row = next(available, None)
+                if row is None:
+                    row, next_row = next_row, next_row + 1
+                positions[i] = existing[chunk_id] = row
+
+        # Vectors go to disk before the rows that reference them are committed.
+        codes, scales = self._encode(vectors)
+        self._write_rows(self._dir / "vectors.bin", vectors, positions)
+        self._write_rows(self._dir / "codes.bin", codes, positions)
+        if scales is not None:
+            self._write_rows(self._dir / "scales.bin", scales, positions)
+
+        with self._conn:
+            self._conn.executemany("DELETE FROM free_rows WHERE row = ?", ((r,) for r in free))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO records (row, id, document, metadata) VALUES (?, ?, ?, ?)",
+                [
+                    (int(pos), chunk_id, doc, json.dumps(meta or {}))
+                    for pos, chunk_id, doc, meta in zip(positions, ids, documents, metadatas)
+                ],
+            )
+        self._invalidate()
+
+    # -- queries -----------------------------------------------------------
+
+    def _allowed_rows(self, where: MetadataFilter) -> np.ndarray:
+        """Resolve a metadata filter to the matching row numbers."""
+        clauses: list[str] = []
+        params: list = []
+        if where.extensions:
+            clauses.append(f"json_extract(metadata, '$.extension') IN ({','.join('?' * len(where.extensions))})")
+            params.extend(where.extensions)
+        if where.modified_after is not None:
+            clauses.append("json_extract(metadata, '$.modified') >= ?")
+            params.append(where.modified_after)
+        sql = "SELECT row, json_extract(metadata, '$.source') FROM records"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        rows = [row for row, source in self._conn.execute(sql, params) if where.matches_source(source or "")]
+        return np.asarray(sorted(rows), dtype=np.int64)
+
+    def _approximate_distances(self, query: np.ndarray, rows: np.ndarray | None) -> np.ndarray:
+        """Distances from the query to the compressed vectors (all rows, or the given ones)."""
+        if rows is None:
+            n = len(self._codes)
+            dots = np.empty(n, dtype=np.float32)
+            for start in range(0, n, _SEARCH_BLOCK_ROWS):
+                block = self._codes[start : start + _SEARCH_BLOCK_ROWS].astype(np.float32)
+                dots[start : start + len(block)] = block @ query
+            if self._scales is not None:
+                dots *= self._scales
+            sq_norms = self._sq_norms
+        else:
+            block = self._codes[rows].astype(np.float32)
+            dots = block @ query
+            if self._scales is not None:
+                dots *= self._scales[rows]
+            sq_norms = self._sq_norms[rows] if self._sq_norms is not None else None
+        return self._to_distance(dots, sq_norms, query)
+
+    def _to_distance(self, dots: np.ndarray, sq_norms: np.ndarray | None, query: np.ndarray) -> np.ndarray:
+        """Convert dot products into ChromaDB-compatible distances."""
+        if self._space == "l2":
+            return sq_norms - 2.0 * dots + float(query @ query)
+        return 1.0 - dots
+
+    def query(
+        self, query_embedding: np.ndarray | list[float], top_k: int = 3, where: MetadataFilter | None = None
+    ) -> list[SearchResult]:
+        """Approximate search over compressed vectors, then exact rescoring of the best candidates."""
+        with span("store.query", backend="quantized", top_k=top_k) as s:
+            results = self._search(query_embedding, top_k, where)
+            s.set(results=len(results))
+        return results
+
+    def _search(self, query_embedding, top_k: int, where: MetadataFilter | None) -> list[SearchResult]:
+        """Run a query; see query()."""
+        self._load()
+        if self._codes is None or top_k <= 0:
+            return []
+        query = as_vector(query_embedding)
+        if self._space == "cosine":
+            query = normalize(query)
+
+        rows = self._allowed_rows(where) if where is not None and not where.is_empty() else self._live_rows
+        if rows is not None and len(rows) == 0:
+            return []
+
+        approx = self._approximate_distances(query, rows)
+        num_candidates = min(len(approx), top_k * self._rescore_factor)
+        candidates = np.argpartition(approx, num_candidates - 1)[:num_candidates]
+        if rows is not None:
+            candidates = rows[candidates]
+        candidates.sort()
+
+        full = np.asarray(self._vectors[candidates])
+        dots = full @ query
+        sq_norms = np.einsum("ij,ij->i", full, full) if self._space == "l2" else None
+        exact = self._to_distance(dots, sq_norms, query)
+        best = np.argsort(exact)[:top_k]
+        return self._results(candidates[best], exact[best])
+
+    def _results(self, rows: np.ndarray, distances: np.ndarray) -> list[SearchResult]:
+        """Build SearchResults for the given rows, preserving their order."""
+        row_list = [int(r) for r in rows]
+        sql = f"SELECT row, id, document, metadata FROM records WHERE row IN ({','.join('?' * len(row_list))})"
+        found = {row: (cid, doc, meta) for row, cid, doc, meta in self._conn.execute(sql, row_list)}
+        return [
+            SearchResult(id=found[row][0], document=found[row][1], metadata=json.loads(found[row][2]), distance=float(d))
+            for row, d in zip(row_list, distances)
+            if row in found
+        ]
+
+    def iter_records(self, batch_size: int = 1000, include_embeddings: bool = True) -> Iterator[RecordBatch]:
+        """Page through all stored records with their full-precision vectors."""
+        self._load()
+        last_row = -1
+        while True:
+            page = self._conn.execute(
+                "SELECT row, id, document, metadata FROM records WHERE row > ? ORDER BY row LIMIT ?",
+                (last_row, batch_size),
+            ).fetchall()
+            if not page:
+                return
+            rows = [r[0] for r in page]
+            yield RecordBatch(
+                ids=[r[1] for r in page],
+                embeddings=np.asarray(self._vectors[rows]) if include_embeddings else None,
+                documents=[r[2] for r in page],
+                metadatas=[json.loads(r[3]) for r in page],
+            )
+            last_row = rows[-1]
+
+    def delete_sources(self, sources: Iterable[str]) -> int:
+        """Delete the chunks of the given files, or of all files below a "dir/" source.
+
+        Lookups use the index on the source field. The freed vector rows
+        are reused by later additions.
+        """
+        sources = [str(s) for s in sources]
+        files = [s for s in sources if not s.endswith("/")]
+        rows: set[int] = set()
+        for i in range(0, len(files), _SQL_BATCH):
+            batch = files[i : i + _SQL_BATCH]
+            sql = f"SELECT row FROM records WHERE json_extract(metadata, '$.source') IN ({','.join('?' * len(batch))})"
+            rows.update(r for (r,) in self._conn.execute(sql, batch))
+        for prefix in (s for s in sources if s.endswith("/")):
+            # Everything starting with "dir/" sorts between "dir/" and "dir0".
+            sql = (
+                "SELECT row FROM records "
+                "WHERE json_extract(metadata, '$.source') >= ? AND json_extract(metadata, '$.source') < ?"
+            )
+            rows.update(r for (r,) in self._conn.execute(sql, (prefix, prefix[:-1] + "0")))
+        if rows:
+            with self._conn:
+                self._conn.executemany("DELETE FROM records WHERE row = ?", ((r,) for r in rows))
+                self._conn.executemany("INSERT INTO free_rows (row) VALUES (?)", ((r,) for r in rows))
+            self._invalidate()
+        return len(rows)
+
+    def existing_ids(self) -> set[str]:
+        """Return all document IDs currently in the store."""
+        return {row[0] for row in self._conn.execute("SELECT id FROM records")}
+
+    def count(self) -> int:
+        """Return the number of documents in the store."""
+        return self._conn.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+
+    def get_settings(self) -> dict:
+        """Return the index settings recorded for this collection."""
+        rows = self._conn.execute("SELECT key, value FROM settings WHERE key != '__layout__'")
+        return {key: json.loads(value) for key, value in rows}
+
+    def set_settings(self, settings: dict) -> None:
+        """Record index settings, merging with existing ones."""
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+                [(key, json.dumps(value)) for key, value in settings.items()],
+            )
+
+    def reset(self) -> None:
+        """Delete all records and vectors, keeping the storage layout."""
+        with self._conn:
+            self._conn.execute("DELETE FROM records")
+            self._conn.execute("DELETE FROM free_rows")
+            self._conn.execute("DELETE FROM settings WHERE key != '__layout__'")
+        self._dim = None
+        self._write_layout()
+        self._invalidate()
+        for name in ("codes.bin", "scales.bin", "vectors.bin"):
+            path = self._dir / name
+            if path.exists():
+                path.unlink()
+
+    def close(self) -> None:
+        """Release the memory map and close the SQLite connection."""
+        self._invalidate()
+        self._conn.close()
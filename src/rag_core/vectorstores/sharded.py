@@ -0,0 +1,173 @@
+"""Vector store that spreads a collection over several stores."""
+
+import hashlib
+import itertools
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from llm_core.tracing import span, submit_in_context
+
+from rag_core.arrays import Vectors, as_matrix
+from rag_core.vectorstores.base import BaseVectorStore, RecordBatch, SearchResult, merge_results
+from rag_core.vectorstores.filters import MetadataFilter
+
+
+def shard_of(key: str | Path, num_shards: int) -> int:
+    """Shard of a source path or id, stable across runs, machines and Python hash seeds."""
+    digest = hashlib.sha256(str(key).encode()).digest()
+    return int.from_bytes(digest[:8], "big") % num_shards
+
+
+def shard_dir(persist_dir: str | Path, shard: int) -> Path:
+    """Directory holding one shard of the sharded collections in persist_dir.
+
+    Each shard gets its own directory, and with it its own ChromaDB client
+    and database file, so parallel shard queries do not contend on one.
+    """
+    return Path(persist_dir) / "shards" / str(shard)
+
+
+def open_shards(
+    open_store: Callable[[Path, str], BaseVectorStore], persist_dir: str | Path, collection: str, num_shards: int
+) -> "ShardedStore":
+    """Open a collection spread over num_shards stores.
+
+    Shard i is the collection ``<collection>.s<i>`` in shard_dir(persist_dir, i).
+
+    Args:
+        open_store: Opens (or creates) a store from a directory and a collection name.
+        persist_dir: The backend's persist directory.
+        collection: Name of the sharded collection.
+        num_shards: Number of shards; must match the count the collection was built with.
+    """
+    return ShardedStore([open_store(shard_dir(persist_dir, i), f"{collection}.s{i}") for i in range(num_shards)])
+
+
+class ShardedStore(BaseVectorStore):
+    """Routes chunks to one of several stores by a hash of their source file.
+
+    All chunks of a file live in the same shard, so deleting or replacing a
+    file touches one store. Queries run on every shard in parallel and the
+    per-shard top_k lists are merged by distance, which gives the same
+    results as one store holding everything. Searches in ChromaDB and numpy
+    release the GIL, so threads are enough to use several cores.
+
+    Args:
+        stores: The shards, always passed in the same order.
+        max_workers: Threads for fan-out; defaults to one per shard.
+    """
+
+    def __init__(self, stores: Sequence[BaseVectorStore], *, max_workers: int | None = None) -> None:
+        if not stores:
+            raise ValueError("ShardedStore needs at least one store")
+        self._stores = list(stores)
+        self._pool = ThreadPoolExecutor(max_workers=max_workers or len(self._stores))
+
+    @property
+    def shards(self) -> list[BaseVectorStore]:
+        """The underlying stores, in shard order."""
+        return list(self._stores)
+
+    def _shard(self, chunk_id: str, metadata: dict) -> int:
+        return shard_of(metadata.get("source", chunk_id), len(self._stores))
+
+    def _map(self, fn, items: Iterable | None = None) -> list:
+        """Call fn on each store (or item) concurrently, returning results in order."""
+        futures = [
+            submit_in_context(self._pool, fn, item)
+            for item in (self._stores if items is None else items)
+        ]
+        return [future.result() for future in futures]
+
+    def add(
+        self,
+        ids: list[str],
+        embeddings: Vectors,
+        documents: list[str],
+        metadatas: list[dict],
+    ) -> None:
+        """Split the rows by shard and add each part to its store."""
+        matrix = as_matrix(embeddings)
+        rows: dict[int, list[int]] = {}
+        for i, (chunk_id, metadata) in enumerate(zip(ids, metadatas, strict=True)):
+            rows.setdefault(self._shard(chunk_id, metadata), []).append(i)
+
+        def add_part(item: tuple[int, list[int]]) -> None:
+            shard, part = item
+            self._stores[shard].add(
+                ids=[ids[i] for i in part],
+                embeddings=matrix[part],
+                documents=[documents[i] for i in part],
+                metadatas=[metadatas[i] for i in part],
+            )
+
+        self._map(add_part, rows.items())
+
+    def query(
+        self, query_embedding: np.ndarray | list[float], top_k: int = 3, where: MetadataFilter | None = None
+    ) -> list[SearchResult]:
+        """Query every shard in parallel and merge the results by distance."""
+        with span("store.query", backend="sharded", shards=len(self._stores), top_k=top_k):
+            return merge_results(
+                self._map(lambda store: store.query(query_embedding=query_embedding, top_k=top_k, where=where)),
+                top_k,
+            )
+
+    def query_batch(
+        self, query_embeddings: Vectors, top_k: int = 3, where: MetadataFilter | None = None
+    ) -> list[list[SearchResult]]:
+        """Run a batch on every shard in parallel and merge per query."""
+        matrix = as_matrix(query_embeddings)
+        with span("store.query", backend="sharded", shards=len(self._stores), top_k=top_k, queries=len(matrix)):
+            per_shard = self._map(lambda store: store.query_batch(matrix, top_k=top_k, where=where))
+            return [merge_results(results, top_k) for results in zip(*per_shard)]
+
+    def iter_records(self, batch_size: int = 1000, include_embeddings: bool = True) -> Iterator[RecordBatch]:
+        """Iterate over the records of each shard in turn."""
+        return itertools.chain.from_iterable(
+            store.iter_records(batch_size=batch_size, include_embeddings=include_embeddings)
+            for store in self._stores
+        )
+
+    def delete_sources(self, sources: Iterable[str]) -> int:
+        """Delete files from their shard; directories may span all shards."""
+        parts: list[list[str]] = [[] for _ in self._stores]
+        for source in sources:
+            if source.endswith("/"):
+                for part in parts:
+                    part.append(source)
+            else:
+                parts[shard_of(source, len(self._stores))].append(source)
+        return sum(
+            self._map(lambda item: item[0].delete_sources(item[1]) if item[1] else 0, zip(self._stores, parts))
+        )
+
+    def existing_ids(self) -> set[str]:
+        """Return the ids of all shards."""
+        return set().union(*self._map(lambda store: store.existing_ids()))
+
+    def count(self) -> int:
+        """Return the number of chunks over all shards."""
+        return sum(self._map(lambda store: store.count()))
+
+    def get_settings(self) -> dict:
+        """Return the settings recorded with the shards (all shards record the same)."""
+        return self._stores[0].get_settings()
+
+    def set_settings(self, settings: dict) -> None:
+        """Record index settings with every shard."""
+        self._map(lambda store: store.set_settings(settings))
+
+    def reset(self) -> None:
+        """Delete all data from every shard."""
+        self._map(lambda store: store.reset())
+
+    def close(self) -> None:
+        """Stop the fan-out threads and close shards that support it."""
+        self._pool.shutdown(wait=True)
+        for store in self._stores:
+            close = getattr(store, "close", None)
+            if close is not None:
+                close()
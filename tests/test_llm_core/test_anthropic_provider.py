@@ -1,7 +1,9 @@
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from llm_core.providers.anthropic import AnthropicProvider
-from llm_core.providers.base import LLMResponse
+from llm_core.providers.base import ContentBlock, LLMResponse
 
 
 def test_generate_returns_llm_response():
@@ -30,3 +32,43 @@ def test_generate_returns_llm_response():
         system="Be concise.",
         messages=[{"role": "user", "content": "What is the capital of France?"}],
     )
+
+
+def test_generate_sends_cached_blocks_and_reports_cache_usage():
+    """Cached content blocks should carry cache_control; cache token counts come back on the response."""
+    mock_message = MagicMock()
+    mock_message.content = [MagicMock(text="Answer.")]
+    mock_message.model = "claude-3-5-sonnet-latest"
+    mock_message.usage.input_tokens = 12
+    mock_message.usage.output_tokens = 3
+    mock_message.usage.cache_read_input_tokens = 2000
+    mock_message.usage.cache_creation_input_tokens = 0
+
+    with patch("llm_core.providers.anthropic.Anthropic") as MockClient:
+        MockClient.return_value.messages.create.return_value = mock_message
+
+        provider = AnthropicProvider(api_key="test-key")
+        response = provider.generate(
+            [ContentBlock("Context: ...", cache=True), ContentBlock("Question?")],
+            system=[ContentBlock("Be concise.", cache=True)],
+        )
+
+    assert (response.input_tokens, response.cache_read_tokens, response.cache_write_tokens) == (12, 2000, 0)
+    kwargs = MockClient.return_value.messages.create.call_args.kwargs
+    assert kwargs["system"] == [{"type": "text", "text": "Be concise.", "cache_control": {"type": "ephemeral"}}]
+    assert kwargs["messages"] == [
+        {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": "Context: ...", "cache_control": {"type": "ephemeral"}},
+                {"type": "text", "text": "Question?"},
+            ],
+        }
+    ]
+
+
+def test_generate_rejects_too_many_cache_breakpoints():
+    with patch("llm_core.providers.anthropic.Anthropic"):
+        provider = AnthropicProvider(api_key="test-key")
+        with pytest.raises(ValueError, match="At most 4"):
+            provider.generate([ContentBlock(str(i), cache=True) for i in range(5)])
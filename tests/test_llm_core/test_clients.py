@@ -0,0 +1,100 @@
+"""Tests for the shared client registry and provider factory."""
+
+from unittest.mock import patch
+
+import pytest
+
+from llm_core.clients import close_clients, get_anthropic_client, get_ollama_client, get_openai_client
+from llm_core.config import LLMSettings
+from llm_core.factory import create_embedding_provider, create_llm_provider, ollama_keep_alive, warm_up_models
+from llm_core.providers.anthropic import AnthropicProvider
+from llm_core.providers.ollama import OllamaEmbeddingProvider
+
+
+@pytest.fixture(autouse=True)
+def _fresh_registry():
+    close_clients()
+    yield
+    close_clients()
+
+
+def test_clients_are_cached_per_key_and_host():
+    """The same endpoint and key should share one client; others get their own."""
+    assert get_anthropic_client("key-a") is get_anthropic_client("key-a")
+    assert get_anthropic_client("key-a") is not get_anthropic_client("key-b")
+    assert get_openai_client("key-a") is not get_openai_client("key-a", base_url="http://proxy.local/v1")
+    assert get_ollama_client("http://localhost:11434") is get_ollama_client("http://localhost:11434")
+
+
+def test_sdk_retries_are_disabled():
+    """Retries are handled by llm_core.retry, not by the SDKs."""
+    assert get_anthropic_client("key").max_retries == 0
+    assert get_openai_client("key").max_retries == 0
+
+
+def test_close_clients_empties_registry():
+    """After closing, a new client should be created."""
+    client = get_openai_client("key")
+    close_clients()
+    assert get_openai_client("key") is not client
+
+
+def test_factory_providers_share_clients():
+    """Providers built by the factory for the same settings should reuse one client."""
+    settings = LLMSettings(_env_file=None, anthropic_api_key="key", model="claude-3-5-haiku-latest")
+
+    first = create_llm_provider(settings)
+    second = create_llm_provider(settings)
+
+    assert isinstance(first, AnthropicProvider)
+    assert first._client is second._client
+
+
+def test_factory_routes_ollama_prefix():
+    """The ollama: prefix should build Ollama providers without API keys."""
+    settings = LLMSettings(_env_file=None, embedding_model="ollama:nomic-embed-text")
+
+    provider = create_embedding_provider(settings)
+
+    assert isinstance(provider, OllamaEmbeddingProvider)
+    assert provider._model == "nomic-embed-text"
+
+
+def test_factory_requires_api_keys():
+    """Cloud providers without keys should raise ValueError."""
+    settings = LLMSettings(_env_file=None, anthropic_api_key="", openai_api_key="")
+
+    with pytest.raises(ValueError, match="ANTHROPIC_API_KEY"):
+        create_llm_provider(settings)
+    with pytest.raises(ValueError, match="OPENAI_API_KEY"):
+        create_embedding_provider(settings)
+
+
+def test_ollama_keep_alive_from_settings():
+    """Numbers are seconds, other values durations; pinning overrides both."""
+    assert ollama_keep_alive(LLMSettings(_env_file=None)) is None
+    assert ollama_keep_alive(LLMSettings(_env_file=None, ollama_keep_alive="600")) == 600.0
+    assert ollama_keep_alive(LLMSettings(_env_file=None, ollama_keep_alive="30m")) == "30m"
+    assert ollama_keep_alive(LLMSettings(_env_file=None, ollama_keep_alive="30m", ollama_pin_models=True)) == -1
+
+    pinned = LLMSettings(_env_file=None, embedding_model="ollama:e", ollama_pin_models=True)
+    assert create_embedding_provider(pinned)._keep_alive == -1
+
+
+def test_warm_up_models_loads_only_ollama_models():
+    """Ollama models load on background threads; cloud models and disabled warm-up are skipped."""
+    settings = LLMSettings(_env_file=None, anthropic_api_key="key", embedding_model="ollama:nomic-embed-text")
+
+    with (
+        patch("llm_core.providers.ollama.OllamaProvider.warm_up") as chat_warm_up,
+        patch("llm_core.providers.ollama.OllamaEmbeddingProvider.warm_up") as embed_warm_up,
+    ):
+        threads = warm_up_models(settings, model=settings.model, embedding_model=settings.embedding_model)
+        for thread in threads:
+            thread.join()
+        assert len(threads) == 1
+        embed_warm_up.assert_called_once_with()
+        chat_warm_up.assert_not_called()
+
+        off = settings.model_copy(update={"ollama_warm_up": False})
+        assert warm_up_models(off, embedding_model=off.embedding_model) == []
@@ -0,0 +1,166 @@
+"""Tests for provider fallback chains and hedged requests."""
+
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+import llm_core
+from llm_core.config import LLMSettings
+from llm_core.factory import create_llm_provider
+from llm_core.providers.anthropic import AnthropicProvider
+from llm_core.providers.base import LLMResponse
+from llm_core.providers.fallback import AllProvidersFailedError, FallbackProvider
+from llm_core.providers.ollama import OllamaProvider
+from llm_core.ratelimit import CircuitOpenError
+
+
+def _provider(model: str, *, block: threading.Event | None = None, error: Exception | None = None) -> MagicMock:
+    def generate(prompt, *, system=""):
+        if block is not None:
+            block.wait(5)
+        if error is not None:
+            raise error
+        return LLMResponse(text=f"answer from {model}", model=model, input_tokens=1, output_tokens=1)
+
+    provider = MagicMock()
+    provider.generate.side_effect = generate
+    return provider
+
+
+def test_first_provider_answers():
+    """A healthy primary should be the only provider called."""
+    primary, fallback = _provider("primary"), _provider("fallback")
+
+    response = FallbackProvider([primary, fallback]).generate("q", system="s")
+
+    assert response.model == "primary"
+    primary.generate.assert_called_once_with("q", system="s")
+    fallback.generate.assert_not_called()
+
+
+def test_falls_back_on_failure():
+    """An exhausted or open-circuit primary should hand over to the next provider."""
+    primary = _provider("primary", error=CircuitOpenError("anthropic is down"))
+    fallback = _provider("fallback")
+
+    response = FallbackProvider([primary, fallback]).generate("q")
+
+    assert response.model == "fallback"
+
+
+def test_non_transient_errors_are_not_masked():
+    """Bad requests would fail on every provider, so they should surface immediately."""
+    primary = _provider("primary", error=ValueError("bad request"))
+    fallback = _provider("fallback")
+
+    with pytest.raises(ValueError):
+        FallbackProvider([primary, fallback]).generate("q")
+    fallback.generate.assert_not_called()
+
+
+def test_all_failures_are_reported():
+    """When every provider fails, all errors should be collected."""
+    errors = [ConnectionError("a"), TimeoutError("b")]
+    chain = FallbackProvider([_provider("a", error=errors[0]), _provider("b", error=errors[1])])
+
+    with pytest.raises(AllProvidersFailedError) as exc_info:
+        chain.generate("q")
+
+    assert exc_info.value.errors == errors
+
+
+def test_hedge_wins_when_primary_is_slow():
+    """A hedged request should answer while the slow primary is still running."""
+    release = threading.Event()
+    primary = _provider("primary", block=release)
+    fallback = _provider("fallback")
+
+    start = time.perf_counter()
+    response = FallbackProvider([primary, fallback], hedge_after=0.05).generate("q")
+    elapsed = time.perf_counter() - start
+    release.set()
+
+    assert response.model == "fallback"
+    assert elapsed < 1
+
+
+def test_abandoned_hedge_does_not_delay_exit():
+    """The process should exit once the hedge answers, without waiting for the slow primary."""
+    script = """
+import time
+from llm_core.providers.base import BaseLLMProvider, LLMResponse
+from llm_core.providers.fallback import FallbackProvider
+
+class Provider(BaseLLMProvider):
+    def __init__(self, delay):
+        self.delay = delay
+
+    def generate(self, prompt, *, system=""):
+        time.sleep(self.delay)
+        return LLMResponse(text="", model=str(self.delay), input_tokens=0, output_tokens=0)
+
+print(FallbackProvider([Provider(30), Provider(0)], hedge_after=0.05).generate("q").model)
+"""
+    env = {**os.environ, "PYTHONPATH": str(Path(llm_core.__file__).parents[1])}
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, timeout=60, env=env)
+
+    assert result.stdout.strip() == "0", result.stderr
+    assert time.perf_counter() - start < 10
+
+
+def test_no_hedge_when_primary_is_fast():
+    """A primary answering within the hedge delay should not trigger the fallback."""
+    primary, fallback = _provider("primary"), _provider("fallback")
+
+    response = FallbackProvider([primary, fallback], hedge_after=1).generate("q")
+
+    assert response.model == "primary"
+    fallback.generate.assert_not_called()
+
+
+def test_hedged_failure_starts_next_immediately():
+    """A failing primary should not make the chain wait out the hedge delay."""
+    primary = _provider("primary", error=ConnectionError("down"))
+    fallback = _provider("fallback")
+
+    start = time.perf_counter()
+    response = FallbackProvider([primary, fallback], hedge_after=5).generate("q")
+
+    assert response.model == "fallback"
+    assert time.perf_counter() - start < 1
+
+
+def test_rejects_invalid_configuration():
+    with pytest.raises(ValueError):
+        FallbackProvider([])
+    with pytest.raises(ValueError):
+        FallbackProvider([_provider("a")], hedge_after=0)
+
+
+def test_factory_builds_chain_from_settings():
+    """Fallback models from settings should follow the primary model in order."""
+    settings = LLMSettings(
+        anthropic_api_key="key",
+        fallback_models=["ollama:llama3.2"],
+        hedge_after_seconds=2.5,
+        _env_file=None,
+    )
+
+    provider = create_llm_provider(settings)
+
+    assert isinstance(provider, FallbackProvider)
+    assert [type(p) for p in provider._providers] == [AnthropicProvider, OllamaProvider]
+    assert provider._hedge_after == 2.5
+
+
+def test_factory_without_fallbacks_returns_single_provider():
+    settings = LLMSettings(anthropic_api_key="key", _env_file=None)
+
+    assert isinstance(create_llm_provider(settings), AnthropicProvider)
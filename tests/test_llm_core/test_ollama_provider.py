@@ -2,7 +2,9 @@
 
 from unittest.mock import MagicMock, patch
 
-from llm_core.providers.base import LLMResponse
+import numpy as np
+
+from llm_core.providers.base import ContentBlock, LLMResponse
 from llm_core.providers.ollama import OllamaEmbeddingProvider, OllamaProvider
 
 
@@ -82,7 +84,8 @@ def test_embed_single_text():
         provider = OllamaEmbeddingProvider(model="nomic-embed-text")
         vectors = provider.embed(["hello world"])
 
-    assert vectors == [[0.1, 0.2, 0.3]]
+    np.testing.assert_allclose(vectors, [[0.1, 0.2, 0.3]], rtol=1e-6)
+    assert vectors.dtype == np.float32
     MockClient.return_value.embed.assert_called_once_with(
         model="nomic-embed-text",
         input=["hello world"],
@@ -90,10 +93,45 @@ def test_embed_single_text():
 
 
 def test_embed_empty_list():
-    """Embedding an empty list should return an empty list without calling the API."""
+    """Embedding an empty list should return an empty array without calling the API."""
     with patch("llm_core.providers.ollama._ollama_lib.Client") as MockClient:
         provider = OllamaEmbeddingProvider(model="nomic-embed-text")
         vectors = provider.embed([])
 
-    assert vectors == []
+    assert vectors.shape == (0, 0)
     MockClient.return_value.embed.assert_not_called()
+
+
+def test_generate_joins_content_blocks():
+    """Content blocks should be sent to Ollama as plain text."""
+    with patch("llm_core.providers.ollama._ollama_lib.Client") as MockClient:
+        MockClient.return_value.chat.return_value = MagicMock(prompt_eval_count=1, eval_count=1)
+
+        provider = OllamaProvider(model="llama3.2")
+        provider.generate([ContentBlock("Context", cache=True), ContentBlock("Question")], system=[ContentBlock("Sys")])
+
+    assert MockClient.return_value.chat.call_args.kwargs["messages"] == [
+        {"role": "system", "content": "Sys"},
+        {"role": "user", "content": "Context\n\nQuestion"},
+    ]
+
+
+def test_keep_alive_is_sent_with_requests_and_warm_up():
+    """A configured keep_alive goes with every request; warm_up loads the model and reports the load time."""
+    with patch("llm_core.providers.ollama._ollama_lib.Client") as MockClient:
+        client = MockClient.return_value
+        client.chat.return_value = MagicMock(prompt_eval_count=1, eval_count=1, load_duration=0)
+        client.generate.return_value = MagicMock(load_duration=2_500_000_000)
+        client.embed.return_value = MagicMock(embeddings=[[0.1]], load_duration=None)
+
+        provider = OllamaProvider(model="llama3.2", keep_alive=-1)
+        provider.generate("Hi")
+        assert provider.warm_up() == 2.5
+        embedder = OllamaEmbeddingProvider(model="nomic-embed-text", keep_alive="30m")
+        embedder.embed(["a"])
+        assert embedder.warm_up() == 0.0
+
+    assert client.chat.call_args.kwargs["keep_alive"] == -1
+    client.generate.assert_called_once_with(model="llama3.2", keep_alive=-1)
+    assert client.embed.call_args_list[0].kwargs == {"model": "nomic-embed-text", "input": ["a"], "keep_alive": "30m"}
+    assert client.embed.call_args_list[1].kwargs == {"model": "nomic-embed-text", "input": [], "keep_alive": "30m"}
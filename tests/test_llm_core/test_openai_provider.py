@@ -1,5 +1,8 @@
+import base64
 from unittest.mock import MagicMock, patch
 
+import numpy as np
+
 from llm_core.providers.openai import OpenAIEmbeddingProvider
 
 
@@ -16,10 +19,12 @@ def test_embed_single_text():
         provider = OpenAIEmbeddingProvider(api_key="test-key")
         vectors = provider.embed(["Hello world"])
 
-    assert vectors == [[0.1, 0.2, 0.3]]
+    np.testing.assert_allclose(vectors, [[0.1, 0.2, 0.3]], rtol=1e-6)
+    assert vectors.dtype == np.float32
     MockClient.return_value.embeddings.create.assert_called_once_with(
         model="text-embedding-3-small",
         input=["Hello world"],
+        encoding_format="base64",
     )
 
 
@@ -38,6 +43,32 @@ def test_embed_batch():
         provider = OpenAIEmbeddingProvider(api_key="test-key")
         vectors = provider.embed(["text one", "text two"])
 
-    assert len(vectors) == 2
-    assert vectors[0] == [0.1, 0.2]
-    assert vectors[1] == [0.3, 0.4]
+    assert vectors.shape == (2, 2)
+    np.testing.assert_allclose(vectors[0], [0.1, 0.2], rtol=1e-6)
+    np.testing.assert_allclose(vectors[1], [0.3, 0.4], rtol=1e-6)
+
+
+def test_embed_decodes_base64():
+    """Base64 payloads should be decoded straight into a float32 array."""
+    mock_embedding = MagicMock()
+    mock_embedding.embedding = base64.b64encode(np.array([0.5, -1.5], dtype=np.float32).tobytes()).decode()
+    mock_response = MagicMock()
+    mock_response.data = [mock_embedding]
+
+    with patch("llm_core.providers.openai.OpenAI") as MockClient:
+        MockClient.return_value.embeddings.create.return_value = mock_response
+
+        provider = OpenAIEmbeddingProvider(api_key="test-key")
+        vectors = provider.embed(["Hello"])
+
+    assert vectors.tolist() == [[0.5, -1.5]]
+
+
+def test_embed_empty_list():
+    """Embedding an empty list should return an empty array without calling the API."""
+    with patch("llm_core.providers.openai.OpenAI") as MockClient:
+        provider = OpenAIEmbeddingProvider(api_key="test-key")
+        vectors = provider.embed([])
+
+    assert vectors.shape == (0, 0)
+    MockClient.return_value.embeddings.create.assert_not_called()
@@ -0,0 +1,73 @@
+"""Tests for the token-bucket rate limiter and circuit breaker."""
+
+import pytest
+
+from llm_core.ratelimit import CircuitBreaker, CircuitOpenError, RateLimiter
+
+
+class FakeClock:
+    """Manually advanced clock whose sleep just moves time forward."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def test_requests_per_minute_paces_after_burst():
+    """Should allow a burst of 10 seconds' quota, then pace at the configured rate."""
+    clock = FakeClock()
+    limiter = RateLimiter(requests_per_minute=60, clock=clock, sleep=clock.sleep)
+
+    for _ in range(10):
+        assert limiter.acquire() == 0.0
+    assert limiter.acquire() == pytest.approx(1.0)
+    assert clock.now == pytest.approx(1.0)
+
+
+def test_tokens_per_minute_limit():
+    """Token usage should be limited independently of request count."""
+    clock = FakeClock()
+    limiter = RateLimiter(tokens_per_minute=6000, clock=clock, sleep=clock.sleep)
+
+    assert limiter.acquire(tokens=400) == 0.0
+    # 600 of the bucket's 1000 tokens are left; 900 more need 3 s of refill at 100 tokens/s.
+    assert limiter.acquire(tokens=900) == pytest.approx(3.0)
+
+
+def test_unlimited_by_default():
+    """Without limits acquire never waits."""
+    limiter = RateLimiter(sleep=lambda s: pytest.fail("should not sleep"))
+    for _ in range(1000):
+        limiter.acquire(tokens=10_000)
+
+
+def test_pause_holds_back_callers():
+    """A pause (e.g. from Retry-After) should delay the next acquire."""
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+    limiter.pause(2.5)
+
+    assert limiter.acquire() == pytest.approx(2.5)
+
+
+def test_circuit_breaker_opens_and_recovers():
+    """Should reject calls after the threshold and allow them again after the timeout."""
+    clock = FakeClock()
+    breaker = CircuitBreaker("svc", failure_threshold=2, reset_timeout=10, clock=clock)
+
+    breaker.record_failure()
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.is_open
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    clock.now = 10.0
+    breaker.before_call()
+    breaker.record_success()
+    assert not breaker.is_open
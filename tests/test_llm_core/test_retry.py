@@ -1,8 +1,11 @@
 """Tests for the retry utility with exponential backoff."""
 
+from unittest.mock import MagicMock
+
 import pytest
 
-from llm_core.retry import with_retry
+from llm_core.ratelimit import CircuitOpenError, get_circuit_breaker
+from llm_core.retry import _Backoff, is_retryable, retry_after, with_retry
 
 
 def test_retry_succeeds_on_second_attempt():
@@ -31,3 +34,92 @@ def test_retry_exhausted_raises():
 
     with pytest.raises(ConnectionError):
         always_fails()
+
+
+def test_non_transient_os_errors_are_not_retried():
+    """File errors and other OSErrors should fail immediately."""
+    call_count = 0
+
+    @with_retry(max_attempts=3, min_wait=0, max_wait=0)
+    def missing_file():
+        nonlocal call_count
+        call_count += 1
+        raise FileNotFoundError("nope")
+
+    with pytest.raises(FileNotFoundError):
+        missing_file()
+    assert call_count == 1
+
+
+def test_anthropic_overloaded_is_retryable():
+    """529 Overloaded responses are transient even though they are not InternalServerErrors."""
+    anthropic = pytest.importorskip("anthropic")
+    if not hasattr(anthropic, "OverloadedError"):
+        pytest.skip("SDK has no OverloadedError")
+    response = MagicMock(status_code=529, headers={})
+    assert is_retryable(anthropic.OverloadedError("overloaded", response=response, body=None))
+
+
+def _status_error(headers: dict):
+    """An exception shaped like an SDK status error carrying response headers."""
+    error = ConnectionError("rate limited")
+    error.response = MagicMock(headers=headers)
+    return error
+
+
+def test_retry_after_header_parsing():
+    """Should read retry-after-ms and retry-after (seconds) headers."""
+    assert retry_after(_status_error({"retry-after-ms": "1500"})) == 1.5
+    assert retry_after(_status_error({"retry-after": "7"})) == 7.0
+    assert retry_after(_status_error({})) is None
+    assert retry_after(ValueError()) is None
+
+
+def test_backoff_prefers_retry_after_and_jitters_otherwise():
+    """Waits follow the server's Retry-After, else jittered exponential backoff within bounds."""
+    backoff = _Backoff(min_wait=1, max_wait=8)
+    state = MagicMock(attempt_number=2)
+
+    state.outcome.exception.return_value = _status_error({"retry-after": "3"})
+    assert 3.0 <= backoff(state) <= 3.3
+
+    state.outcome.exception.return_value = ConnectionError()
+    waits = {backoff(state) for _ in range(20)}
+    assert all(1 <= w <= 4 for w in waits)
+    assert len(waits) > 1
+
+
+def test_retry_after_above_cap_fails_without_retrying():
+    """A server asking for a longer wait than MAX_RETRY_AFTER should fail the call at once."""
+    call_count = 0
+
+    @with_retry(max_attempts=3, min_wait=0, max_wait=0)
+    def throttled():
+        nonlocal call_count
+        call_count += 1
+        raise _status_error({"retry-after": "600"})
+
+    with pytest.raises(ConnectionError):
+        throttled()
+    assert call_count == 1
+
+
+def test_service_circuit_opens_after_repeated_failures():
+    """A guarded service should fail fast once its circuit breaker opens."""
+    get_circuit_breaker("test-service").record_success()
+    call_count = 0
+
+    @with_retry(max_attempts=3, min_wait=0, max_wait=0, service="test-service")
+    def down():
+        nonlocal call_count
+        call_count += 1
+        raise ConnectionError("down")
+
+    with pytest.raises(ConnectionError):
+        down()
+    assert call_count == 3
+    # Failures 4 and 5 open the circuit; the third attempt fails fast without a call.
+    with pytest.raises(CircuitOpenError):
+        down()
+    assert call_count == 5
+    get_circuit_breaker("test-service").record_success()
@@ -0,0 +1,106 @@
+"""Tests for spans, stage summaries and trace export."""
+
+import json
+
+import pytest
+
+from llm_core import tracing
+from llm_core.tracing import Tracer
+
+
+@pytest.fixture
+def tracer():
+    tracer = Tracer()
+    tracer.enabled = True
+    return tracer
+
+
+def test_spans_nest_under_the_current_span(tracer):
+    """Should record the enclosing span as parent."""
+    with tracer.span("outer") as outer:
+        with tracer.span("inner") as inner:
+            pass
+
+    assert inner.parent_id == outer.span_id
+    assert outer.parent_id is None
+    assert [s.name for s in tracer.spans] == ["inner", "outer"]
+    assert outer.duration >= inner.duration >= 0
+
+
+def test_summary_aggregates_calls_and_counters(tracer):
+    """Should sum durations and numeric attributes per span name."""
+    for n in (2, 3):
+        with tracer.span("chunk", chars=10, kind="text") as s:
+            s.set(chunks=n)
+
+    (stage,) = tracer.summary()
+    assert stage.name == "chunk"
+    assert stage.calls == 2
+    assert stage.counters == {"chars": 20, "chunks": 5}
+
+
+def test_span_records_error_and_reraises(tracer):
+    """Should tag the span with the exception type."""
+    with pytest.raises(RuntimeError):
+        with tracer.span("generate"):
+            raise RuntimeError("boom")
+
+    assert tracer.spans[0].attributes["error"] == "RuntimeError"
+
+
+def test_module_span_is_noop_when_disabled():
+    """Should not record anything while the global tracer is disabled."""
+    global_tracer = tracing.get_tracer()
+    global_tracer.reset()
+
+    with tracing.span("embed", texts=3) as s:
+        s.set(tokens=10)
+        s.add("calls")
+
+    assert global_tracer.spans == []
+
+
+def test_export_json_and_otlp(tracer, tmp_path):
+    """Should write plain JSON and OTLP/JSON traces."""
+    with tracer.span("ask"):
+        with tracer.span("store.query", top_k=3, backend="chroma"):
+            pass
+
+    tracer.export(tmp_path / "trace.json")
+    data = json.loads((tmp_path / "trace.json").read_text())
+    assert [s["name"] for s in data["spans"]] == ["store.query", "ask"]
+
+    tracer.export(tmp_path / "trace.otlp.json", format="otlp")
+    otlp = json.loads((tmp_path / "trace.otlp.json").read_text())
+    spans = otlp["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    query = spans[0]
+    assert query["traceId"] == tracer.trace_id
+    assert query["parentSpanId"] == spans[1]["spanId"]
+    assert {"key": "top_k", "value": {"intValue": "3"}} in query["attributes"]
+    assert int(query["endTimeUnixNano"]) >= int(query["startTimeUnixNano"])
+
+
+def test_export_rejects_unknown_format(tracer, tmp_path):
+    """Should refuse formats other than json and otlp."""
+    with pytest.raises(ValueError, match="Unknown trace format"):
+        tracer.export(tmp_path / "trace", format="xml")
+
+
+def test_spans_of_other_threads_nest_under_the_caller(monkeypatch, tracer):
+    """Work handed to a pool or thread should record the caller's span as parent."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    monkeypatch.setattr(tracing, "_tracer", tracer)
+
+    def work(name):
+        with tracing.span(name):
+            pass
+
+    with tracing.span("outer") as outer, ThreadPoolExecutor(max_workers=1) as pool:
+        tracing.submit_in_context(pool, work, "pooled").result()
+        tracing.start_in_context(work, "threaded").join()
+
+    assert {s.name: s.parent_id for s in tracer.spans if s.name != "outer"} == {
+        "pooled": outer.span_id,
+        "threaded": outer.span_id,
+    }
@@ -0,0 +1,105 @@
+"""Tests for usage metering, cost estimates and the usage log."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from llm_core.usage import (
+    UsageMeter,
+    UsageRecord,
+    append_usage_log,
+    estimate_cost,
+    get_meter,
+    read_usage_log,
+    summarize_usage,
+)
+
+
+def test_estimate_cost_uses_longest_prefix():
+    """Dated model snapshots should resolve to their family's price."""
+    assert estimate_cost("anthropic", "claude-3-5-sonnet-20241022", 1_000_000, 1_000_000) == pytest.approx(18.0)
+    assert estimate_cost("openai", "text-embedding-3-small", 1_000_000, 0) == pytest.approx(0.02)
+
+
+def test_estimate_cost_prices_prompt_cache_tokens():
+    """Cache reads cost a tenth of the input price, writes a quarter more."""
+    cost = estimate_cost(
+        "anthropic", "claude-3-5-sonnet-latest", 0, 0, cache_read_tokens=1_000_000, cache_write_tokens=1_000_000
+    )
+    assert cost == pytest.approx(3.0 * 0.1 + 3.0 * 1.25)
+    record = UsageRecord("generate", "anthropic", "claude-3-5-sonnet-latest", 0, cache_read_tokens=1_000_000)
+    assert record.cost == pytest.approx(0.3)
+
+
+def test_estimate_cost_unknown_and_local():
+    """Unknown models have no price; local providers are free."""
+    assert estimate_cost("anthropic", "some-new-model", 100, 100) is None
+    assert estimate_cost("ollama", "llama3.2", 100, 100) == 0.0
+
+
+def test_meter_totals_group_by_kind_and_model():
+    """Should sum tokens, time and calls per (kind, provider, model)."""
+    meter = UsageMeter()
+    meter.record(UsageRecord("embed", "openai", "text-embedding-3-small", 100, seconds=0.5))
+    meter.record(UsageRecord("embed", "openai", "text-embedding-3-small", 50, seconds=0.25))
+    meter.record(UsageRecord("generate", "ollama", "llama3.2", 10, 5))
+
+    totals = meter.totals()
+
+    assert totals[0] == UsageRecord("embed", "openai", "text-embedding-3-small", 150, 0, 0.75, 2)
+    assert totals[1].kind == "generate"
+
+
+def test_usage_log_roundtrip_and_summary(tmp_path):
+    """Logged runs should be aggregated by model, command or a logged setting."""
+    log = tmp_path / "usage.jsonl"
+    append_usage_log(
+        log,
+        [UsageRecord("embed", "openai", "text-embedding-3-small", 1000)],
+        command="index",
+        details={"chunk_size": 500},
+        seconds=2.0,
+    )
+    append_usage_log(
+        log,
+        [
+            UsageRecord("embed", "openai", "text-embedding-3-small", 10),
+            UsageRecord("generate", "anthropic", "claude-3-5-sonnet-latest", 1000, 100),
+        ],
+        command="ask",
+        details={"top_k": 5},
+        seconds=1.0,
+    )
+    log.open("a").write("not json\n")
+
+    entries = read_usage_log(log)
+    assert len(entries) == 2
+    assert entries[1]["cost_usd"] == pytest.approx((1000 * 3 + 100 * 15 + 10 * 0.02) / 1_000_000)
+
+    by_model = {s.group: s for s in summarize_usage(entries, by="model")}
+    assert by_model["openai:text-embedding-3-small"].runs == 2
+    assert by_model["openai:text-embedding-3-small"].input_tokens == 1010
+
+    by_command = {s.group: s for s in summarize_usage(entries, by="command")}
+    assert by_command["ask"].calls == 2
+    assert by_command["index"].seconds == 2.0
+
+    by_top_k = [s.group for s in summarize_usage(entries, by="top_k")]
+    assert by_top_k == ["top_k=5", "top_k=?"]
+
+
+def test_openai_embedding_usage_is_metered():
+    """Embedding calls should record prompt tokens on the global meter."""
+    from llm_core.providers.openai import OpenAIEmbeddingProvider
+
+    mock_response = MagicMock()
+    mock_response.data = [MagicMock(embedding=[0.1, 0.2])]
+    mock_response.usage.prompt_tokens = 7
+    get_meter().reset()
+
+    with patch("llm_core.providers.openai.OpenAI") as MockClient:
+        MockClient.return_value.embeddings.create.return_value = mock_response
+        OpenAIEmbeddingProvider(api_key="test-key").embed(["Hello"])
+
+    (record,) = get_meter().records
+    assert (record.kind, record.provider, record.input_tokens) == ("embed", "openai", 7)
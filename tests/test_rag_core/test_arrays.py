@@ -0,0 +1,32 @@
+"""Tests for the embedding array helpers."""
+
+import numpy as np
+import pytest
+
+from rag_core.arrays import as_matrix, as_vector, cosine_similarity, normalize
+
+
+def test_as_matrix_accepts_lists_and_arrays():
+    """Nested lists and arrays should both become contiguous float32 matrices."""
+    from_list = as_matrix([[1, 2], [3, 4]])
+    assert from_list.dtype == np.float32
+    assert from_list.shape == (2, 2)
+
+    array = np.ones((3, 2), dtype=np.float32)
+    assert as_matrix(array) is array
+
+
+def test_as_matrix_edge_shapes():
+    """A single vector becomes one row, an empty input an empty matrix."""
+    assert as_matrix([1.0, 2.0]).shape == (1, 2)
+    assert as_matrix([]).shape == (0, 0)
+    with pytest.raises(ValueError):
+        as_matrix(np.zeros((2, 2, 2)))
+
+
+def test_normalize_and_cosine():
+    """Rows should be unit length and cosine similarity vectorized."""
+    matrix = np.array([[3.0, 4.0], [0.0, 0.0]], dtype=np.float32)
+    np.testing.assert_allclose(normalize(matrix), [[0.6, 0.8], [0.0, 0.0]])
+    sims = cosine_similarity(as_vector([1.0, 0.0]), np.array([[2.0, 0.0], [0.0, 5.0]]))
+    np.testing.assert_allclose(sims, [[1.0, 0.0]])
@@ -0,0 +1,70 @@
+"""Tests for length-bucketed embedding batches."""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from rag_core.embeddings.pipeline import PaddingStats, embed_by_length, length_buckets
+
+
+def _length_embedder():
+    """An embedder whose vector is [text length] so order is easy to check."""
+    embedder = MagicMock()
+    embedder.embed.side_effect = lambda texts: np.array([[len(t)] for t in texts], dtype=np.float32)
+    return embedder
+
+
+def test_length_buckets_group_similar_lengths():
+    """Batches should hold texts of neighbouring lengths, longest first."""
+    texts = ["a" * n for n in (5, 50, 1, 30, 10)]
+    assert length_buckets(texts, 2) == [[1, 3], [4, 0], [2]]
+
+
+def test_length_buckets_reject_bad_batch_size():
+    with pytest.raises(ValueError):
+        length_buckets(["a"], 0)
+
+
+def test_embed_by_length_restores_order():
+    """Embeddings must line up with the input texts despite the length sorting."""
+    texts = ["a" * n for n in (5, 50, 1, 30, 10)]
+    embedder = _length_embedder()
+
+    vectors = embed_by_length(embedder, texts, batch_size=2)
+
+    np.testing.assert_array_equal(vectors[:, 0], [5, 50, 1, 30, 10])
+    assert [len(c.args[0]) for c in embedder.embed.call_args_list] == [2, 2, 1]
+    assert embedder.embed.call_args_list[0].args[0] == ["a" * 50, "a" * 30]
+
+
+def test_embed_by_length_wraps_progress():
+    """The progress wrapper should see every batch."""
+    seen = []
+
+    def progress(batches):
+        for batch in batches:
+            seen.append(batch)
+            yield batch
+
+    embed_by_length(_length_embedder(), ["a", "bb", "ccc"], batch_size=2, progress=progress)
+
+    assert len(seen) == 2
+
+
+def test_embed_by_length_empty():
+    embedder = _length_embedder()
+    assert embed_by_length(embedder, []).shape == (0, 0)
+    embedder.embed.assert_not_called()
+
+
+def test_padding_stats():
+    """Mixing long chunks with short tails pads far more than bucketing."""
+    texts = ["a" * 100, "a" * 10, "a" * 100, "a" * 10]
+    stats = PaddingStats.for_texts(texts, batch_size=2)
+
+    assert stats.content == 220
+    assert stats.in_order == 400
+    assert stats.bucketed == 220
+    assert stats.saved == pytest.approx(0.45)
+    assert stats.speedup == pytest.approx(400 / 220)
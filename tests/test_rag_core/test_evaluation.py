@@ -0,0 +1,131 @@
+"""Tests for the evaluation helpers."""
+
+import time
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from rag_core.evaluation.ann import benchmark_profiles, benchmark_quantization, exact_search
+from rag_core.evaluation.metrics import percentile
+from rag_core.evaluation.retrieval import EvalQuestion, evaluate_retriever, load_questions, source_matches
+from rag_core.vectorstores.base import SearchResult
+from rag_core.vectorstores.profiles import get_profile
+
+
+def test_exact_search_orders_by_distance():
+    """Exact search should return the nearest rows first."""
+    embeddings = np.array([[0.0, 0.0], [1.0, 0.0], [5.0, 0.0]], dtype=np.float32)
+    queries = np.array([[4.0, 0.0]], dtype=np.float32)
+
+    assert exact_search(embeddings, queries, top_k=2).tolist() == [[2, 1]]
+
+
+def test_exact_search_cosine():
+    """Cosine search should ignore vector length."""
+    embeddings = np.array([[10.0, 0.0], [0.1, 0.1]], dtype=np.float32)
+    queries = np.array([[1.0, 1.0]], dtype=np.float32)
+
+    assert exact_search(embeddings, queries, top_k=1, space="cosine").tolist() == [[1]]
+
+
+def test_benchmark_profiles_reports_exact_baseline():
+    """The benchmark should report exact search first and a recall per profile."""
+    embeddings = np.random.default_rng(0).standard_normal((300, 8)).astype(np.float32)
+
+    results = benchmark_profiles(
+        embeddings, {"high-recall": get_profile("high-recall")}, num_queries=20, top_k=5
+    )
+
+    assert [r.name for r in results] == ["exact", "high-recall"]
+    assert results[0].recall == 1.0
+    assert results[1].recall > 0.9
+
+
+def test_percentile_empty():
+    """Percentile of no values should be zero rather than an error."""
+    assert percentile([], 95) == 0.0
+    assert percentile([1.0, 2.0, 3.0], 50) == 2.0
+
+
+def test_benchmark_quantization_reports_recall():
+    """Quantized storage with rescoring should stay close to exact recall."""
+    embeddings = np.random.default_rng(0).standard_normal((300, 8)).astype(np.float32)
+
+    results = benchmark_quantization(embeddings, ["int8", "float16"], num_queries=20, top_k=5)
+
+    assert [r.name for r in results] == ["exact", "int8+rescore", "float16+rescore"]
+    assert all(r.recall > 0.9 for r in results)
+
+
+def test_load_questions_accepts_source_or_sources(tmp_path):
+    """Should read single and multiple expected sources and skip blank lines."""
+    path = tmp_path / "questions.jsonl"
+    path.write_text(
+        '{"question": "q1", "source": "a.md"}\n\n{"question": "q2", "sources": ["b.md", "c.md"]}\n'
+    )
+
+    questions = load_questions(path)
+
+    assert questions == [
+        EvalQuestion(question="q1", expected_sources=("a.md",)),
+        EvalQuestion(question="q2", expected_sources=("b.md", "c.md")),
+    ]
+
+
+def test_load_questions_rejects_bad_lines(tmp_path):
+    """Should report the offending line."""
+    path = tmp_path / "questions.jsonl"
+    path.write_text('{"question": "q1", "source": "a.md"}\n{"text": "q2"}\n')
+
+    with pytest.raises(ValueError, match=":2:"):
+        load_questions(path)
+
+
+def test_source_matches_path_suffix():
+    """Expected sources may be full paths or trailing path components."""
+    assert source_matches("docs/guide.md", "guide.md")
+    assert source_matches("docs/guide.md", "./docs/guide.md")
+    assert not source_matches("docs/myguide.md", "guide.md")
+
+
+def test_evaluate_retriever_recall_and_mrr():
+    """Should average recall@k and reciprocal rank over questions, in batches."""
+
+    def result(source):
+        return SearchResult(id=source, document="", metadata={"source": source}, distance=0.0)
+
+    retriever = MagicMock()
+    retriever.retrieve_batch.side_effect = [
+        [[result("docs/a.md"), result("docs/b.md")], [result("docs/x.md"), result("docs/c.md")]],
+        [[result("docs/y.md"), result("docs/z.md")]],
+    ]
+    questions = [
+        EvalQuestion("q1", ("a.md",)),
+        EvalQuestion("q2", ("c.md", "d.md")),
+        EvalQuestion("q3", ("a.md",)),
+    ]
+
+    report = evaluate_retriever(retriever, questions, top_k=2, batch_size=2, name="test")
+
+    assert retriever.retrieve_batch.call_count == 2
+    retriever.retrieve_batch.assert_any_call(["q1", "q2"], top_k=2)
+    assert report.questions == 3
+    assert report.recall == pytest.approx((1 + 0.5 + 0) / 3)
+    assert report.mrr == pytest.approx((1 + 0.5 + 0) / 3)
+    assert report.p99_ms >= report.p50_ms >= 0
+    retriever.retrieve.assert_not_called()
+
+
+def test_evaluate_retriever_times_each_question():
+    """One slow question should show in the tail percentiles, not be averaged into its batch."""
+    retriever = MagicMock()
+    retriever.retrieve_batch.side_effect = lambda queries, top_k: [[] for _ in queries]
+    retriever.retrieve.side_effect = lambda query, top_k: time.sleep(0.2 if query == "slow" else 0) or []
+    questions = [EvalQuestion(q, ("a.md",)) for q in ["slow"] + [f"q{i}" for i in range(19)]]
+
+    report = evaluate_retriever(retriever, questions, batch_size=20, time_each=True)
+
+    assert retriever.retrieve.call_count == 20
+    assert report.p99_ms >= 150
+    assert report.p50_ms < 50
@@ -0,0 +1,44 @@
+"""Tests for MetadataFilter."""
+
+from rag_core.vectorstores.filters import MetadataFilter
+
+
+def test_empty_filter_matches_everything():
+    """A filter without conditions should be empty and match any metadata."""
+    where = MetadataFilter()
+    assert where.is_empty()
+    assert where.matches({"source": "a.txt"})
+
+
+def test_source_prefix_and_glob():
+    """Plain entries match files and directories, entries with wildcards as globs."""
+    where = MetadataFilter(sources=("docs/", "notes/*.md"))
+    assert where.matches({"source": "docs/a/b.txt"})
+    assert where.matches({"source": "notes/today.md"})
+    assert not where.matches({"source": "notes/today.txt"})
+    assert not where.matches({"source": "other/docs/a.txt"})
+
+
+def test_source_prefixes_match_whole_path_components():
+    """A plain entry names a file or a directory, not the start of a name."""
+    where = MetadataFilter(sources=("docs/api", "notes/a.md"))
+    assert where.matches({"source": "docs/api/v1.md"})
+    assert where.matches({"source": "notes/a.md"})
+    assert not where.matches({"source": "docs/api-old.md"})
+    assert not where.matches({"source": "notes/a.md.bak"})
+
+
+def test_extensions_are_normalized():
+    """Extensions should match regardless of case or leading dot."""
+    where = MetadataFilter(extensions=("MD", ".pdf"))
+    assert where.extensions == (".md", ".pdf")
+    assert where.matches({"source": "a.md", "extension": ".md"})
+    assert not where.matches({"source": "a.txt", "extension": ".txt"})
+
+
+def test_modified_after():
+    """Chunks without a modification time should not pass a date filter."""
+    where = MetadataFilter(modified_after=1000.0)
+    assert where.matches({"source": "a", "modified": 1500})
+    assert not where.matches({"source": "a", "modified": 500})
+    assert not where.matches({"source": "a"})
@@ -0,0 +1,106 @@
+"""Tests for prompt building and batch question answering."""
+
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from llm_core.providers.base import LLMResponse, prompt_text
+from rag_core.generation import (
+    SYSTEM_BLOCKS,
+    BatchQuestion,
+    answer_batch,
+    build_prompt,
+    build_prompt_blocks,
+    is_no_answer,
+    load_batch_questions,
+    order_for_reuse,
+)
+from rag_core.vectorstores.base import SearchResult
+
+
+def _result(source: str, distance: float = 0.5) -> SearchResult:
+    return SearchResult(
+        id=source, document=f"text of {source}", metadata={"source": source, "chunk_index": 0}, distance=distance
+    )
+
+
+def _retriever():
+    retriever = MagicMock()
+    retriever.retrieve_batch.side_effect = lambda queries, top_k, where: [
+        [] if q == "nothing" else [_result(f"{q}.md")] for q in queries
+    ]
+    return retriever
+
+
+def test_build_prompt_numbers_sources():
+    prompt = build_prompt("why?", [_result("a.md"), _result("b.md")])
+
+    assert "[Source 1: a.md]\ntext of a.md" in prompt
+    assert "[Source 2: b.md]" in prompt
+    assert prompt.endswith("Question: why?\n\nAnswer based ONLY on the context above.")
+    assert is_no_answer("I don't have enough information in the provided documents.")
+
+
+def test_prompt_blocks_put_cached_context_before_question():
+    results = order_for_reuse([_result("b.md", 0.1), _result("a.md", 0.9)])
+    blocks = build_prompt_blocks("why?", results)
+
+    assert [r.metadata["source"] for r in results] == ["a.md", "b.md"]
+    assert [block.cache for block in blocks] == [True, False]
+    assert blocks[0].text.startswith("Context:\n[Source 1: a.md]")
+    assert prompt_text(blocks) == build_prompt("why?", results)
+    assert SYSTEM_BLOCKS[0].cache
+
+
+def test_load_batch_questions(tmp_path: Path):
+    path = tmp_path / "q.jsonl"
+    path.write_text('{"question": "a", "id": 7}\n\n{"question": "b", "source": "x.md"}\n', encoding="utf-8")
+    assert load_batch_questions(path) == [BatchQuestion("a", "7"), BatchQuestion("b")]
+
+    path.write_text('{"id": 1}\n', encoding="utf-8")
+    with pytest.raises(ValueError, match=":1:"):
+        load_batch_questions(path)
+
+
+def test_answer_batch_keeps_order_and_reports_failures():
+    provider = MagicMock()
+
+    def generate(prompt, *, system):
+        if "q2" in prompt_text(prompt):
+            raise ConnectionError("service unavailable")
+        return LLMResponse(text="answer", model="m", input_tokens=10, output_tokens=2)
+
+    provider.generate.side_effect = generate
+    retriever = _retriever()
+    questions = [BatchQuestion(f"q{i}", id=str(i)) for i in range(5)] + [BatchQuestion("nothing")]
+
+    answers = list(answer_batch(questions, retriever, provider, concurrency=3, retrieval_batch_size=2))
+
+    assert [a.question for a in answers] == questions
+    assert retriever.retrieve_batch.call_count == 3
+    assert answers[0].to_dict()["sources"] == [{"source": "q0.md", "chunk_index": 0, "distance": 0.5}]
+    assert (answers[0].input_tokens, answers[0].output_tokens) == (10, 2)
+    assert answers[2].error == "Generation failed: service unavailable"
+    assert answers[5].error == "No relevant documents found"
+    assert sum(a.error is None for a in answers) == 4
+
+
+def test_answer_batch_generates_concurrently():
+    """All three generations must be in flight at once for the barrier to release."""
+    barrier = threading.Barrier(3, timeout=5)
+    provider = MagicMock()
+
+    def generate(prompt, *, system):
+        barrier.wait()
+        return LLMResponse(text="answer", model="m", input_tokens=1, output_tokens=1)
+
+    provider.generate.side_effect = generate
+    questions = [BatchQuestion(f"q{i}") for i in range(3)]
+
+    answers = list(answer_batch(questions, _retriever(), provider, concurrency=3))
+
+    assert [a.error for a in answers] == [None, None, None]
+    with pytest.raises(ValueError, match="concurrency"):
+        list(answer_batch(questions, _retriever(), provider, concurrency=0))
@@ -0,0 +1,93 @@
+"""Tests for collection generations (shadow rebuilds, swap and rollback)."""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from rag_core.vectorstores import ChromaStore, Generations
+
+
+def test_unknown_collection_is_served_by_its_own_name(tmp_path: Path):
+    generations = Generations(tmp_path / "generations.json")
+
+    assert generations.active("docs") == "docs"
+    assert generations.previous("docs") is None
+    assert not (tmp_path / "generations.json").exists()
+
+
+def test_promote_swaps_shadow_in_and_keeps_one_previous_generation(tmp_path: Path):
+    generations = Generations(tmp_path / "generations.json")
+
+    shadow, abandoned = generations.begin_shadow("docs")
+    assert (shadow, abandoned) == ("docs.g1", None)
+    assert generations.active("docs") == "docs"
+    assert generations.promote("docs", shadow) is None
+    assert (generations.active("docs"), generations.previous("docs")) == ("docs.g1", "docs")
+
+    shadow, _ = generations.begin_shadow("docs")
+    assert generations.promote("docs", shadow) == "docs"
+    assert (generations.active("docs"), generations.previous("docs")) == ("docs.g2", "docs.g1")
+
+
+def test_new_rebuild_abandons_unfinished_shadow(tmp_path: Path):
+    generations = Generations(tmp_path / "generations.json")
+    first, _ = generations.begin_shadow("docs")
+
+    second, abandoned = generations.begin_shadow("docs")
+
+    assert (second, abandoned) == ("docs.g2", first)
+    with pytest.raises(ValueError, match="not the collection being built"):
+        generations.promote("docs", first)
+
+
+def test_abandon_forgets_unfinished_rebuild(tmp_path: Path):
+    generations = Generations(tmp_path / "generations.json")
+    shadow, _ = generations.begin_shadow("docs")
+
+    assert generations.abandon("docs") == shadow
+    assert generations.building("docs") is None
+    assert generations.abandon("docs") is None
+    assert generations.begin_shadow("docs") == ("docs.g2", None)
+
+
+def test_concurrent_changes_are_not_lost(tmp_path: Path):
+    """Read-modify-write cycles from several writers should serialize on the lock file."""
+    path = tmp_path / "generations.json"
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        shadows = list(pool.map(lambda _: Generations(path).begin_shadow("docs")[0], range(40)))
+
+    assert len(set(shadows)) == 40
+    assert Generations(path).building("docs") == "docs.g40"
+
+
+def test_rollback_swaps_active_and_previous(tmp_path: Path):
+    generations = Generations(tmp_path / "generations.json")
+    with pytest.raises(ValueError, match="no previous generation"):
+        generations.rollback("docs")
+
+    shadow, _ = generations.begin_shadow("docs")
+    generations.promote("docs", shadow)
+
+    assert generations.rollback("docs") == "docs"
+    assert generations.previous("docs") == "docs.g1"
+    assert generations.rollback("docs") == "docs.g1"
+
+
+def test_logical_names_hide_shadows_and_old_generations(tmp_path: Path):
+    generations = Generations(tmp_path / "generations.json")
+    shadow, _ = generations.begin_shadow("docs")
+    generations.promote("docs", shadow)
+    generations.begin_shadow("docs")
+
+    assert generations.logical_names(["docs", "docs.g1", "docs.g2", "notes"]) == ["docs", "notes"]
+
+
+def test_drop_collection(tmp_path: Path):
+    ChromaStore(persist_dir=tmp_path, collection="docs.g1")
+
+    ChromaStore.drop_collection(tmp_path, "docs.g1")
+    ChromaStore.drop_collection(tmp_path, "missing")
+
+    assert ChromaStore.list_collections(tmp_path) == []
@@ -0,0 +1,157 @@
+"""Tests for chunking documents, incremental indexing and change detection."""
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from rag_core.chunking import RecursiveChunker
+from rag_core.indexing import Indexer, chunk_documents, chunk_id, coalesce_changes, watch_changes
+from rag_core.indexing.watch import ADDED, DELETED, MODIFIED
+from rag_core.loaders.documents import Document
+from rag_core.vectorstores.chroma import ChromaStore
+
+
+def _embedder():
+    embedder = MagicMock()
+    embedder.embed.side_effect = lambda texts: np.ones((len(texts), 4), dtype=np.float32)
+    return embedder
+
+
+def _sources(store) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    for batch in store.iter_records(include_embeddings=False):
+        for metadata in batch.metadatas:
+            counts[metadata["source"]] = counts.get(metadata["source"], 0) + 1
+    return counts
+
+
+def test_chunk_documents_assigns_ids_and_metadata():
+    docs = [Document(content="one two three four", source="docs/a.md", modified=12.7)]
+    chunks = chunk_documents(docs, RecursiveChunker(chunk_size=10, chunk_overlap=0))
+
+    assert chunks.chunks == ["one two", "three four"]
+    assert chunks.ids == [chunk_id("docs/a.md", 0), chunk_id("docs/a.md", 1)]
+    assert chunks.metadatas[1] == {"source": "docs/a.md", "chunk_index": 1, "extension": ".md", "modified": 12}
+    assert chunks.select([1]).chunks == [chunks.chunks[1]]
+
+
+def test_sync_replaces_updated_files_and_drops_removed(tmp_path: Path):
+    """A shrunk file should lose its stale chunks; removed files and directories disappear."""
+    docs = tmp_path / "docs"
+    (docs / "sub").mkdir(parents=True)
+    a, b, c = docs / "a.md", docs / "sub" / "b.md", docs / "c.txt"
+    a.write_text("alpha beta gamma delta", encoding="utf-8")
+    b.write_text("bravo", encoding="utf-8")
+    c.write_text("charlie", encoding="utf-8")
+    store = ChromaStore(persist_dir=tmp_path / "chroma")
+    indexer = Indexer(store, _embedder(), RecursiveChunker(chunk_size=11, chunk_overlap=0))
+
+    indexer.sync([a, b, c])
+    assert _sources(store) == {str(a): 2, str(b): 1, str(c): 1}
+
+    a.write_text("alpha", encoding="utf-8")
+    result = indexer.sync([a], removed=[docs / "sub", c])
+
+    assert _sources(store) == {str(a): 1}
+    assert (result.files_updated, result.files_removed) == (1, 2)
+    assert (result.chunks_added, result.chunks_removed) == (1, 4)
+
+
+def test_sync_drops_removed_directories_with_dotted_names(tmp_path: Path):
+    """A removed path is also a directory prefix, whatever its suffix looks like."""
+    docs = tmp_path / "docs"
+    (docs / "v1.2").mkdir(parents=True)
+    a, b = docs / "v1.2" / "a.md", docs / "v1.2.md"
+    a.write_text("alpha", encoding="utf-8")
+    b.write_text("bravo", encoding="utf-8")
+    store = ChromaStore(persist_dir=tmp_path / "chroma")
+    indexer = Indexer(store, _embedder(), RecursiveChunker(chunk_size=100, chunk_overlap=0))
+    indexer.sync([a, b])
+
+    result = indexer.sync([], removed=[docs / "v1.2"])
+
+    assert _sources(store) == {str(b): 1}
+    assert result.chunks_removed == 1
+
+
+def test_sync_keeps_unreadable_files_and_embeds_before_deleting(tmp_path: Path):
+    path = tmp_path / "a.md"
+    path.write_text("alpha", encoding="utf-8")
+    store = ChromaStore(persist_dir=tmp_path / "chroma")
+    embedder = _embedder()
+    indexer = Indexer(store, embedder, RecursiveChunker(chunk_size=100, chunk_overlap=0))
+    indexer.sync([path])
+
+    result = indexer.sync([tmp_path / "missing.md"])
+    assert result.skipped and result.skipped[0][0] == str(tmp_path / "missing.md")
+
+    path.write_text("alpha changed", encoding="utf-8")
+    embedder.embed.side_effect = ConnectionError("embedding service down")
+    with pytest.raises(ConnectionError):
+        indexer.sync([path])
+    assert store.count() == 1
+
+
+def test_coalesce_changes_classifies_by_current_state(tmp_path: Path):
+    """Bursts of events should collapse to one action per path, ignoring unsupported and ignored files."""
+    root = tmp_path / "root"
+    (root / "new").mkdir(parents=True)
+    (root / "a.md").write_text("a", encoding="utf-8")
+    (root / "new" / "b.txt").write_text("b", encoding="utf-8")
+    (root / "big.md").write_text("x" * 100, encoding="utf-8")
+    (root / "image.png").write_bytes(b"")
+    (root / ".git").mkdir()
+    (root / ".git" / "x.md").write_text("x", encoding="utf-8")
+
+    events = [
+        (ADDED, root / "a.md"),
+        (MODIFIED, root / "a.md"),
+        (ADDED, root / "new"),
+        (MODIFIED, root / "image.png"),
+        (MODIFIED, root / "big.md"),
+        (DELETED, root / "gone.md"),
+        (DELETED, root / "gone-dir"),
+        (DELETED, root / "gone.tmp"),
+        (MODIFIED, root / ".git" / "x.md"),
+        (MODIFIED, tmp_path / "outside.md"),
+    ]
+    changes = coalesce_changes(events, root, max_file_size=50)
+
+    assert set(changes.updated) == {root / "a.md", root / "new" / "b.txt"}
+    assert set(changes.removed) == {root / "big.md", root / "gone.md", root / "gone-dir", root / "gone.tmp"}
+
+
+def test_coalesce_changes_uses_root_spelling(tmp_path: Path, monkeypatch):
+    """Absolute event paths should map back to the relative root the index was built from."""
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "a.md").write_text("a", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+
+    changes = coalesce_changes([(MODIFIED, str(tmp_path / "docs" / "a.md"))], Path("docs"))
+
+    assert changes.updated == (Path("docs") / "a.md",)
+
+
+def test_polling_watch_reports_settled_changes(tmp_path: Path):
+    (tmp_path / "a.md").write_text("a", encoding="utf-8")
+    stop = threading.Event()
+    batches = []
+
+    def consume():
+        for changes in watch_changes(tmp_path, debounce=0.05, stop_event=stop, poll=True):
+            batches.append(changes)
+            stop.set()
+
+    thread = threading.Thread(target=consume)
+    thread.start()
+    time.sleep(0.2)
+    (tmp_path / "a.md").write_text("a changed", encoding="utf-8")
+    (tmp_path / "b.md").write_text("b", encoding="utf-8")
+    thread.join(timeout=5)
+    stop.set()
+
+    assert batches and set(batches[0].updated) == {tmp_path / "a.md", tmp_path / "b.md"}
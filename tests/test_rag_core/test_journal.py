@@ -0,0 +1,56 @@
+"""Tests for indexing run journals."""
+
+import json
+from pathlib import Path
+
+from rag_core.indexing import RunJournal
+from rag_core.indexing.journal import COMPLETED, FAILED, SUPERSEDED
+
+
+def _start(runs_dir: Path, collection: str = "docs") -> RunJournal:
+    return RunJournal.start(
+        runs_dir, command="index", path="docs", collection=collection, options={"chunk_size": 100, "fresh": True}
+    )
+
+
+def test_checkpoints_are_written_to_disk(tmp_path: Path):
+    journal = _start(tmp_path)
+    journal.update(total_chunks=250)
+    journal.checkpoint(100)
+    journal.checkpoint(100)
+
+    data = json.loads(journal.path.read_text(encoding="utf-8"))
+    assert data["options"] == {"chunk_size": 100, "fresh": True}
+    assert (data["total_chunks"], data["chunks_done"], data["batches_done"]) == (250, 200, 2)
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_find_unfinished_returns_latest_failed_or_running_run(tmp_path: Path):
+    done = _start(tmp_path)
+    done.finish()
+    assert RunJournal.find_unfinished(tmp_path) is None
+
+    older = _start(tmp_path)
+    newer = _start(tmp_path)
+    newer.fail("service unavailable")
+    other = _start(tmp_path, collection="other")
+
+    found = RunJournal.find_unfinished(tmp_path, collection="docs")
+    assert found.data["run_id"] == newer.data["run_id"]
+    assert (found.status, found.data["error"]) == (FAILED, "service unavailable")
+    assert RunJournal.find_unfinished(tmp_path).data["run_id"] == other.data["run_id"]
+
+    newer.supersede()
+    assert RunJournal.find_unfinished(tmp_path, collection="docs").data["run_id"] == older.data["run_id"]
+    assert RunJournal.load(newer.path).status == SUPERSEDED
+
+
+def test_finish_prunes_old_finished_journals(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr("rag_core.indexing.journal._KEEP_FINISHED", 2)
+    failed = _start(tmp_path)
+    failed.fail("boom")
+    for _ in range(4):
+        _start(tmp_path).finish()
+
+    remaining = RunJournal.list_runs(tmp_path)
+    assert [j.status for j in remaining] == [FAILED, COMPLETED, COMPLETED]
@@ -50,3 +50,13 @@ def test_skips_unsupported_files(tmp_path: Path):
     docs = load_documents(tmp_path)
     assert len(docs) == 1
     assert docs[0].source.endswith("note.txt")
+
+
+def test_skips_ignored_and_oversized_files(tmp_path: Path):
+    """Should honour ignore patterns and the size limit."""
+    (tmp_path / "keep.txt").write_text("Keep me", encoding="utf-8")
+    (tmp_path / "skip.txt").write_text("Skip me", encoding="utf-8")
+    (tmp_path / "big.txt").write_text("x" * 1000, encoding="utf-8")
+
+    docs = load_documents(tmp_path, ignore_patterns=["skip.txt"], max_file_size=100)
+    assert [d.content for d in docs] == ["Keep me"]
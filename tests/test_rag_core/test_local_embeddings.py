@@ -0,0 +1,60 @@
+"""Tests for LocalEmbedder."""
+
+import builtins
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from rag_core.embeddings.local import LocalEmbedder
+
+
+def _fake_model():
+    """A model whose embedding is [text length, batch size] so grouping is visible."""
+    model = MagicMock()
+    model.encode.side_effect = lambda texts, batch_size, convert_to_numpy: np.array(
+        [[len(t), len(texts)] for t in texts], dtype=np.float32
+    )
+    return model
+
+
+def test_embed_restores_input_order():
+    """Embeddings must line up with the input texts despite the length sorting."""
+    texts = ["a" * n for n in (5, 50, 1, 30, 10)]
+    embedder = LocalEmbedder("fake", batch_size=2, num_threads=3, model=_fake_model())
+
+    vectors = embedder.embed(texts)
+
+    assert vectors.dtype == np.float32
+    np.testing.assert_array_equal(vectors[:, 0], [5, 50, 1, 30, 10])
+    np.testing.assert_array_equal(vectors[:, 1], [2, 2, 1, 2, 2])
+
+
+def test_embed_batches_by_batch_size():
+    model = _fake_model()
+    embedder = LocalEmbedder("fake", batch_size=4, num_threads=1, model=model)
+
+    embedder.embed(["text"] * 10)
+
+    assert [len(call.args[0]) for call in model.encode.call_args_list] == [4, 4, 2]
+
+
+def test_embed_empty_input():
+    model = _fake_model()
+    assert LocalEmbedder("fake", model=model).embed([]).shape == (0, 0)
+    model.encode.assert_not_called()
+
+
+def test_missing_dependency_has_install_hint(monkeypatch):
+    """Without sentence-transformers installed, the error should say how to get it."""
+    real_import = builtins.__import__
+
+    def fake_import(name, *args, **kwargs):
+        if name == "sentence_transformers":
+            raise ImportError("No module named 'sentence_transformers'")
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "__import__", fake_import)
+
+    with pytest.raises(ImportError, match=r"rag-cli-tool\[local\]"):
+        LocalEmbedder("all-MiniLM-L6-v2")
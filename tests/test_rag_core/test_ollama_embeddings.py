@@ -2,6 +2,8 @@
 
 from unittest.mock import MagicMock
 
+import numpy as np
+
 from rag_core.embeddings.ollama import OllamaEmbedder
 
 
@@ -13,7 +15,8 @@ def test_embed_texts():
     embedder = OllamaEmbedder(provider=mock_provider)
     vectors = embedder.embed(["hello", "world"])
 
-    assert vectors == [[0.1, 0.2], [0.3, 0.4]]
+    np.testing.assert_allclose(vectors, [[0.1, 0.2], [0.3, 0.4]], rtol=1e-6)
+    assert vectors.dtype == np.float32
     mock_provider.embed.assert_called_once_with(["hello", "world"])
 
 
@@ -29,5 +32,6 @@ def test_embed_batches_large_input():
     texts = [f"text {i}" for i in range(150)]
     vectors = embedder.embed(texts)
 
-    assert len(vectors) == 150
+    assert vectors.shape == (150, 1)
+    assert vectors.flags["C_CONTIGUOUS"]
     assert mock_provider.embed.call_count == 2
@@ -0,0 +1,76 @@
+"""Tests for sharded, multi-process loading and chunking."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import rag_core
+from rag_core.chunking import RecursiveChunker
+from rag_core.indexing import chunk_files, partition, shard_of
+
+
+def _corpus(root: Path, n: int) -> list[Path]:
+    paths = []
+    for i in range(n):
+        path = root / f"doc{i}.md"
+        path.write_text(f"document {i} " * 20, encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def test_partition_is_deterministic_and_complete():
+    paths = [Path(f"docs/{i}.md") for i in range(100)]
+
+    shards = partition(paths, 4)
+
+    assert shards == partition(paths, 4)
+    assert sorted(p for shard in shards for p in shard) == sorted(paths)
+    assert all(shard_of(p, 4) == i for i, shard in enumerate(shards) for p in shard)
+    assert all(shards)
+    # Fixed digest, not hash(): the same file lands in the same shard in every process.
+    assert shard_of("docs/a.md", 1000) == shard_of(Path("docs/a.md"), 1000)
+    with pytest.raises(ValueError, match="at least 1"):
+        partition(paths, 0)
+
+
+def test_chunk_files_in_workers_matches_single_process(tmp_path: Path):
+    paths = _corpus(tmp_path, 12)
+    (tmp_path / "empty.md").write_text("  ", encoding="utf-8")
+    paths += [tmp_path / "empty.md", tmp_path / "missing.md"]
+    chunker = RecursiveChunker(chunk_size=60, chunk_overlap=0)
+
+    with pytest.warns(UserWarning, match="missing.md"):
+        single = chunk_files(paths, chunker)
+    with pytest.warns(UserWarning, match="missing.md"):
+        sharded = chunk_files(paths, chunker, workers=2)
+
+    assert single.documents == sharded.documents == 12
+    assert len(single.chunks) > 12
+    assert sorted(zip(single.chunks.ids, single.chunks.chunks)) == sorted(
+        zip(sharded.chunks.ids, sharded.chunks.chunks)
+    )
+    assert [s for s, _ in sharded.skipped] == [str(tmp_path / "missing.md")]
+
+
+def test_chunk_files_falls_back_when_workers_cannot_start(tmp_path: Path):
+    """A main module without a __main__ guard breaks the workers; loading continues in one process."""
+    _corpus(tmp_path, 6)
+    script = tmp_path / "unguarded.py"
+    script.write_text(
+        "from pathlib import Path\n"
+        "from rag_core.chunking import RecursiveChunker\n"
+        "from rag_core.indexing import chunk_files\n"
+        f"paths = sorted(Path({str(tmp_path)!r}).glob('*.md'))\n"
+        "print(chunk_files(paths, RecursiveChunker(chunk_size=60, chunk_overlap=0), workers=2).documents)\n",
+        encoding="utf-8",
+    )
+    env = {**os.environ, "PYTHONPATH": str(Path(rag_core.__file__).parents[1])}
+
+    result = subprocess.run([sys.executable, str(script)], capture_output=True, text=True, timeout=120, env=env)
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.splitlines()[-1] == "6"
+    assert "single process" in result.stderr
@@ -0,0 +1,49 @@
+"""Tests for index profiles."""
+
+from pathlib import Path
+
+import pytest
+
+from rag_core.vectorstores.chroma import ChromaStore
+from rag_core.vectorstores.profiles import INDEX_PROFILES, IndexProfile, get_profile
+
+
+def test_get_profile_with_space_override():
+    """Named profiles should be returned with the requested distance space."""
+    profile = get_profile("high-recall", space="cosine")
+    assert profile.space == "cosine"
+    assert profile.ef_search == INDEX_PROFILES["high-recall"].ef_search
+
+
+def test_unknown_profile_and_space():
+    """Unknown profile names and spaces should raise ValueError."""
+    with pytest.raises(ValueError, match="Unknown index profile"):
+        get_profile("turbo")
+    with pytest.raises(ValueError, match="Unknown distance space"):
+        IndexProfile(space="manhattan")
+
+
+def test_to_metadata():
+    """Profiles should map onto ChromaDB's hnsw metadata keys."""
+    assert IndexProfile(space="ip", ef_construction=10, ef_search=20, m=4).to_metadata() == {
+        "hnsw:space": "ip",
+        "hnsw:construction_ef": 10,
+        "hnsw:search_ef": 20,
+        "hnsw:M": 4,
+    }
+
+
+def test_store_uses_profile_space(tmp_path: Path):
+    """A collection created with a cosine profile should return cosine distances."""
+    store = ChromaStore(persist_dir=tmp_path / "chroma", profile=get_profile("fast", space="cosine"))
+    store.add(
+        ids=["same", "orthogonal"],
+        embeddings=[[2.0, 0.0], [0.0, 3.0]],
+        documents=["a", "b"],
+        metadatas=[{}, {}],
+    )
+
+    results = store.query([1.0, 0.0], top_k=2)
+    assert [r.id for r in results] == ["same", "orthogonal"]
+    assert results[0].distance == pytest.approx(0.0, abs=1e-5)
+    assert results[1].distance == pytest.approx(1.0, abs=1e-5)
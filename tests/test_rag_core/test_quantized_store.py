@@ -0,0 +1,156 @@
+"""Tests for QuantizedStore."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from rag_core.evaluation.ann import exact_search
+from rag_core.vectorstores.filters import MetadataFilter
+from rag_core.vectorstores.quantized import QuantizedStore
+
+
+@pytest.mark.parametrize("quantization", ["int8", "float16"])
+def test_add_and_query(tmp_path: Path, quantization: str):
+    """Should add documents and retrieve them by embedding similarity."""
+    store = QuantizedStore(persist_dir=tmp_path, quantization=quantization)
+    store.add(
+        ids=["doc1", "doc2"],
+        embeddings=[[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]],
+        documents=["First document", "Second document"],
+        metadatas=[{"source": "a.txt"}, {"source": "b.txt"}],
+    )
+
+    results = store.query(query_embedding=[1.0, 0.0, 0.0], top_k=1)
+    assert len(results) == 1
+    assert results[0].document == "First document"
+    assert results[0].metadata["source"] == "a.txt"
+    assert results[0].distance == pytest.approx(0.0, abs=1e-6)
+
+
+def test_upsert_and_persistence(tmp_path: Path):
+    """Re-adding an id should overwrite it, and data should survive reopening."""
+    store = QuantizedStore(persist_dir=tmp_path)
+    store.add(ids=["a", "b"], embeddings=[[1.0, 0.0], [0.0, 1.0]], documents=["a", "b"], metadatas=[{}, {}])
+    store.add(ids=["a"], embeddings=[[0.0, -1.0]], documents=["a2"], metadatas=[{"v": 2}])
+    store.set_settings({"embedding_model": "m"})
+    store.close()
+
+    reopened = QuantizedStore(persist_dir=tmp_path)
+    assert reopened.count() == 2
+    assert reopened.existing_ids() == {"a", "b"}
+    assert reopened.get_settings() == {"embedding_model": "m"}
+    top = reopened.query([0.0, -1.0], top_k=1)[0]
+    assert (top.id, top.document, top.metadata) == ("a", "a2", {"v": 2})
+
+
+def test_quantized_recall_matches_exact_search(tmp_path: Path):
+    """Rescoring should keep recall@10 close to exact search."""
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((2000, 32)).astype(np.float32)
+    queries = rng.standard_normal((20, 32)).astype(np.float32)
+    store = QuantizedStore(persist_dir=tmp_path, quantization="int8", space="cosine")
+    store.add([str(i) for i in range(len(vectors))], vectors, [""] * len(vectors), [{}] * len(vectors))
+
+    truth = exact_search(vectors, queries, top_k=10, space="cosine")
+    hits = sum(
+        len({int(r.id) for r in store.query(q, top_k=10)} & set(expected.tolist()))
+        for q, expected in zip(queries, truth)
+    )
+    assert hits / (len(queries) * 10) >= 0.95
+
+
+def test_query_with_metadata_filter(tmp_path: Path):
+    """Filters should restrict the candidate rows before scoring."""
+    store = QuantizedStore(persist_dir=tmp_path)
+    store.add(
+        ids=["a", "b", "c"],
+        embeddings=[[1.0, 0.0], [0.9, 0.1], [0.0, 1.0]],
+        documents=["doc a", "doc b", "doc c"],
+        metadatas=[
+            {"source": "docs/a.md", "extension": ".md", "modified": 100},
+            {"source": "notes/b.txt", "extension": ".txt", "modified": 200},
+            {"source": "docs/c.txt", "extension": ".txt", "modified": 300},
+        ],
+    )
+
+    assert {r.id for r in store.query([1.0, 0.0], top_k=3, where=MetadataFilter(sources=("docs/",)))} == {"a", "c"}
+    filtered = store.query([1.0, 0.0], top_k=3, where=MetadataFilter(extensions=(".txt",), modified_after=250))
+    assert [r.id for r in filtered] == ["c"]
+    assert store.query([1.0, 0.0], top_k=3, where=MetadataFilter(sources=("missing/",))) == []
+
+
+def test_reset_and_layout_mismatch(tmp_path: Path):
+    """reset() should clear data; reopening with another quantization should fail."""
+    store = QuantizedStore(persist_dir=tmp_path, quantization="int8")
+    store.add(ids=["x"], embeddings=[[0.1, 0.2]], documents=["x"], metadatas=[{}])
+    store.reset()
+    assert store.count() == 0
+    assert store.query([0.1, 0.2], top_k=1) == []
+    store.add(ids=["y"], embeddings=[[0.1, 0.2, 0.3]], documents=["y"], metadatas=[{}])
+    assert store.count() == 1
+
+    with pytest.raises(ValueError, match="was created with int8"):
+        QuantizedStore(persist_dir=tmp_path, quantization="float16")
+    assert QuantizedStore.list_collections(tmp_path) == ["rag_cli_docs"]
+
+    store.close()
+    QuantizedStore.drop_collection(tmp_path, "rag_cli_docs")
+    assert QuantizedStore.list_collections(tmp_path) == []
+
+
+def test_delete_sources_skips_deleted_rows(tmp_path: Path):
+    """Deleted chunks should disappear from search, including after reopening."""
+    store = QuantizedStore(persist_dir=tmp_path)
+    store.add(
+        ids=["a", "b", "c"],
+        embeddings=[[1.0, 0.0], [0.9, 0.1], [0.0, 1.0]],
+        documents=["a", "b", "c"],
+        metadatas=[{"source": "docs/a.md"}, {"source": "docs/sub/b.md"}, {"source": "c.md"}],
+    )
+
+    assert store.delete_sources(["docs/a.md", "docs/sub/"]) == 2
+    assert [r.id for r in store.query([1.0, 0.0], top_k=3)] == ["c"]
+    store.close()
+
+    reopened = QuantizedStore(persist_dir=tmp_path)
+    assert reopened.count() == 1
+    assert [r.id for r in reopened.query([1.0, 0.0], top_k=3)] == ["c"]
+
+
+def test_deleted_rows_are_reused(tmp_path: Path):
+    """Replacing a file's chunks should refill the freed rows instead of growing the row files."""
+    store = QuantizedStore(persist_dir=tmp_path)
+    vectors = np.eye(4, dtype=np.float32)
+    metadatas = [{"source": "a.md"}, {"source": "a.md"}, {"source": "b.md"}, {"source": "dir/c.md"}]
+    store.add(ids=["a0", "a1", "b0", "c0"], embeddings=vectors, documents=list("abcd"), metadatas=metadatas)
+    size = (tmp_path / "rag_cli_docs" / "vectors.bin").stat().st_size
+
+    for _ in range(3):
+        assert store.delete_sources(["a.md", "dir/"]) == 3
+        assert [r.id for r in store.query(vectors[0], top_k=4)] == ["b0"]
+        store.add(
+            ids=["a0", "a1", "c0"],
+            embeddings=vectors[[0, 1, 3]],
+            documents=list("abd"),
+            metadatas=[metadatas[i] for i in (0, 1, 3)],
+        )
+
+    assert (tmp_path / "rag_cli_docs" / "vectors.bin").stat().st_size == size
+    assert store.query(vectors[3], top_k=1)[0].id == "c0"
+    assert store.count() == 4
+
+
+def test_holes_of_older_collections_are_found(tmp_path: Path):
+    """Collections written before free rows were tracked should have their holes reused after reopening."""
+    store = QuantizedStore(persist_dir=tmp_path)
+    store.add(ids=["a", "b"], embeddings=np.eye(2), documents=["a", "b"], metadatas=[{}, {}])
+    with store._conn:
+        store._conn.execute("DELETE FROM records WHERE id = 'a'")
+        store._conn.execute("DROP TABLE free_rows")
+    store.close()
+
+    reopened = QuantizedStore(persist_dir=tmp_path)
+    assert [r.id for r in reopened.query([1.0, 0.0], top_k=2)] == ["b"]
+    reopened.add(ids=["c"], embeddings=[[1.0, 0.0]], documents=["c"], metadatas=[{}])
+    assert reopened._num_rows() == 2
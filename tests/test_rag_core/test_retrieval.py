@@ -2,6 +2,7 @@ from unittest.mock import MagicMock
 
 from rag_core.retrieval.similarity import SimilarityRetriever
 from rag_core.vectorstores.base import SearchResult
+from rag_core.vectorstores.filters import MetadataFilter
 
 
 def test_retrieve_returns_chunks():
@@ -21,4 +22,76 @@ def test_retrieve_returns_chunks():
     assert len(results) == 2
     assert results[0].document == "Hello world"
     mock_embedder.embed.assert_called_once_with(["test query"])
-    mock_store.query.assert_called_once_with(query_embedding=[0.1, 0.2, 0.3], top_k=2)
+    mock_store.query.assert_called_once_with(query_embedding=[0.1, 0.2, 0.3], top_k=2, where=None)
+
+
+def test_retrieve_merges_multiple_stores():
+    """With several stores, the query is embedded once and results merged by distance."""
+    mock_embedder = MagicMock()
+    mock_embedder.embed.return_value = [[0.1, 0.2]]
+
+    store_a = MagicMock()
+    store_a.query.return_value = [
+        SearchResult(id="a1", document="A1", metadata={}, distance=0.2),
+        SearchResult(id="a2", document="A2", metadata={}, distance=0.9),
+    ]
+    store_b = MagicMock()
+    store_b.query.return_value = [
+        SearchResult(id="b1", document="B1", metadata={}, distance=0.1),
+        SearchResult(id="b2", document="B2", metadata={}, distance=0.5),
+    ]
+
+    retriever = SimilarityRetriever(embedder=mock_embedder, store=[store_a, store_b])
+    results = retriever.retrieve("test query", top_k=3)
+
+    assert [r.id for r in results] == ["b1", "a1", "b2"]
+    mock_embedder.embed.assert_called_once_with(["test query"])
+
+
+def test_retrieve_passes_filter_to_store():
+    """The metadata filter should reach the store's query."""
+    mock_embedder = MagicMock()
+    mock_embedder.embed.return_value = [[0.1, 0.2]]
+    mock_store = MagicMock()
+    mock_store.query.return_value = []
+    where = MetadataFilter(extensions=(".md",))
+
+    retriever = SimilarityRetriever(embedder=mock_embedder, store=mock_store)
+    retriever.retrieve("test query", top_k=2, where=where)
+
+    mock_store.query.assert_called_once_with(query_embedding=[0.1, 0.2], top_k=2, where=where)
+
+
+def test_retrieve_batch_embeds_once_and_merges_per_query():
+    """Should embed all queries in one call and merge each query's store results."""
+    mock_embedder = MagicMock()
+    mock_embedder.embed.return_value = [[0.1, 0.2], [0.3, 0.4]]
+
+    store_a = MagicMock()
+    store_a.query_batch.return_value = [
+        [SearchResult(id="a1", document="A1", metadata={}, distance=0.3)],
+        [SearchResult(id="a2", document="A2", metadata={}, distance=0.1)],
+    ]
+    store_b = MagicMock()
+    store_b.query_batch.return_value = [
+        [SearchResult(id="b1", document="B1", metadata={}, distance=0.2)],
+        [SearchResult(id="b2", document="B2", metadata={}, distance=0.4)],
+    ]
+
+    retriever = SimilarityRetriever(embedder=mock_embedder, store=[store_a, store_b])
+    results = retriever.retrieve_batch(["q1", "q2"], top_k=1)
+
+    assert [[r.id for r in rs] for rs in results] == [["b1"], ["a2"]]
+    mock_embedder.embed.assert_called_once_with(["q1", "q2"])
+
+
+def test_retrieve_embedding_skips_the_embedder():
+    mock_embedder = MagicMock()
+    mock_store = MagicMock()
+    mock_store.query.return_value = []
+
+    retriever = SimilarityRetriever(embedder=mock_embedder, store=mock_store)
+    retriever.retrieve_embedding([0.1, 0.2], top_k=4)
+
+    mock_embedder.embed.assert_not_called()
+    mock_store.query.assert_called_once_with(query_embedding=[0.1, 0.2], top_k=4, where=None)
@@ -0,0 +1,101 @@
+"""Tests for scan_files()."""
+
+from pathlib import Path
+
+from rag_core.loaders.scanner import is_ignored_path, scan_files
+
+
+def _names(paths) -> list[str]:
+    return [p.name for p in paths]
+
+
+def test_filters_by_extension(tmp_path: Path):
+    """Only files with the requested extensions should be yielded."""
+    (tmp_path / "a.txt").write_text("a", encoding="utf-8")
+    (tmp_path / "b.csv").write_text("b", encoding="utf-8")
+
+    assert _names(scan_files(tmp_path, extensions={".txt"})) == ["a.txt"]
+
+
+def test_prunes_default_directories(tmp_path: Path):
+    """VCS, dependency, and rag-cli's own directories should be skipped."""
+    for name in (".git", "node_modules", ".rag-cli"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "x.txt").write_text("x", encoding="utf-8")
+    (tmp_path / "keep.txt").write_text("k", encoding="utf-8")
+
+    assert _names(scan_files(tmp_path)) == ["keep.txt"]
+
+
+def test_honours_ignore_files(tmp_path: Path):
+    """Patterns from .gitignore and .ragignore should apply, including in subdirectories."""
+    (tmp_path / ".gitignore").write_text("build/\n*.log.txt\n", encoding="utf-8")
+    (tmp_path / "build").mkdir()
+    (tmp_path / "build" / "out.txt").write_text("x", encoding="utf-8")
+    (tmp_path / "debug.log.txt").write_text("x", encoding="utf-8")
+    sub = tmp_path / "sub"
+    sub.mkdir()
+    (sub / ".ragignore").write_text("secret.md\n", encoding="utf-8")
+    (sub / "secret.md").write_text("x", encoding="utf-8")
+    (sub / "public.md").write_text("x", encoding="utf-8")
+    (tmp_path / "secret.md").write_text("x", encoding="utf-8")
+
+    found = sorted(p.relative_to(tmp_path).as_posix() for p in scan_files(tmp_path, extensions={".md", ".txt"}))
+    assert found == ["secret.md", "sub/public.md"]
+
+
+def test_negation_and_anchored_patterns(tmp_path: Path):
+    """'!' should re-include files and a leading '/' should anchor to the root."""
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "a.md").write_text("x", encoding="utf-8")
+    (tmp_path / "docs" / "keep.md").write_text("x", encoding="utf-8")
+    (tmp_path / "other").mkdir()
+    (tmp_path / "other" / "docs").mkdir()
+    (tmp_path / "other" / "docs" / "b.md").write_text("x", encoding="utf-8")
+
+    found = scan_files(tmp_path, ignore_patterns=["/docs/*.md", "!keep.md"])
+    assert sorted(p.relative_to(tmp_path).as_posix() for p in found) == ["docs/keep.md", "other/docs/b.md"]
+
+
+def test_double_star_pattern(tmp_path: Path):
+    """'**' should match across directory levels."""
+    deep = tmp_path / "a" / "b" / "drafts"
+    deep.mkdir(parents=True)
+    (deep / "x.txt").write_text("x", encoding="utf-8")
+    (tmp_path / "a" / "y.txt").write_text("y", encoding="utf-8")
+
+    assert _names(scan_files(tmp_path, ignore_patterns=["a/**/drafts/"])) == ["y.txt"]
+
+
+def test_max_file_size(tmp_path: Path):
+    """Files above the size limit should be skipped."""
+    (tmp_path / "small.txt").write_text("x" * 10, encoding="utf-8")
+    (tmp_path / "big.txt").write_text("x" * 1000, encoding="utf-8")
+
+    assert _names(scan_files(tmp_path, max_file_size=100)) == ["small.txt"]
+
+
+def test_yields_lazily_in_name_order(tmp_path: Path):
+    """Results should be a generator with deterministic ordering."""
+    for name in ("c.txt", "a.txt", "b.txt"):
+        (tmp_path / name).write_text("x", encoding="utf-8")
+
+    it = scan_files(tmp_path)
+    assert next(it).name == "a.txt"
+    assert _names(it) == ["b.txt", "c.txt"]
+
+
+def test_is_ignored_path_matches_scan(tmp_path: Path):
+    """Single-path checks should apply the same defaults and ignore files as the walk."""
+    (tmp_path / ".gitignore").write_text("build/\n", encoding="utf-8")
+    sub = tmp_path / "sub"
+    sub.mkdir()
+    (sub / ".ragignore").write_text("secret.md\n", encoding="utf-8")
+
+    assert is_ignored_path(tmp_path, tmp_path / "build" / "out.md")
+    assert is_ignored_path(tmp_path, sub / "secret.md")
+    assert is_ignored_path(tmp_path, tmp_path / ".git" / "HEAD")
+    assert is_ignored_path(tmp_path, tmp_path / "notes.tmp", ignore_patterns=["*.tmp"])
+    assert is_ignored_path(tmp_path, tmp_path.parent / "elsewhere.md")
+    assert not is_ignored_path(tmp_path, tmp_path / "secret.md")
+    assert not is_ignored_path(tmp_path, sub / "deleted-already.md")
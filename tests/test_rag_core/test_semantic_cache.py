@@ -0,0 +1,53 @@
+"""Tests for the semantic answer cache."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from rag_core.generation import SemanticCache, cache_scope
+
+_SOURCES = [{"source": "docs/reset.md", "chunk_index": 0}]
+
+
+def test_similar_question_hits_and_dissimilar_misses(tmp_path: Path):
+    cache = SemanticCache(tmp_path / "cache.sqlite", threshold=0.9)
+    cache.store("s", "how do I reset X", [1.0, 0.0, 0.0], "Hold the button.", _SOURCES)
+
+    hit = cache.lookup("s", np.array([0.95, 0.2, 0.0], dtype=np.float32))
+    assert (hit.question, hit.answer, hit.sources) == ("how do I reset X", "Hold the button.", _SOURCES)
+    assert 0.9 <= hit.similarity < 1
+
+    assert cache.lookup("s", [0.5, 0.8, 0.0]) is None
+    assert cache.lookup("other scope", [1.0, 0.0, 0.0]) is None
+    assert cache.lookup("s", [1.0, 0.0]) is None  # different embedding size
+
+
+def test_returns_closest_entry_and_persists(tmp_path: Path):
+    cache = SemanticCache(tmp_path / "cache.sqlite", threshold=0.5)
+    cache.store("s", "a", [1.0, 0.0], "answer a", [])
+    cache.store("s", "b", [0.0, 1.0], "answer b", [])
+    cache.close()
+
+    reopened = SemanticCache(tmp_path / "cache.sqlite", threshold=0.5)
+    assert reopened.lookup("s", [0.2, 0.9]).answer == "answer b"
+    assert reopened.clear() == 2
+    assert reopened.lookup("s", [0.2, 0.9]) is None
+
+
+def test_evicts_oldest_entries(tmp_path: Path):
+    cache = SemanticCache(tmp_path / "cache.sqlite", threshold=0.99, max_entries=2)
+    for i, vector in enumerate(([1.0, 0.0], [0.0, 1.0], [-1.0, 0.0])):
+        cache.store("s", f"q{i}", vector, f"answer {i}", [])
+
+    assert cache.lookup("s", [1.0, 0.0]) is None
+    assert cache.lookup("s", [-1.0, 0.0]).answer == "answer 2"
+
+
+def test_scope_and_threshold_validation(tmp_path: Path):
+    scope = cache_scope(collections=[("docs.g1", "abc")], top_k=3)
+    assert scope == cache_scope(top_k=3, collections=[("docs.g1", "abc")])
+    assert scope != cache_scope(collections=[("docs.g2", "abc")], top_k=3)
+    assert scope != cache_scope(collections=[("docs.g1", "def")], top_k=3)
+    with pytest.raises(ValueError, match="threshold"):
+        SemanticCache(tmp_path / "cache.sqlite", threshold=0)
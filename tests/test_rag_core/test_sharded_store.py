@@ -0,0 +1,78 @@
+"""Tests for the sharded vector store."""
+
+from pathlib import Path
+
+import numpy as np
+
+from rag_core.vectorstores import ChromaStore, MetadataFilter, ShardedStore, open_shards, shard_dir, shard_of
+
+
+def _records(n: int = 60, files: int = 12):
+    rng = np.random.default_rng(0)
+    ids = [f"c{i}" for i in range(n)]
+    metadatas = [{"source": f"docs/{i % files}.md", "chunk_index": i // files, "extension": ".md"} for i in range(n)]
+    return ids, rng.standard_normal((n, 8)).astype(np.float32), [f"text {i}" for i in ids], metadatas
+
+
+def _sharded(tmp_path: Path, shards: int = 3) -> ShardedStore:
+    return ShardedStore([ChromaStore(persist_dir=tmp_path, collection=f"docs.s{i}") for i in range(shards)])
+
+
+def test_add_routes_whole_files_to_one_shard(tmp_path: Path):
+    store = _sharded(tmp_path)
+    ids, vectors, documents, metadatas = _records()
+    store.add(ids=ids, embeddings=vectors, documents=documents, metadatas=metadatas)
+
+    assert store.count() == 60
+    assert store.existing_ids() == set(ids)
+    for i, shard in enumerate(store.shards):
+        sources = {m["source"] for batch in shard.iter_records(include_embeddings=False) for m in batch.metadatas}
+        assert sources and all(shard_of(s, 3) == i for s in sources)
+
+
+def test_open_shards_gives_each_shard_its_own_directory(tmp_path: Path):
+    """Every shard should live in its own persist directory, with its own client and database."""
+    def open_store(directory: Path, name: str) -> ChromaStore:
+        return ChromaStore(persist_dir=directory, collection=name)
+
+    store = open_shards(open_store, tmp_path, "docs", 3)
+    ids, vectors, documents, metadatas = _records()
+    store.add(ids=ids, embeddings=vectors, documents=documents, metadatas=metadatas)
+
+    assert ChromaStore.list_collections(tmp_path) == []
+    for i in range(3):
+        assert ChromaStore.list_collections(shard_dir(tmp_path, i)) == [f"docs.s{i}"]
+        assert (shard_dir(tmp_path, i) / "chroma.sqlite3").is_file()
+    assert len({id(shard._client) for shard in store.shards}) == 3
+    assert sum(ChromaStore(persist_dir=shard_dir(tmp_path, i), collection=f"docs.s{i}").count() for i in range(3)) == 60
+
+
+def test_queries_match_a_single_store(tmp_path: Path):
+    ids, vectors, documents, metadatas = _records()
+    single = ChromaStore(persist_dir=tmp_path / "single")
+    single.add(ids=ids, embeddings=vectors, documents=documents, metadatas=metadatas)
+    store = _sharded(tmp_path / "sharded")
+    store.add(ids=ids, embeddings=vectors, documents=documents, metadatas=metadatas)
+    queries = vectors[:5] + 0.01
+
+    assert [r.id for r in store.query(queries[0], top_k=5)] == [r.id for r in single.query(queries[0], top_k=5)]
+    batch = store.query_batch(queries, top_k=4)
+    assert [[r.id for r in rs] for rs in batch] == [[r.id for r in rs] for rs in single.query_batch(queries, top_k=4)]
+    filtered = store.query(queries[0], top_k=10, where=MetadataFilter(sources=("docs/3.md",)))
+    assert {r.metadata["source"] for r in filtered} == {"docs/3.md"}
+
+
+def test_delete_settings_and_reset_span_all_shards(tmp_path: Path):
+    store = _sharded(tmp_path)
+    ids, vectors, documents, metadatas = _records()
+    store.add(ids=ids, embeddings=vectors, documents=documents, metadatas=metadatas)
+
+    assert store.delete_sources(["docs/1.md", "docs/2.md"]) == 10
+    assert store.delete_sources(["docs/"]) == 50
+    store.set_settings({"chunk_size": 500})
+    assert all(shard.get_settings()["chunk_size"] == 500 for shard in store.shards)
+
+    store.add(ids=ids, embeddings=vectors, documents=documents, metadatas=metadatas)
+    store.reset()
+    assert store.count() == 0
+    store.close()
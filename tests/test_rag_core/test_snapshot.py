@@ -0,0 +1,76 @@
+"""Tests for collection snapshots."""
+
+import json
+import zipfile
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from rag_core.vectorstores import ChromaStore, QuantizedStore, export_snapshot, import_snapshot, read_manifest
+from rag_core.vectorstores.snapshot import iter_snapshot
+
+
+def _store(tmp_path: Path, n: int = 25) -> ChromaStore:
+    store = ChromaStore(persist_dir=tmp_path / "chroma", collection="docs")
+    rng = np.random.default_rng(1)
+    store.add(
+        ids=[f"c{i}" for i in range(n)],
+        embeddings=rng.standard_normal((n, 6)).astype(np.float32),
+        documents=[f"chunk {i} — ünïcode" for i in range(n)],
+        metadatas=[{"source": f"docs/{i % 4}.md", "chunk_index": i // 4} for i in range(n)],
+    )
+    store.set_settings({"embedding_model": "text-embedding-3-small", "chunk_size": 500, "space": "l2"})
+    return store
+
+
+def _records(store) -> dict[str, tuple]:
+    records = {}
+    for batch in store.iter_records():
+        for i, id_ in enumerate(batch.ids):
+            records[id_] = (batch.documents[i], batch.metadatas[i], batch.embeddings[i])
+    return records
+
+
+@pytest.mark.parametrize(("dtype", "atol"), [("float32", 0), ("float16", 1e-2)])
+def test_export_import_round_trip(tmp_path: Path, dtype: str, atol: float):
+    source = _store(tmp_path)
+    path = tmp_path / "docs.zip"
+
+    manifest = export_snapshot(source, path, dtype=dtype, collection="docs", batch_size=10)
+    assert (manifest.count, manifest.dim, manifest.dtype) == (25, 6, dtype)
+    assert read_manifest(path) == manifest
+
+    target = QuantizedStore(persist_dir=tmp_path / "quantized", collection="laptop")
+    import_snapshot(path, target, batch_size=7)
+
+    assert target.get_settings()["embedding_model"] == "text-embedding-3-small"
+    expected, actual = _records(source), _records(target)
+    assert expected.keys() == actual.keys()
+    for id_, (document, metadata, vector) in expected.items():
+        assert actual[id_][:2] == (document, metadata)
+        np.testing.assert_allclose(actual[id_][2], vector, atol=atol)
+
+
+def test_snapshot_layout(tmp_path: Path):
+    path = tmp_path / "docs.zip"
+    export_snapshot(_store(tmp_path), path, dtype="float16")
+
+    with zipfile.ZipFile(path) as zf:
+        assert zf.getinfo("vectors.npy").compress_type == zipfile.ZIP_STORED
+        assert zf.getinfo("documents.jsonl").compress_type == zipfile.ZIP_DEFLATED
+        with zf.open("vectors.npy") as f:
+            assert np.load(f).shape == (25, 6)
+    assert [len(b.ids) for b in iter_snapshot(path, batch_size=10)] == [10, 10, 5]
+    assert not [p for p in tmp_path.iterdir() if p.name.startswith("tmp")]
+
+
+def test_rejects_bad_dtype_and_unknown_format(tmp_path: Path):
+    with pytest.raises(ValueError, match="Unknown snapshot dtype"):
+        export_snapshot(_store(tmp_path), tmp_path / "x.zip", dtype="int8")
+
+    path = tmp_path / "future.zip"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("manifest.json", json.dumps({"format": 99, "count": 0, "dim": 0, "dtype": "float16"}))
+    with pytest.raises(ValueError, match="Unsupported snapshot format"):
+        read_manifest(path)
@@ -1,7 +1,10 @@
 # tests/test_rag_core/test_vectorstore.py
 from pathlib import Path
 
+import pytest
+
 from rag_core.vectorstores.chroma import ChromaStore
+from rag_core.vectorstores.filters import MetadataFilter
 
 
 def test_add_and_query(tmp_path: Path):
@@ -62,3 +65,161 @@ def test_persistence(tmp_path: Path):
     store2 = ChromaStore(persist_dir=persist_dir)
     assert store2.count() == 1
     assert "persistent" in store2.existing_ids()
+
+
+def test_collections_are_isolated(tmp_path: Path):
+    """Named collections in one persist dir should not see each other's data."""
+    persist_dir = tmp_path / "chroma"
+    docs = ChromaStore(persist_dir=persist_dir, collection="docs")
+    notes = ChromaStore(persist_dir=persist_dir, collection="notes")
+    docs.add(ids=["d"], embeddings=[[0.1, 0.2]], documents=["doc"], metadatas=[{}])
+    notes.add(ids=["n"], embeddings=[[0.3, 0.4]], documents=["note"], metadatas=[{}])
+
+    notes.reset()
+
+    assert docs.existing_ids() == {"d"}
+    assert notes.count() == 0
+    assert ChromaStore.list_collections(persist_dir) == ["docs", "notes"]
+
+
+def test_settings_roundtrip(tmp_path: Path):
+    """Recorded settings should persist and merge with earlier ones."""
+    persist_dir = tmp_path / "chroma"
+    store = ChromaStore(persist_dir=persist_dir, collection="docs")
+    assert store.get_settings() == {}
+
+    store.set_settings({"embedding_model": "ollama:nomic-embed-text", "chunk_size": 500})
+    store.set_settings({"chunk_overlap": 50})
+
+    reopened = ChromaStore(persist_dir=persist_dir, collection="docs")
+    assert reopened.get_settings() == {
+        "embedding_model": "ollama:nomic-embed-text",
+        "chunk_size": 500,
+        "chunk_overlap": 50,
+    }
+
+
+def test_invalid_collection_name(tmp_path: Path):
+    """Names Chroma would reject should raise a ValueError up front."""
+    with pytest.raises(ValueError, match="Invalid collection name"):
+        ChromaStore(persist_dir=tmp_path / "chroma", collection="a b")
+
+
+def test_query_with_metadata_filter(tmp_path: Path):
+    """Filters should restrict the search space before ranking."""
+    store = ChromaStore(persist_dir=tmp_path / "chroma")
+    store.add(
+        ids=["a", "b", "c"],
+        embeddings=[[1.0, 0.0], [0.9, 0.1], [0.0, 1.0]],
+        documents=["doc a", "doc b", "doc c"],
+        metadatas=[
+            {"source": "docs/a.md", "extension": ".md", "modified": 100},
+            {"source": "notes/b.txt", "extension": ".txt", "modified": 200},
+            {"source": "docs/c.txt", "extension": ".txt", "modified": 300},
+        ],
+    )
+    query = [1.0, 0.0]
+
+    by_source = store.query(query, top_k=3, where=MetadataFilter(sources=("docs/",)))
+    assert {r.id for r in by_source} == {"a", "c"}
+
+    by_glob = store.query(query, top_k=3, where=MetadataFilter(sources=("*.txt",)))
+    assert {r.id for r in by_glob} == {"b", "c"}
+
+    combined = store.query(query, top_k=3, where=MetadataFilter(extensions=(".txt",), modified_after=250))
+    assert [r.id for r in combined] == ["c"]
+
+    assert store.query(query, top_k=3, where=MetadataFilter(sources=("missing/",))) == []
+
+
+def test_source_filters_do_not_scan_the_collection(tmp_path: Path):
+    """File and directory filters should compile to native clauses on the dir fields."""
+    store = ChromaStore(persist_dir=tmp_path / "chroma")
+    store.add(
+        ids=["a", "b", "c", "d"],
+        embeddings=[[1.0, 0.0]] * 4,
+        documents=["a", "b", "c", "d"],
+        metadatas=[
+            {"source": "docs/api/a.md"},
+            {"source": "docs/api/v1/b.md"},
+            {"source": "docs/api-old.md"},
+            {"source": "notes/d.txt"},
+        ],
+    )
+    store._all_sources = None  # any full scan would fail
+
+    def ids(*sources):
+        return {r.id for r in store.query([1.0, 0.0], top_k=4, where=MetadataFilter(sources=sources))}
+
+    assert ids("docs/api/") == {"a", "b"}
+    assert ids("docs/api") == {"a", "b"}
+    assert ids("docs/api/v1/b.md", "notes") == {"b", "d"}
+    assert ids("docs/") == {"a", "b", "c"}
+    assert ids("missing/") == set()
+
+
+def test_dir_fields_stay_internal(tmp_path: Path):
+    """Queried and exported metadata should equal what was added."""
+    store = ChromaStore(persist_dir=tmp_path / "chroma")
+    metadata = {"source": "docs/api/a.md", "chunk_index": 0}
+    store.add(ids=["a"], embeddings=[[1.0, 0.0]], documents=["a"], metadatas=[metadata])
+
+    [result] = store.query([1.0, 0.0], top_k=1, where=MetadataFilter(sources=("docs/",)))
+    [batch] = store.iter_records()
+
+    assert result.metadata == metadata
+    assert batch.metadatas == [metadata]
+
+
+def test_source_filters_of_older_collections_are_resolved(tmp_path: Path):
+    """Collections filled before the dir fields existed still filter correctly."""
+    store = ChromaStore(persist_dir=tmp_path / "chroma")
+    store._collection.upsert(
+        ids=["a", "b"],
+        embeddings=[[1.0, 0.0]] * 2,
+        documents=["a", "b"],
+        metadatas=[{"source": "docs/a.md"}, {"source": "notes/b.md"}],
+    )
+    store.add(ids=["c"], embeddings=[[1.0, 0.0]], documents=["c"], metadatas=[{"source": "docs/c.md"}])
+
+    results = store.query([1.0, 0.0], top_k=3, where=MetadataFilter(sources=("docs/",)))
+
+    assert {r.id for r in results} == {"a", "c"}
+    assert store.delete_sources(["docs/"]) == 2
+
+
+def test_query_batch_returns_results_per_query(tmp_path: Path):
+    """Should search several query vectors in one call, keeping query order."""
+    store = ChromaStore(persist_dir=tmp_path / "chroma")
+    store.add(
+        ids=["x", "y"],
+        embeddings=[[1.0, 0.0], [0.0, 1.0]],
+        documents=["X", "Y"],
+        metadatas=[{"source": "x.txt"}, {"source": "y.txt"}],
+    )
+
+    results = store.query_batch([[0.0, 1.0], [1.0, 0.0]], top_k=1)
+
+    assert [[r.id for r in rs] for rs in results] == [["y"], ["x"]]
+
+
+def test_delete_sources(tmp_path: Path):
+    """Should delete the chunks of exact sources and of everything below a "dir/" source."""
+    store = ChromaStore(persist_dir=tmp_path / "chroma")
+    store.add(
+        ids=["a0", "a1", "b", "c", "d"],
+        embeddings=[[1.0, 0.0]] * 5,
+        documents=["a0", "a1", "b", "c", "d"],
+        metadatas=[
+            {"source": "docs/a.md"},
+            {"source": "docs/a.md"},
+            {"source": "docs/sub/b.md"},
+            {"source": "docs/sub/c.md"},
+            {"source": "docs/subway.md"},
+        ],
+    )
+
+    assert store.delete_sources(["docs/a.md"]) == 2
+    assert store.delete_sources(["docs/sub/"]) == 2
+    assert store.delete_sources(["missing.md"]) == 0
+    assert store.existing_ids() == {"d"}